@@ -0,0 +1,132 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import START, make_candle_rows, make_frame, make_prices
+
+from btcpriceticker.binance import Binance
+from btcpriceticker.bit2me import Bit2Me
+from btcpriceticker.bitvavo import Bitvavo
+from btcpriceticker.coinbase import Coinbase
+from btcpriceticker.coingecko import CoinGecko
+from btcpriceticker.coinpaprika import CoinPaprika
+from btcpriceticker.kraken import Kraken
+from btcpriceticker.mempool import Mempool
+
+pytestmark = pytest.mark.benchmark(group="backend_parsing")
+
+CCXT_BACKENDS = {
+    "kraken": Kraken,
+    "binance": Binance,
+    "coinbase": Coinbase,
+    "bitvavo": Bitvavo,
+}
+
+
+def _ccxt_service(name, rows):
+    exchange = MagicMock()
+    exchange.fetch_ohlcv.return_value = rows
+    with patch(f"btcpriceticker.{name}.ccxt.{name}", return_value=exchange):
+        return CCXT_BACKENDS[name]("USD", days_ago=1)
+
+
+@pytest.mark.parametrize("name", sorted(CCXT_BACKENDS))
+def bench_ccxt_get_ohlcv(benchmark, name, size):
+    service = _ccxt_service(name, make_candle_rows(size))
+    frame = benchmark(service.get_ohlcv, "USD")
+    assert len(frame) == size
+
+
+@pytest.mark.parametrize("name", sorted(CCXT_BACKENDS))
+def bench_ccxt_update_price_history(benchmark, name, size):
+    service = _ccxt_service(name, make_candle_rows(size))
+
+    def update():
+        service.reset_sync_cursors()
+        service.price_history.data = service.price_history.data.iloc[0:0]
+        service.update_price_history("USD")
+
+    benchmark(update)
+    assert len(service.price_history.data) == size
+
+
+def bench_coingecko_update_price_history(benchmark, size):
+    times = np.arange(START, START + size * 300, 300) * 1000
+    payload = {"prices": np.column_stack([times, make_prices(size)]).tolist()}
+    service = CoinGecko("usd")
+    service.cg = MagicMock()
+    service.cg.get_coin_market_chart_by_id.return_value = payload
+
+    def update():
+        service.reset_sync_cursors()
+        service.price_history.data = service.price_history.data.iloc[0:0]
+        service.update_price_history("usd")
+
+    benchmark(update)
+    assert len(service.price_history.data) == size
+
+
+def bench_coingecko_get_ohlcv(benchmark, size):
+    rows = [row[:5] for row in make_candle_rows(size)]
+    service = CoinGecko("usd", days_ago=size // 24 + 2)
+    service.cg = MagicMock()
+    service.cg.get_coin_ohlc_by_id.return_value = rows
+    benchmark(service.get_ohlcv, "usd")
+
+
+def _paprika_records(size):
+    close = make_prices(size)
+    start = pd.Timestamp(START, unit="s", tz="UTC")
+    stamps = pd.date_range(start, periods=size, freq="h").strftime("%Y-%m-%dT%H:%M:%SZ")
+    return [
+        {
+            "time_open": stamp,
+            "timestamp": stamp,
+            "open": value,
+            "high": value,
+            "low": value,
+            "close": value,
+            "price": value,
+            "volume": 1.0,
+        }
+        for stamp, value in zip(stamps, close)
+    ]
+
+
+def bench_coinpaprika_update_price_history(benchmark, size):
+    service = CoinPaprika("usd")
+    service.api_client = MagicMock()
+    service.api_client.historical.return_value = _paprika_records(size)
+
+    def update():
+        service.reset_sync_cursors()
+        service.price_history.data = service.price_history.data.iloc[0:0]
+        service.update_price_history("usd")
+
+    benchmark(update)
+    assert len(service.price_history.data) == size
+
+
+def bench_coinpaprika_get_ohlcv(benchmark, size):
+    service = CoinPaprika("usd", days_ago=size // 24 + 2)
+    service.api_client = MagicMock()
+    service.api_client.ohlcv.return_value = _paprika_records(size)
+    benchmark(service.get_ohlcv, "usd")
+
+
+def bench_bit2me_get_history_price(benchmark, size):
+    times = np.arange(START, START + size * 3600, 3600) * 1000
+    chart = np.column_stack(
+        [times, 1.0 / make_prices(size), np.full(size, 0.9)]
+    ).tolist()
+    with patch.object(Bit2Me, "_chart", return_value=chart):
+        service = Bit2Me("EUR")
+        history = benchmark(service.get_history_price, "EUR")
+    assert len(history) == size
+
+
+def bench_mempool_get_ohlcv(benchmark, size):
+    service = Mempool("usd")
+    service.price_history.append_dataframe(make_frame(size))
+    benchmark(service.get_ohlcv, "usd")
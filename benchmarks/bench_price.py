@@ -0,0 +1,81 @@
+import re
+
+import numpy as np
+import pytest
+import responses
+from conftest import START, make_prices
+
+from btcpriceticker.price import Price
+
+RateLimiter = None
+try:
+    from pymempool.rate_limiter import RateLimiter
+except ImportError:  # pragma: no cover
+    pass
+
+pytestmark = pytest.mark.benchmark(group="refresh")
+
+MEMPOOL_PRICES = {"time": START, "USD": 50000, "EUR": 46000, "GBP": 40000}
+
+
+def _unthrottled_mempool(price: Price) -> Price:
+    """Disable pymempool's own limiter and response cache for the measurement."""
+    client = price.services["mempool"].api_client
+    if RateLimiter is not None:
+        client.rate_limiter = RateLimiter(
+            rate_limit_per_sec=1e9, rate_limit_burst=10**9
+        )
+    client.enable_response_cache = False
+    return price
+
+
+@responses.activate
+def bench_refresh_mempool_quote(benchmark):
+    responses.get(
+        re.compile(r"https://mempool\.space/api/v1/prices.*"), json=MEMPOOL_PRICES
+    )
+    price = _unthrottled_mempool(
+        Price(fiat="eur", enable_timeseries=False, min_refresh_time=0)
+    )
+
+    assert benchmark(price.refresh)
+
+
+@responses.activate
+def bench_refresh_mempool_multi_fiat(benchmark):
+    responses.get(
+        re.compile(r"https://mempool\.space/api/v1/prices.*"), json=MEMPOOL_PRICES
+    )
+    price = _unthrottled_mempool(
+        Price(
+            fiat="eur",
+            fiats=["usd", "gbp"],
+            enable_timeseries=False,
+            min_refresh_time=0,
+        )
+    )
+
+    assert benchmark(price.refresh)
+
+
+@responses.activate
+def bench_refresh_coingecko_history(benchmark, size):
+    times = np.arange(START, START + size * 300, 300) * 1000
+    chart = {"prices": np.column_stack([times, make_prices(size)]).tolist()}
+    responses.get(
+        re.compile(r"https://api\.coingecko\.com/api/v3/coins/markets.*"),
+        json=[{"current_price": 50000}],
+    )
+    responses.get(
+        re.compile(r"https://api\.coingecko\.com/api/v3/coins/bitcoin/market_chart.*"),
+        json=chart,
+    )
+    price = Price(fiat="usd", service="coingecko", min_refresh_time=0)
+
+    def refresh():
+        service = price.services["coingecko"]
+        service.reset_sync_cursors()
+        service.price_history.data = service.price_history.data.iloc[0:0]
+        return price.refresh()
+
+    assert benchmark(refresh)
@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+
+import pytest
+from conftest import make_frame, make_series
+
+pytestmark = pytest.mark.benchmark(group="price_timeseries")
+
+
+def bench_add_price(benchmark, size):
+    series = make_series(size)
+    now = datetime.now(timezone.utc)
+    benchmark(series.add_price, now, 50000.0)
+
+
+def bench_append_dataframe(benchmark, size):
+    new_rows = make_frame(size, start=2_000_000_000)
+
+    def append():
+        series = make_series(size)
+        series.append_dataframe(new_rows)
+
+    benchmark(append)
+
+
+def bench_get_price_list(benchmark, size):
+    series = make_series(size)
+    benchmark(series.get_price_list)
+
+
+def bench_get_price_list_last_day(benchmark, size):
+    series = make_series(size)
+    benchmark(series.get_price_list, days=1)
+
+
+def bench_get_percentage_change(benchmark, size):
+    series = make_series(size)
+    benchmark(series.get_percentage_change, 1)
+
+
+def bench_resample_to_ohlcv(benchmark, size):
+    series = make_series(size)
+    benchmark(series.resample_to_ohlcv, "1h")
+
+
+def bench_get_indicators_after_add_price(benchmark, size):
+    series = make_series(size)
+    series.get_indicators()
+    now = datetime.now(timezone.utc)
+
+    def add_and_update():
+        series.add_price(now, 50000.0)
+        series.get_indicators()
+
+    benchmark(add_and_update)
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def bench_get_price_list_downsampled(benchmark, size, method):
+    series = make_series(size)
+
+    def downsample():
+        series.downsampled.entries.clear()
+        return series.get_price_list(max_points=250, method=method)
+
+    benchmark(downsample)
+
+
+def bench_get_price_array_cached(benchmark, size):
+    series = make_series(size)
+    series.get_price_array(max_points=250)
+    benchmark(series.get_price_array, max_points=250)
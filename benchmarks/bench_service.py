@@ -0,0 +1,65 @@
+from typing import Any, Optional
+
+import pandas as pd
+import pytest
+from conftest import make_candle_rows
+
+from btcpriceticker.decode import OHLCV_COLUMNS, rows_to_frame
+from btcpriceticker.service import Service
+
+pytestmark = pytest.mark.benchmark(group="service")
+
+
+class FrameService(Service):
+    """Service returning a prepared candle frame on every update."""
+
+    def __init__(self, candles: pd.DataFrame):
+        self.initialize("usd", enable_ohlcv=True)
+        self.name = "frame"
+        self.candles = candles
+
+    def get_current_price(self, currency) -> Optional[float]:
+        return 50000.0
+
+    def get_history_price(self, currency, existing_timestamp=None) -> Any:
+        return []
+
+    def update_price_history(self, currency) -> None:
+        pass
+
+    def get_ohlc(self, currency, existing_timestamp=None) -> pd.DataFrame:
+        return self.candles.drop(columns=["Volume"])
+
+    def get_ohlcv(self, currency, existing_timestamp=None) -> pd.DataFrame:
+        return self.candles
+
+
+def bench_update_ohlcv_merge(benchmark, size):
+    """Merge a batch overlapping the last tenth of ``size`` stored candles."""
+    rows = make_candle_rows(size + size // 10)
+    existing = rows_to_frame(rows[:size], OHLCV_COLUMNS)
+    service = FrameService(rows_to_frame(rows[size - size // 10 :], OHLCV_COLUMNS))
+
+    def merge():
+        service.ohlcv = existing
+        service.update_ohlcv("usd")
+
+    benchmark(merge)
+    assert len(service.ohlcv) == len(rows)
+
+
+@pytest.mark.parametrize("timeframe", ["4h", "1d", "1w"])
+def bench_ohlcv_timeframe_after_update(benchmark, size, timeframe):
+    """Re-aggregate a cached timeframe after the newest candle changed."""
+    rows = make_candle_rows(size)
+    candles = rows_to_frame(rows, OHLCV_COLUMNS)
+    service = FrameService(candles.iloc[-1:])
+    service.ohlcv = candles
+    service.get_ohlcv_timeframe(timeframe)
+
+    def switch():
+        service.update_ohlcv("usd")
+        return service.get_ohlcv_timeframe(timeframe)
+
+    frame = benchmark(switch)
+    assert frame["Volume"].sum() == candles["Volume"].sum()
@@ -0,0 +1,74 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from btcpriceticker import ratelimit
+from btcpriceticker.price_timeseries import PriceTimeSeries
+
+# Number of points per benchmark, override e.g. with BENCH_SIZES=1000 for a quick run
+SIZES = [
+    int(size)
+    for size in os.getenv("BENCH_SIZES", "1000,100000,1000000").split(",")
+    if size.strip()
+]
+START = 1_700_000_000
+# Runs are stored next to this file, wherever pytest is started from
+STORAGE = "file://" + os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".benchmarks"
+)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    if config.getoption("benchmark_storage") == "file://./.benchmarks":
+        config.option.benchmark_storage = STORAGE
+
+
+def pytest_generate_tests(metafunc):
+    if "size" in metafunc.fixturenames:
+        metafunc.parametrize("size", SIZES)
+
+
+def make_prices(size: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 50000 * np.exp(np.cumsum(rng.normal(0, 0.001, size)))
+
+
+def make_frame(size: int, start: int = START, step: int = 60) -> pd.DataFrame:
+    """Return a timestamp/price frame with one point per ``step`` seconds."""
+    timestamps = pd.to_datetime(
+        np.arange(start, start + size * step, step), unit="s", utc=True
+    )
+    return pd.DataFrame({"timestamp": timestamps, "price": make_prices(size)})
+
+
+def make_series(size: int) -> PriceTimeSeries:
+    series = PriceTimeSeries()
+    series.append_dataframe(make_frame(size))
+    return series
+
+
+def make_candle_rows(size: int, start: int = START, step: int = 3600) -> list:
+    """Return ccxt style [ms, open, high, low, close, volume] rows."""
+    close = make_prices(size)
+    times = np.arange(start, start + size * step, step) * 1000
+    return np.column_stack(
+        [times, close * 0.999, close * 1.001, close * 0.998, close, np.ones(size)]
+    ).tolist()
+
+
+@pytest.fixture(autouse=True)
+def unlimited_requests():
+    """Keep the per-host token buckets out of the measurements."""
+    ratelimit.reset_buckets()
+    original = dict(ratelimit.HOST_LIMITS)
+    original_default = ratelimit.DEFAULT_LIMIT
+    ratelimit.DEFAULT_LIMIT = (1e9, 10**9)
+    for host in ratelimit.HOST_LIMITS:
+        ratelimit.HOST_LIMITS[host] = (1e9, 10**9)
+    yield
+    ratelimit.HOST_LIMITS.update(original)
+    ratelimit.DEFAULT_LIMIT = original_default
+    ratelimit.reset_buckets()
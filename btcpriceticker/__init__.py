@@ -1,3 +1,4 @@
+from . import profiling  # noqa: F401 - times the package imports
 from .binance import Binance
 from .bit2me import Bit2Me
 from .bitvavo import Bitvavo
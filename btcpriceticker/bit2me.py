@@ -11,9 +11,11 @@ import time
 from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import requests
 
+from .decode import rows_to_frame, slice_after, to_price_frame
 from .service import Service
 
 logger = logging.getLogger(__name__)
@@ -36,8 +38,6 @@ class Bit2Me(Service):
         self.session = requests.Session()
         self.api_key = os.getenv("BIT2ME_API_KEY")
         self.api_secret = os.getenv("BIT2ME_API_SECRET")
-        self._fiat_rates: dict[str, float] = {}
-        self._fiat_rates_timestamp = 0.0
         self.initialize(
             fiat,
             interval=interval,
@@ -48,6 +48,9 @@ class Bit2Me(Service):
         )
         self.name = "bit2me"
 
+    def http_sessions(self) -> list[Any]:
+        return [self.session]
+
     def _build_headers(
         self, path_url: str, body: dict[str, Any] | None = None
     ) -> dict[str, str]:
@@ -160,11 +163,11 @@ class Bit2Me(Service):
                     continue
         return None
 
-    def _refresh_rates(self) -> None:
+    def fetch_fx_rates(self) -> dict[str, float] | None:
         try:
             payload = self._request("GET", "/v1/currency/rate", params={"type": "fiat"})
         except RuntimeError:
-            return
+            return None
 
         rates: dict[str, float] = {}
         if isinstance(payload, list):
@@ -179,11 +182,7 @@ class Bit2Me(Service):
                         rates[code.upper()] = float(value)
                     except (TypeError, ValueError):
                         continue
-
-        if rates:
-            rates["USD"] = 1.0
-            self._fiat_rates = rates
-            self._fiat_rates_timestamp = time.time()
+        return rates or None
 
     def _extract_rate(self, payload: Any, currency: str) -> float | None:
         if not isinstance(payload, list):
@@ -204,21 +203,7 @@ class Bit2Me(Service):
         return None
 
     def _get_fiat_rate(self, currency: str) -> float | None:
-        code = currency.upper()
-        if code == "USD":
-            return 1.0
-
-        now = time.time()
-        if not self._fiat_rates or (now - self._fiat_rates_timestamp) > 300:
-            self._refresh_rates()
-
-        rate = self._fiat_rates.get(code)
-        if rate is not None:
-            return rate
-
-        # Attempt one more refresh in case rates were missing
-        self._refresh_rates()
-        return self._fiat_rates.get(code)
+        return self.fx_rates.get_rate(currency)
 
     def _fetch_ohlc_point(
         self, timeframe: str, currency: str, target_dt: datetime
@@ -281,6 +266,19 @@ class Bit2Me(Service):
 
         return usd_price * rate
 
+    def get_current_prices(self, currencies: list[str]) -> dict[str, float | None]:
+        """Convert one USD ticker with the cached fiat rate table."""
+        codes = [currency.upper() for currency in currencies]
+        prices: dict[str, float | None] = dict.fromkeys(codes)
+        usd_price = self._get_usd_price()
+        if usd_price is None:
+            return prices
+        for code in codes:
+            rate = self._get_fiat_rate(code)
+            if rate is not None:
+                prices[code] = usd_price * rate
+        return prices
+
     def _chart(self, currency: str) -> list[list[Any]]:
         params = {"ticker": f"{self.base_asset}/{currency.upper()}"}
         temporality = self._map_chart_temporality()
@@ -300,36 +298,21 @@ class Bit2Me(Service):
         chart = self._chart(currency)
         if not chart:
             return []
-        last_ts = existing_timestamp[-1] if existing_timestamp else None
-        history: list[list[float]] = []
-        for entry in chart:
-            if not entry:
-                continue
-            try:
-                timestamp_ms = float(entry[0])
-                inverse_price = float(entry[1])
-                multiplier = float(entry[2])
-            except (TypeError, ValueError, IndexError):
-                continue
-
-            if inverse_price == 0:
-                continue
-
-            timestamp_sec = timestamp_ms / 1000
-            if last_ts and timestamp_sec <= last_ts:
-                continue
-
-            price_value = (1.0 / inverse_price) * multiplier
-            history.append([timestamp_ms, price_value])
-        return history
+        rows = rows_to_frame(chart, ["inverse", "multiplier"])
+        rows = rows[rows["inverse"] != 0]
+        if existing_timestamp:
+            rows = slice_after(rows, existing_timestamp[-1])
+        timestamps_ms = rows.index.asi8 / 1e6
+        prices = (1.0 / rows["inverse"].to_numpy()) * rows["multiplier"].to_numpy()
+        return np.column_stack([timestamps_ms, prices]).tolist()
 
     def update_price_history(self, currency: str) -> None:
         data = self.get_history_price(
-            currency, existing_timestamp=self.price_history.get_timestamp_list()
+            currency, existing_timestamp=self._get_cursor_timestamp_list("history")
         )
-        for timestamp_ms, price in data:
-            dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-            self.price_history.add_price(dt, price)
+        history = to_price_frame(rows_to_frame(data, ["price"]), "price")
+        # Rows with a missing inverse or multiplier decode to NaN prices
+        self.price_history.append_dataframe(history.dropna(subset=["price"]))
 
     def get_ohlcv(
         self, currency: str, existing_timestamp: list[float] | None = None
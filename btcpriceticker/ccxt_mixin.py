@@ -0,0 +1,99 @@
+import logging
+from typing import Any, Optional
+
+import pandas as pd
+
+from .decode import OHLCV_COLUMNS, candles_to_dataset, rows_to_frame
+
+logger = logging.getLogger(__name__)
+
+
+class CcxtMixin:
+    """Market lookups, bulk quotes and range fetches shared by ccxt backends.
+
+    Mixed in before ``Service``. The backend sets ``exchange`` to its ccxt
+    client, or None without ccxt, and ``backfill_page_size`` to the candles
+    returned by one OHLCV request of the exchange.
+    """
+
+    exchange: Optional[Any]
+    base_asset: str
+    interval: str
+    backfill_page_size: Optional[int]
+
+    def http_sessions(self) -> list[Any]:
+        session = getattr(self.exchange, "session", None)
+        return [session] if session is not None else []
+
+    def has_native_fiat(self, currency: str) -> bool:
+        """Check the market list, fiats without a pair are derived from USD."""
+        if self.exchange is None:
+            return True
+        try:
+            markets = self.exchange.load_markets()
+        except Exception as exc:  # pragma: no cover - network or API errors
+            logger.debug("Could not load markets: %s", exc)
+            return True
+        if not isinstance(markets, dict):
+            return True
+        return self._get_symbol(currency) in markets
+
+    def get_asset_prices(
+        self, assets: list[str], currencies: list[str]
+    ) -> dict[str, dict[str, float]]:
+        """Quote every listed asset/currency pair with one fetch_tickers call."""
+        if self.exchange is None:
+            return {}
+        pairs = {
+            f"{asset.upper()}/{currency.upper()}": (asset.upper(), currency.upper())
+            for asset in assets
+            for currency in currencies
+        }
+        try:
+            markets = self.exchange.load_markets()
+            if isinstance(markets, dict):
+                pairs = {
+                    symbol: pair for symbol, pair in pairs.items() if symbol in markets
+                }
+            tickers = self.exchange.fetch_tickers(list(pairs)) if pairs else {}
+        except Exception as exc:  # pragma: no cover - network or API errors
+            logger.exception("Failed to fetch tickers %s: %s", list(pairs), exc)
+            return {}
+        prices: dict[str, dict[str, float]] = {}
+        for symbol, (asset, currency) in pairs.items():
+            ticker = tickers.get(symbol) or {}
+            last_price = ticker.get("last") or ticker.get("close")
+            if last_price is not None:
+                prices.setdefault(asset, {})[currency] = float(last_price)
+        return prices
+
+    def _get_symbol(self, currency: str) -> str:
+        quote = currency.upper()
+        return f"{self.base_asset}/{quote}"
+
+    def interval_to_seconds(self) -> int:
+        unit_multipliers = {"m": 60, "h": 3600, "d": 86400}
+        try:
+            value, unit = int(self.interval[:-1]), self.interval[-1]
+            if unit not in unit_multipliers:
+                raise ValueError
+            return value * unit_multipliers[unit]
+        except (ValueError, IndexError) as exc:  # pragma: no cover
+            raise ValueError(f"Invalid interval format {self.interval}") from exc
+
+    def fetch_range(
+        self, dataset: str, currency: str, start: float, end: float
+    ) -> Optional[pd.DataFrame]:
+        if self.exchange is None:
+            return None
+        step = self.interval_to_seconds()
+        limit = int((end - start) // step) + 1
+        if self.backfill_page_size:
+            limit = min(limit, self.backfill_page_size)
+        ohlcv_data = self.exchange.fetch_ohlcv(
+            self._get_symbol(currency),
+            timeframe=self.interval,
+            since=int(start * 1000),
+            limit=limit,
+        )
+        return candles_to_dataset(rows_to_frame(ohlcv_data, OHLCV_COLUMNS), dataset)
@@ -1,10 +1,17 @@
+import json
 import logging
-from typing import TypedDict
+import time
+from datetime import datetime, timezone
+from typing import Optional, TypedDict
 
 import typer
 from rich.console import Console
 
 from btcpriceticker.price import Price
+from btcpriceticker.profiling import CommandProfile
+from btcpriceticker.replay import Fault, Recorder, Replayer
+from btcpriceticker.server import PriceServer
+from btcpriceticker.shared_cache import SharedQuoteCache
 
 log = logging.getLogger(__name__)
 app = typer.Typer()
@@ -18,6 +25,40 @@ class State(TypedDict):
 
 state: State = {"verbose": 3, "service": "mempool"}
 
+SHARED_CACHE_HELP = (
+    "SQLite file shared by all processes on this host to reuse fresh quotes."
+)
+
+
+FORMAT_HELP = "Output format: table, csv, jsonl, parquet or arrow."
+OUTPUT_HELP = "Write to this file instead of stdout."
+STATS_HELP = "Print request, latency and cache statistics to stderr as JSON."
+
+
+def _shared_cache_kwargs(path: Optional[str]) -> dict:
+    return {"shared_cache": SharedQuoteCache(path)} if path else {}
+
+
+def _render(p: Price, dataset: str, fmt: str, output: Optional[str]) -> None:
+    """Print the repr of a dataset or stream it in a machine readable format."""
+    if fmt == "table":
+        frames = {"history": p.timeseries.data, "ohlc": p.ohlc, "ohlcv": p.ohlcv}
+        if output is None:
+            print(frames[dataset])
+        else:
+            with open(output, "w") as handle:
+                handle.write(f"{frames[dataset]}\n")
+        return
+    try:
+        p.export(dataset, fmt, output)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--format") from exc
+
+
+def _print_stats(p: Price, enabled: bool) -> None:
+    if enabled:
+        typer.echo(json.dumps(p.stats(), indent=2), err=True)
+
 
 @app.command(help="Show the latest BTC price converted into the given fiat symbol.")
 def price(
@@ -26,6 +67,8 @@ def price(
         False, help="Displays the fiat currency symbol alongside the price."
     ),
     as_float: bool = typer.Option(False, help="Returns the price as float."),
+    shared_cache: Optional[str] = typer.Option(None, help=SHARED_CACHE_HELP),
+    stats: bool = typer.Option(False, "--stats", help=STATS_HELP),
 ):
     p = Price(
         service=state["service"],
@@ -33,6 +76,7 @@ def price(
         enable_ohlc=False,
         enable_timeseries=False,
         enable_ohlcv=False,
+        **_shared_cache_kwargs(shared_cache),
     )
     p.refresh()
     if not as_float and show_symbol:
@@ -45,6 +89,7 @@ def price(
     else:
         price = p.get_fiat_price()
         print(price)
+    _print_stats(p, stats)
 
 
 @app.command(help="Display historical BTC prices for the requested interval.")
@@ -54,6 +99,9 @@ def history(
     days_ago: int = typer.Option(
         1, help="Number of days of data to pull counting back from now."
     ),
+    fmt: str = typer.Option("table", "--format", help=FORMAT_HELP),
+    output: Optional[str] = typer.Option(None, help=OUTPUT_HELP),
+    stats: bool = typer.Option(False, "--stats", help=STATS_HELP),
 ):
     p = Price(
         service=state["service"],
@@ -65,7 +113,8 @@ def history(
         enable_ohlcv=False,
     )
     p.refresh()
-    print(p.timeseries.data)
+    _render(p, "history", fmt, output)
+    _print_stats(p, stats)
 
 
 @app.command(help="Retrieve OHLC candles converted into the requested fiat.")
@@ -75,6 +124,9 @@ def ohlc(
     days_ago: int = typer.Option(
         1, help="Number of past days to cover when fetching candles."
     ),
+    fmt: str = typer.Option("table", "--format", help=FORMAT_HELP),
+    output: Optional[str] = typer.Option(None, help=OUTPUT_HELP),
+    stats: bool = typer.Option(False, "--stats", help=STATS_HELP),
 ):
     p = Price(
         service=state["service"],
@@ -86,7 +138,8 @@ def ohlc(
         enable_ohlcv=False,
     )
     p.refresh()
-    print(p.ohlc)
+    _render(p, "ohlc", fmt, output)
+    _print_stats(p, stats)
 
 
 @app.command(help="Retrieve OHLCV candles (with synthetic volume) for BTC.")
@@ -96,6 +149,9 @@ def ohlcv(
     days_ago: int = typer.Option(
         1, help="Number of past days to cover when fetching candles."
     ),
+    fmt: str = typer.Option("table", "--format", help=FORMAT_HELP),
+    output: Optional[str] = typer.Option(None, help=OUTPUT_HELP),
+    stats: bool = typer.Option(False, "--stats", help=STATS_HELP),
 ):
     p = Price(
         service=state["service"],
@@ -107,11 +163,105 @@ def ohlcv(
         enable_ohlcv=True,
     )
     p.refresh()
-    print(p.ohlcv)
+    _render(p, "ohlcv", fmt, output)
+    _print_stats(p, stats)
+
+
+@app.command(help="Keep one price feed alive and print a line for every refresh.")
+def watch(
+    symbol: str = typer.Argument(..., help="Fiat currency code, e.g. 'EUR'."),
+    every: Optional[float] = typer.Option(
+        None,
+        help="Seconds between refreshes, never below --min-refresh-time.",
+    ),
+    min_refresh_time: int = typer.Option(
+        120, help="Minimum number of seconds between two upstream fetches."
+    ),
+    as_json: bool = typer.Option(
+        False, "--json", help="Emit one JSON object per line."
+    ),
+    count: int = typer.Option(0, help="Stop after this many updates, 0 runs forever."),
+    shared_cache: Optional[str] = typer.Option(None, help=SHARED_CACHE_HELP),
+    stats: bool = typer.Option(False, "--stats", help=STATS_HELP),
+):
+    p = Price(
+        service=state["service"],
+        fiat=symbol,
+        min_refresh_time=min_refresh_time,
+        enable_ohlc=False,
+        enable_timeseries=False,
+        enable_ohlcv=False,
+        **_shared_cache_kwargs(shared_cache),
+    )
+    delay = max(every or 0, min_refresh_time)
+    emitted = 0
+    try:
+        while True:
+            started = time.time()
+            if p.refresh():
+                snapshot = p.get_snapshot()
+                if as_json:
+                    print(json.dumps(snapshot), flush=True)
+                else:
+                    updated = datetime.fromtimestamp(
+                        snapshot["timestamp"], tz=timezone.utc
+                    )
+                    print(
+                        f"{updated.isoformat(timespec='seconds')} "
+                        f"{p.get_price_now()} {snapshot['fiat']}",
+                        flush=True,
+                    )
+                emitted += 1
+            else:
+                log.warning("Refreshing the price failed, retrying later")
+            if count and emitted >= count:
+                break
+            time.sleep(max(started + delay - time.time(), 0))
+    except KeyboardInterrupt:
+        pass
+    _print_stats(p, stats)
+
+
+@app.command(help="Serve cached quotes and candles to local consumers over HTTP.")
+def serve(
+    symbol: str = typer.Argument(..., help="Fiat currency code, e.g. 'EUR'."),
+    host: str = typer.Option("127.0.0.1", help="Address to listen on."),
+    port: int = typer.Option(8787, help="TCP port to listen on."),
+    unix_socket: Optional[str] = typer.Option(
+        None, help="Listen on this Unix domain socket path instead of TCP."
+    ),
+    interval: str = typer.Option("1h", help="Candle interval, e.g. '1h'."),
+    days_ago: int = typer.Option(
+        1, help="Number of past days to keep for history and candles."
+    ),
+    min_refresh_time: int = typer.Option(
+        120, help="Minimum number of seconds between two upstream fetches."
+    ),
+    enable_ohlc: bool = typer.Option(False, "--ohlc", help="Also serve OHLC."),
+    enable_ohlcv: bool = typer.Option(False, "--ohlcv", help="Also serve OHLCV."),
+):
+    p = Price(
+        service=state["service"],
+        fiat=symbol,
+        days_ago=days_ago,
+        interval=interval,
+        min_refresh_time=min_refresh_time,
+        enable_ohlc=enable_ohlc,
+        enable_timeseries=True,
+        enable_ohlcv=enable_ohlcv,
+    )
+    server = PriceServer(p)
+    server.bind(host=host, port=port, unix_socket=unix_socket)
+    print(f"Serving on {unix_socket or f'http://{host}:{port}'}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
 
 
 @app.callback()
 def main(
+    ctx: typer.Context,
     verbose: int = typer.Option(
         3,
         help="Verbosity level: 0=critical, 1=error, 2=warn, 3=info, 4=debug.",
@@ -120,8 +270,43 @@ def main(
         "mempool",
         help="Service backend to use, e.g. 'bit2me', 'binance', or 'mempool'.",
     ),
+    record: Optional[str] = typer.Option(
+        None, help="Record every upstream HTTP exchange to this cassette file."
+    ),
+    replay: Optional[str] = typer.Option(
+        None, help="Answer upstream HTTP requests from this cassette file."
+    ),
+    replay_latency: float = typer.Option(
+        0.0, help="Seconds of latency added to each replayed response."
+    ),
+    replay_error_rate: float = typer.Option(
+        0.0, help="Fraction of replayed requests answered with a 503 error."
+    ),
+    profile: Optional[str] = typer.Option(
+        None,
+        help="Profile the command, write a pstats dump to this file and print "
+        "a summary to stderr.",
+    ),
+    profile_top: int = typer.Option(
+        20, help="Number of functions listed in the profile summary."
+    ),
 ):
     """BTC price utilities for multiple exchange backends."""
+    if record and replay:
+        raise typer.BadParameter("--record and --replay are mutually exclusive")
+    harness = None
+    if record:
+        harness = Recorder(record)
+    elif replay:
+        fault = Fault(latency=replay_latency, error_rate=replay_error_rate)
+        harness = Replayer(replay, fault=fault)
+    if harness is not None:
+        harness.start()
+        ctx.call_on_close(harness.stop)
+    if profile:
+        profiler = CommandProfile(profile, top=profile_top)
+        profiler.start()
+        ctx.call_on_close(lambda: typer.echo(profiler.stop(), err=True))
     # Logging
     state["verbose"] = verbose
     state["service"] = service
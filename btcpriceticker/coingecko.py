@@ -1,14 +1,76 @@
 import logging
+import os
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional, Union
 
 import pandas as pd
 from pycoingecko import CoinGeckoAPI
 
+from .decode import (
+    OHLC_COLUMNS,
+    coerce_candles,
+    rows_to_frame,
+    slice_after,
+    slice_last_days,
+    to_price_frame,
+)
+from .pyramid import AGGREGATIONS
 from .service import Service
 
 logger = logging.getLogger(__name__)
 
+# Day buckets accepted by the free /coins/{id}/ohlc endpoint
+OHLC_DAY_BUCKETS = [1, 7, 14, 30, 90, 180, 365]
+# The candle size depends on the bucket: 30 minutes, 4 hours or 4 days
+OHLC_TIERS = [(2, 1800), (30, 4 * 3600)]
+OHLC_MAX_CANDLE_SECONDS = 4 * 86400
+# CoinGecko coin ids of the supported base assets
+COINGECKO_IDS = {
+    "BTC": "bitcoin",
+    "ETH": "ethereum",
+    "SOL": "solana",
+    "XRP": "ripple",
+    "ADA": "cardano",
+    "DOGE": "dogecoin",
+    "LTC": "litecoin",
+    "DOT": "polkadot",
+    "BNB": "binancecoin",
+    "AVAX": "avalanche-2",
+    "LINK": "chainlink",
+    "TRX": "tron",
+    "BCH": "bitcoin-cash",
+    "XLM": "stellar",
+}
+
+
+def ohlc_candle_seconds(bucket: Union[int, str]) -> int:
+    """Return the candle size CoinGecko uses for a day ``bucket``."""
+    if bucket == "max":
+        return OHLC_MAX_CANDLE_SECONDS
+    return next(
+        (seconds for days, seconds in OHLC_TIERS if bucket <= days),
+        OHLC_MAX_CANDLE_SECONDS,
+    )
+
+
+def resample_after(
+    candles: pd.DataFrame, seconds: int, timestamp: float
+) -> pd.DataFrame:
+    """Aggregate ``candles`` into buckets of ``seconds`` that follow ``timestamp``.
+
+    CoinGecko labels candles with their close time, so the buckets end at
+    ``timestamp + k * seconds`` and are labelled with that end.
+    """
+    if candles.empty:
+        return candles
+    buckets = candles.resample(
+        pd.Timedelta(seconds=seconds),
+        origin=pd.Timestamp(timestamp, unit="s", tz="UTC"),
+        closed="right",
+        label="right",
+    ).agg({column: AGGREGATIONS[column] for column in candles.columns})
+    return coerce_candles(buckets[buckets["Open"].notna()])
+
 
 class CoinGecko(Service):
     def __init__(
@@ -19,9 +81,12 @@ class CoinGecko(Service):
         enable_ohlc=True,
         enable_timeseries=True,
         enable_ohlcv=True,
+        base_asset="BTC",
     ):
-        self.cg = CoinGeckoAPI()
+        self.api_key = os.getenv("COINGECKO_API_KEY", "")
+        self.cg = CoinGeckoAPI(api_key=self.api_key)
         self.whichcoin = whichcoin
+        self.base_asset = base_asset.upper()
         self.initialize(
             fiat,
             days_ago=days_ago,
@@ -31,6 +96,9 @@ class CoinGecko(Service):
         )
         self.name = "coingecko"
 
+    def http_sessions(self) -> list[Any]:
+        return [self.cg.session]
+
     def get_current_price(self, currency) -> Optional[float]:
         """Fetch the current price for the given currency from CoinGecko."""
         normalized_currency = currency.lower()
@@ -44,6 +112,62 @@ class CoinGecko(Service):
             logger.error(f"Failed to retrieve price for {self.whichcoin} in {currency}")
             return None
 
+    def get_current_prices(self, currencies: list[str]) -> dict[str, Optional[float]]:
+        """Fetch all currencies with a single /simple/price request."""
+        vs_currencies = ",".join(currency.lower() for currency in currencies)
+        try:
+            quotes = self.cg.get_price(ids=self.whichcoin, vs_currencies=vs_currencies)
+            quotes = quotes[self.whichcoin]
+        except (KeyError, ValueError) as e:
+            logger.error(f"Failed to retrieve prices for {self.whichcoin}: {e}")
+            return {}
+        prices: dict[str, Optional[float]] = {}
+        for currency in currencies:
+            value = quotes.get(currency.lower())
+            prices[currency.upper()] = float(value) if value is not None else None
+        return prices
+
+    def get_asset_prices(
+        self, assets: list[str], currencies: list[str]
+    ) -> dict[str, dict[str, float]]:
+        """Quote all assets with a single /simple/price request."""
+        ids = {
+            COINGECKO_IDS[a.upper()]: a.upper()
+            for a in assets
+            if a.upper() in COINGECKO_IDS
+        }
+        if not ids:
+            return {}
+        try:
+            quotes = self.cg.get_price(
+                ids=",".join(ids),
+                vs_currencies=",".join(currency.lower() for currency in currencies),
+            )
+        except (KeyError, ValueError) as e:
+            logger.error(f"Failed to retrieve prices for {', '.join(ids)}: {e}")
+            return {}
+        prices: dict[str, dict[str, float]] = {}
+        for coin_id, asset in ids.items():
+            entry = quotes.get(coin_id, {})
+            prices[asset] = {
+                currency.upper(): float(entry[currency.lower()])
+                for currency in currencies
+                if entry.get(currency.lower()) is not None
+            }
+        return prices
+
+    def fetch_fx_rates(self) -> Optional[dict[str, float]]:
+        """Derive fiat rates from the BTC based /exchange_rates table."""
+        rates = self.cg.get_exchange_rates().get("rates", {})
+        usd = rates.get("usd", {}).get("value")
+        if not usd:
+            return None
+        return {
+            code.upper(): float(entry["value"]) / usd
+            for code, entry in rates.items()
+            if entry.get("type") == "fiat" and entry.get("value")
+        }
+
     def get_exchange_usd_price(self, exchange):
         """Fetch the USD price for the given exchange."""
         try:
@@ -85,46 +209,75 @@ class CoinGecko(Service):
     def update_price_history(self, currency) -> None:
         """Fetch historical prices from CoinGecko."""
         logger.info(f"Getting historical data for {self.days_ago} days")
-        existing_timestamp = self.price_history.get_timestamp_list()
+        existing_timestamp = self._get_cursor_timestamp_list("history")
         raw_data = self.get_history_price(
             currency, existing_timestamp=existing_timestamp
         )
-        timeseries = raw_data.get("prices", [])
-        for price in timeseries:
-            dt = datetime.fromtimestamp(float(price[0]) / 1000, tz=timezone.utc)
-            self.price_history.add_price(dt, float(price[1]))
+        prices = rows_to_frame(raw_data.get("prices", []), ["price"])
+        self.price_history.append_dataframe(to_price_frame(prices, "price"))
 
-    def get_ohlcv(self, currency, existing_timestamp=None) -> pd.DataFrame:
-        """Fetch OHLCV data based on the number of days ago."""
-        normalized_currency = currency.lower()
-        time_ranges = [1, 7, 14, 30, 90, 180, 365]
-        duration = next((d for d in time_ranges if self.days_ago <= d), "max")
-        raw_ohlc = self.cg.get_coin_ohlc_by_id(
-            self.whichcoin, normalized_currency, duration
+    def _ohlc_bucket(self, existing_timestamp=None) -> Union[int, str]:
+        """Return the smallest day bucket that still covers the missing range.
+
+        Only buckets with the candle size of the ``days_ago`` bucket are used,
+        so incremental candles match the stored ones.
+        """
+        full = next((d for d in OHLC_DAY_BUCKETS if self.days_ago <= d), "max")
+        if not existing_timestamp:
+            return full
+        now = datetime.now(timezone.utc).timestamp()
+        gap_days = max(now - existing_timestamp[-1], 0) / 86400
+        candle_seconds = ohlc_candle_seconds(full)
+        return next(
+            (
+                d
+                for d in OHLC_DAY_BUCKETS
+                if gap_days <= d and ohlc_candle_seconds(d) == candle_seconds
+            ),
+            full,
         )
 
-        timeseries = [
-            {
-                "time": datetime.fromtimestamp(ohlc[0] / 1000, tz=timezone.utc),
-                "ohlcv": ohlc[1:] + [0],
-            }
-            for ohlc in raw_ohlc
-            if (
-                datetime.fromtimestamp(raw_ohlc[-1][0] / 1000, tz=timezone.utc)
-                - datetime.fromtimestamp(ohlc[0] / 1000, tz=timezone.utc)
-            ).days
-            <= self.days_ago
-        ]
-
-        df = pd.DataFrame(
-            [ohlcv["ohlcv"] for ohlcv in timeseries],
-            columns=["Open", "High", "Low", "Close", "Volume"],
+    def _fetch_ohlc(self, currency, existing_timestamp=None) -> pd.DataFrame:
+        candle_seconds = ohlc_candle_seconds(self._ohlc_bucket())
+        if self.api_key and existing_timestamp and candle_seconds > 3600:
+            # The pro API offers a range endpoint, ask only for the missing tail
+            # in hourly or daily candles and aggregate them to the stored size
+            now = datetime.now(timezone.utc).timestamp()
+            gap_days = (now - existing_timestamp[-1]) / 86400
+            if gap_days <= 31:
+                interval = "hourly"
+            elif candle_seconds % 86400 == 0:
+                interval = "daily"
+            else:
+                interval = None
+            if interval:
+                raw_ohlc = self.cg.get_coin_ohlc_by_id_range(
+                    self.whichcoin,
+                    currency,
+                    from_timestamp=int(existing_timestamp[-1]) + 1,
+                    to_timestamp=int(now),
+                    interval=interval,
+                )
+                return resample_after(
+                    rows_to_frame(raw_ohlc, OHLC_COLUMNS),
+                    candle_seconds,
+                    existing_timestamp[-1],
+                )
+        raw_ohlc = self.cg.get_coin_ohlc_by_id(
+            self.whichcoin, currency, self._ohlc_bucket(existing_timestamp)
         )
-        df.index = [ohlcv["time"] for ohlcv in timeseries]
+        return rows_to_frame(raw_ohlc, OHLC_COLUMNS)
+
+    def get_ohlcv(self, currency, existing_timestamp=None) -> pd.DataFrame:
+        """Fetch OHLCV data, only requesting the range after existing_timestamp."""
+        normalized_currency = currency.lower()
+        ohlc = self._fetch_ohlc(normalized_currency, existing_timestamp)
+
+        df = slice_last_days(ohlc, self.days_ago)
+        df = df.assign(Volume=0.0)
 
         if existing_timestamp:
-            cutoff = datetime.fromtimestamp(existing_timestamp[-1], tz=timezone.utc)
-            df = df[df.index > cutoff]
+            df = slice_after(df, existing_timestamp[-1])
 
         return df
 
@@ -1,13 +1,46 @@
 import logging
+import math
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
 import pandas as pd
 
+from .decode import (
+    candles_to_dataset,
+    records_to_frame,
+    slice_after,
+    slice_last_days,
+    to_price_frame,
+)
 from .service import Service
 
 logger = logging.getLogger(__name__)
 
+# The public ohlcv/historical endpoint returns daily candles
+OHLCV_CANDLE_SECONDS = 86400
+OHLCV_MAX_LIMIT = 366
+# Hourly prices returned by one /tickers/{coin_id}/historical request
+HISTORY_MAX_LIMIT = 1000
+# Quotes accepted by one /tickers/{coin_id} request
+TICKER_MAX_QUOTES = 3
+# CoinPaprika coin ids of the supported base assets
+COINPAPRIKA_IDS = {
+    "BTC": "btc-bitcoin",
+    "ETH": "eth-ethereum",
+    "SOL": "sol-solana",
+    "XRP": "xrp-xrp",
+    "ADA": "ada-cardano",
+    "DOGE": "doge-dogecoin",
+    "LTC": "ltc-litecoin",
+    "DOT": "dot-polkadot",
+    "BNB": "bnb-binance-coin",
+    "AVAX": "avax-avalanche",
+    "LINK": "link-chainlink",
+    "TRX": "trx-tron",
+    "BCH": "bch-bitcoin-cash",
+    "XLM": "xlm-stellar",
+}
+
 COINPAPRIKA_MODULE = None
 try:
     from coinpaprika import client as Coinpaprika
@@ -27,11 +60,13 @@ class CoinPaprika(Service):
         enable_ohlc=False,
         enable_timeseries=True,
         enable_ohlcv=False,
+        base_asset="BTC",
     ):
         self.api_client: Optional[Any] = (
             Coinpaprika.Client() if COINPAPRIKA_MODULE else None
         )
         self.whichcoin = whichcoin
+        self.base_asset = base_asset.upper()
         interval = "1h"
         self.initialize(
             fiat,
@@ -71,6 +106,18 @@ class CoinPaprika(Service):
         except (ValueError, IndexError) as e:
             raise ValueError(f"Invalid interval format {self.interval}") from e
 
+    def get_slot_seconds(self, dataset: str) -> Optional[int]:
+        if dataset == "history":
+            return self.interval_to_seconds()
+        return OHLCV_CANDLE_SECONDS
+
+    def get_backfill_page_size(self, dataset: str) -> Optional[int]:
+        return HISTORY_MAX_LIMIT if dataset == "history" else OHLCV_MAX_LIMIT
+
+    def http_sessions(self) -> list[Any]:
+        session = getattr(self.api_client, "session", None)
+        return [session] if session is not None else []
+
     def get_current_price(self, currency: str = "USD") -> Optional[float]:
         """Fetch the current price from Coinpaprika."""
         if not self.api_client:
@@ -82,6 +129,55 @@ class CoinPaprika(Service):
             logger.exception(f"Failed to fetch current price: {e}")
             return None
 
+    def get_current_prices(self, currencies: list[str]) -> dict[str, Optional[float]]:
+        """Fetch the currencies in batches of the allowed number of quotes."""
+        if not self.api_client:
+            return {}
+        codes = [currency.upper() for currency in currencies]
+        prices: dict[str, Optional[float]] = dict.fromkeys(codes)
+        for start in range(0, len(codes), TICKER_MAX_QUOTES):
+            batch = codes[start : start + TICKER_MAX_QUOTES]
+            try:
+                ticker = self.api_client.ticker(self.whichcoin, quotes=",".join(batch))
+            except Exception as e:
+                logger.exception(f"Failed to fetch current prices: {e}")
+                continue
+            for code in batch:
+                quote = ticker.get("quotes", {}).get(code)
+                if quote is not None and quote.get("price") is not None:
+                    prices[code] = float(quote["price"])
+        return prices
+
+    def get_asset_prices(
+        self, assets: list[str], currencies: list[str]
+    ) -> dict[str, dict[str, float]]:
+        """Read all assets from one /tickers response of every coin."""
+        ids = {
+            COINPAPRIKA_IDS[a.upper()]: a.upper()
+            for a in assets
+            if a.upper() in COINPAPRIKA_IDS
+        }
+        if not self.api_client or not ids:
+            return {}
+        codes = [currency.upper() for currency in currencies][:TICKER_MAX_QUOTES]
+        try:
+            tickers = self.api_client.tickers(quotes=",".join(codes))
+        except Exception as e:
+            logger.exception(f"Failed to fetch tickers: {e}")
+            return {}
+        prices: dict[str, dict[str, float]] = {}
+        for ticker in tickers:
+            asset = ids.get(ticker.get("id"))
+            if asset is None:
+                continue
+            quotes = ticker.get("quotes", {})
+            prices[asset] = {
+                code: float(quotes[code]["price"])
+                for code in codes
+                if quotes.get(code, {}).get("price") is not None
+            }
+        return prices
+
     def get_exchange_usd_price(
         self, exchange: str, pair: str, currency: str = "USD"
     ) -> Optional[float]:
@@ -114,7 +210,7 @@ class CoinPaprika(Service):
 
         if existing_timestamp:
             start_date_existing = datetime.fromtimestamp(
-                existing_timestamp[-1] + 2 * intervals, tz=timezone.utc
+                existing_timestamp[-1] + intervals, tz=timezone.utc
             )
             if start_date < start_date_existing:
                 start_date = start_date_existing
@@ -142,60 +238,96 @@ class CoinPaprika(Service):
         if self.api_client is None:
             return
         logger.info(f"Getting historical data for a {self.interval} interval")
-        existing_timestamp = self.price_history.get_timestamp_list()
+        existing_timestamp = self._get_cursor_timestamp_list("history")
         timeseries = self.get_history_price(
             currency, existing_timestamp=existing_timestamp
         )
-        for price in timeseries:
-            dt = datetime.strptime(price["timestamp"], "%Y-%m-%dT%H:%M:%SZ").replace(
-                tzinfo=timezone.utc
+        prices = records_to_frame(timeseries, "timestamp", {"price": "price"})
+        self.price_history.append_dataframe(to_price_frame(prices, "price"))
+
+    def calculate_ohlcv_range(
+        self, existing_timestamp: Optional[list[float]] = None
+    ) -> Optional[dict[str, Any]]:
+        """Return the start, end and limit parameters of the missing candles.
+
+        Returns None when no candle can be missing yet.
+        """
+        now = datetime.now(timezone.utc)
+        start = now - timedelta(days=self.days_ago)
+        if existing_timestamp:
+            next_candle = datetime.fromtimestamp(
+                existing_timestamp[-1] + OHLCV_CANDLE_SECONDS, tz=timezone.utc
             )
-            self.price_history.add_price(dt, price["price"])
+            start = max(start, next_candle)
+        if start > now:
+            return None
+        gap = (now - start).total_seconds()
+        candles = max(1, math.ceil(gap / OHLCV_CANDLE_SECONDS))
+        return {
+            "start": start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "end": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "limit": min(candles, OHLCV_MAX_LIMIT),
+        }
 
     def get_ohlcv(self, currency: str, existing_timestamp=None) -> pd.DataFrame:
         if self.api_client is None:
             return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
-        start_date = self.calculate_start_date(
-            "1h", existing_timestamp=existing_timestamp
-        )
-        raw_ohlcv = self.api_client.ohlcv(self.whichcoin, start=start_date)
-        timeseries = [
+        params = self.calculate_ohlcv_range(existing_timestamp=existing_timestamp)
+        if params is None:
+            return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
+        raw_ohlcv = self.api_client.ohlcv(self.whichcoin, **params)
+        df = records_to_frame(
+            raw_ohlcv,
+            "time_open",
             {
-                "time": datetime.strptime(
-                    ohlcv["time_open"], "%Y-%m-%dT%H:%M:%SZ"
-                ).replace(tzinfo=timezone.utc),
-                "ohlcv": [
-                    ohlcv["open"],
-                    ohlcv["high"],
-                    ohlcv["low"],
-                    ohlcv["close"],
-                    ohlcv["volume"],
-                ],
-            }
-            for ohlcv in raw_ohlcv
-            if (
-                datetime.strptime(
-                    raw_ohlcv[-1]["time_open"], "%Y-%m-%dT%H:%M:%SZ"
-                ).replace(tzinfo=timezone.utc)
-                - datetime.strptime(ohlcv["time_open"], "%Y-%m-%dT%H:%M:%SZ").replace(
-                    tzinfo=timezone.utc
-                )
-            ).days
-            <= self.days_ago
-        ]
-
-        df = pd.DataFrame(
-            [ohlcv["ohlcv"] for ohlcv in timeseries],
-            columns=["Open", "High", "Low", "Close", "Volume"],
+                "Open": "open",
+                "High": "high",
+                "Low": "low",
+                "Close": "close",
+                "Volume": "volume",
+            },
         )
-        df.index = [ohlc["time"] for ohlc in timeseries]
+        df = slice_last_days(df, self.days_ago)
 
         if existing_timestamp:
-            cutoff = datetime.fromtimestamp(existing_timestamp[-1], tz=timezone.utc)
-            df = df[df.index > cutoff]
+            df = slice_after(df, existing_timestamp[-1])
 
         return df
 
+    def fetch_range(
+        self, dataset: str, currency: str, start: float, end: float
+    ) -> Optional[pd.DataFrame]:
+        if self.api_client is None:
+            return None
+        params = {
+            "start": datetime.fromtimestamp(start, tz=timezone.utc).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            ),
+            "end": datetime.fromtimestamp(end, tz=timezone.utc).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            ),
+        }
+        if dataset == "history":
+            timeseries = self.api_client.historical(
+                self.whichcoin, quotes="USD", interval=self.interval, **params
+            )
+            prices = records_to_frame(timeseries, "timestamp", {"price": "price"})
+            return to_price_frame(prices, "price")
+        limit = int((end - start) // OHLCV_CANDLE_SECONDS) + 1
+        raw_ohlcv = self.api_client.ohlcv(self.whichcoin, limit=limit, **params)
+        candles = records_to_frame(
+            raw_ohlcv,
+            "time_open",
+            {
+                "Open": "open",
+                "High": "high",
+                "Low": "low",
+                "Close": "close",
+                "Volume": "volume",
+            },
+        )
+        return candles_to_dataset(candles, dataset)
+
     def get_ohlc(self, currency, existing_timestamp=None) -> pd.DataFrame:
         """Fetch OHLC data based on the number of days ago."""
         ohlcv_df = self.get_ohlcv(currency, existing_timestamp)
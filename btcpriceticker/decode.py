@@ -0,0 +1,144 @@
+from collections.abc import Sequence
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+OHLC_COLUMNS = ["Open", "High", "Low", "Close"]
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def _as_utc_ns(index: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    return index.astype("datetime64[ns, UTC]")
+
+
+def epoch_to_datetime(values: Any, unit: str = "ms") -> pd.DatetimeIndex:
+    """Convert epoch numbers to a UTC ``DatetimeIndex`` in a single step."""
+    array = np.asarray(values, dtype="float64")
+    return _as_utc_ns(pd.DatetimeIndex(pd.to_datetime(array, unit=unit, utc=True)))
+
+
+def iso_to_datetime(values: Any) -> pd.DatetimeIndex:
+    """Parse ISO-8601 strings to a UTC ``DatetimeIndex`` in bulk."""
+    parsed = pd.to_datetime(pd.Index(values), utc=True, format="ISO8601")
+    return _as_utc_ns(pd.DatetimeIndex(parsed))
+
+
+def empty_frame(columns: Sequence[str], dtype: str = "float64") -> pd.DataFrame:
+    return pd.DataFrame(
+        {column: pd.Series(dtype=dtype) for column in columns},
+        index=_as_utc_ns(pd.DatetimeIndex([], tz="UTC")),
+    )
+
+
+def coerce_candles(frame: pd.DataFrame, dtype: str = "float64") -> pd.DataFrame:
+    """Return candles with a ``datetime64[ns, UTC]`` index and ``dtype`` columns.
+
+    A frame that already has these dtypes is returned as is.
+    """
+    index = frame.index
+    index_ok = not isinstance(index, pd.DatetimeIndex) or (
+        index.dtype == "datetime64[ns, UTC]"
+    )
+    if index_ok and all(frame[column].dtype == dtype for column in frame.columns):
+        return frame
+    if not index_ok:
+        index = _as_utc_ns(index if index.tz else index.tz_localize("UTC"))
+    columns = {
+        column: pd.to_numeric(frame[column], errors="coerce")
+        .to_numpy()
+        .astype(dtype, copy=False)
+        for column in frame.columns
+    }
+    return pd.DataFrame(columns, index=index, columns=frame.columns)
+
+
+def _rows_to_array(rows: Sequence[Sequence[Any]], width: int) -> np.ndarray:
+    try:
+        array = np.array(rows, dtype="float64")
+    except (TypeError, ValueError):
+        # Ragged or partly invalid payload, keep only the complete numeric rows
+        complete = [list(row[:width]) for row in rows if row and len(row) >= width]
+        if not complete:
+            return np.empty((0, width), dtype="float64")
+        frame = pd.DataFrame(complete).apply(pd.to_numeric, errors="coerce")
+        array = frame.dropna().to_numpy(dtype="float64")
+    if array.ndim != 2 or array.shape[1] < width:
+        return np.empty((0, width), dtype="float64")
+    return array[:, :width]
+
+
+def rows_to_frame(
+    rows: Optional[Sequence[Sequence[Any]]],
+    columns: Sequence[str],
+    unit: str = "ms",
+) -> pd.DataFrame:
+    """Decode ``[[time, value, ...], ...]`` rows into a time indexed frame.
+
+    The first element of every row is an epoch timestamp in ``unit``,
+    the following elements are mapped to ``columns``.
+    """
+    if not rows:
+        return empty_frame(columns)
+    array = _rows_to_array(rows, len(columns) + 1)
+    if not len(array):
+        return empty_frame(columns)
+    return pd.DataFrame(
+        array[:, 1:],
+        columns=list(columns),
+        index=epoch_to_datetime(array[:, 0], unit=unit),
+    )
+
+
+def records_to_frame(
+    records: Optional[Sequence[dict[str, Any]]],
+    time_key: str,
+    fields: dict[str, str],
+) -> pd.DataFrame:
+    """Decode a list of dicts with ISO timestamps into a time indexed frame.
+
+    ``fields`` maps output column names to the keys of the records.
+    """
+    if not records:
+        return empty_frame(list(fields))
+    raw = pd.DataFrame.from_records(records, columns=[time_key, *fields.values()])
+    data = {
+        column: pd.to_numeric(raw[key], errors="coerce").to_numpy(dtype="float64")
+        for column, key in fields.items()
+    }
+    return pd.DataFrame(data, index=iso_to_datetime(raw[time_key]))
+
+
+def to_price_frame(frame: pd.DataFrame, column: str) -> pd.DataFrame:
+    """Turn one column of a time indexed frame into ``timestamp``/``price`` rows."""
+    return pd.DataFrame(
+        {
+            "timestamp": frame.index,
+            "price": frame[column].to_numpy(dtype="float64"),
+        }
+    )
+
+
+def candles_to_dataset(candles: pd.DataFrame, dataset: str) -> pd.DataFrame:
+    """Return OHLCV candles as the rows of ``dataset`` (history, ohlc or ohlcv)."""
+    if dataset == "history":
+        return to_price_frame(candles, "Close")
+    if dataset == "ohlc":
+        return candles.drop(columns=["Volume"])
+    return candles
+
+
+def slice_after(frame: pd.DataFrame, timestamp: Optional[float]) -> pd.DataFrame:
+    """Keep the rows strictly newer than the epoch second ``timestamp``."""
+    if timestamp is None or frame.empty:
+        return frame
+    cutoff = pd.Timestamp(timestamp, unit="s", tz="UTC")
+    return frame[frame.index > cutoff]
+
+
+def slice_last_days(frame: pd.DataFrame, days: int) -> pd.DataFrame:
+    """Keep rows whose distance to the newest row is at most ``days`` full days."""
+    if frame.empty:
+        return frame
+    cutoff = frame.index.max() - pd.Timedelta(days=days + 1)
+    return frame[frame.index > cutoff]
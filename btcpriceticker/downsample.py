@@ -0,0 +1,121 @@
+import weakref
+from typing import Any, Optional
+
+import numpy as np
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+
+
+def lttb(x: Any, y: Any, max_points: int) -> np.ndarray:
+    """Return the indices of ``max_points`` points picked by Largest Triangle
+    Three Buckets.
+
+    The first and last point are kept, every bucket in between contributes
+    the point spanning the largest triangle with the previous pick and the
+    average of the next bucket. Bucket averages and areas are vectorized,
+    only the walk over the buckets is a Python loop.
+    """
+    size = len(y)
+    if max_points >= size:
+        return np.arange(size)
+    if max_points < 3:
+        return np.array([0, size - 1])
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    buckets = max_points - 2
+    edges = np.arange(buckets + 1) * (size - 2) // buckets + 1
+    counts = np.diff(edges)
+    average_x = np.add.reduceat(x[: size - 1], edges[:-1]) / counts
+    average_y = np.add.reduceat(y[: size - 1], edges[:-1]) / counts
+    # Each bucket looks ahead to the next one, the last bucket to the last point
+    next_x = np.append(average_x[1:], x[-1])
+    next_y = np.append(average_y[1:], y[-1])
+
+    selected = np.empty(max_points, dtype="int64")
+    selected[0] = previous = 0
+    selected[-1] = size - 1
+    for bucket in range(buckets):
+        start, end = edges[bucket], edges[bucket + 1]
+        ax, ay = x[previous], y[previous]
+        area = np.abs(
+            (ax - next_x[bucket]) * (y[start:end] - ay)
+            - (ax - x[start:end]) * (next_y[bucket] - ay)
+        )
+        previous = start + int(area.argmax())
+        selected[bucket + 1] = previous
+    return selected
+
+
+def minmax(y: Any, max_points: int) -> np.ndarray:
+    """Return the indices of the minimum and maximum of equal sized buckets.
+
+    The first and last point are kept and at most ``max_points`` indices are
+    returned in order, so every peak and trough of a bucket survives.
+    """
+    size = len(y)
+    if max_points >= size:
+        return np.arange(size)
+    buckets = (max_points - 2) // 2
+    if not buckets:
+        return np.array([0, size - 1])
+    interior = np.asarray(y)[1 : size - 1]
+    starts = np.arange(buckets) * len(interior) // buckets
+    bucket = np.repeat(np.arange(buckets), np.diff(starts, append=len(interior)))
+    picks = [np.array([0, size - 1])]
+    for reduce in (np.minimum, np.maximum):
+        extreme = reduce.reduceat(interior, starts)
+        positions = np.flatnonzero(interior == extreme[bucket])
+        # The first hit per bucket, ties keep the earliest point
+        first = np.unique(bucket[positions], return_index=True)[1]
+        picks.append(positions[first] + 1)
+    return np.unique(np.concatenate(picks))
+
+
+def downsample(
+    times: Any, prices: Any, max_points: int, method: str = "lttb"
+) -> np.ndarray:
+    """Return the indices of at most ``max_points`` points to draw.
+
+    ``times`` are int64 nanosecond timestamps, used as x axis by ``lttb`` so
+    irregular spacing is respected. NaN prices are never picked.
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unknown downsampling method '{method}'")
+    if max_points < 2:
+        raise ValueError("Expected max_points of at least 2")
+    prices = np.asarray(prices)
+    valid = ~np.isnan(prices)
+    positions = None if valid.all() else np.flatnonzero(valid)
+    if positions is not None:
+        prices = prices[positions]
+    if method == "minmax":
+        index = minmax(prices, max_points)
+    else:
+        times = np.asarray(times, dtype="int64")
+        if positions is not None:
+            times = times[positions]
+        seconds = (times - times[0]) / 1e9 if len(times) else times
+        index = lttb(seconds, prices, max_points)
+    return index if positions is None else positions[index]
+
+
+class DownsampleCache:
+    """Results computed from one frame, dropped once the frame is replaced.
+
+    The stores replace their frame on every append, so comparing the frame
+    by identity is enough to detect new rows. Only a weak reference is kept.
+    """
+
+    def __init__(self) -> None:
+        self.frame: Optional[weakref.ref] = None
+        self.entries: dict[Any, Any] = {}
+
+    def get(self, frame: Any, key: Any) -> Any:
+        if self.frame is None or self.frame() is not frame:
+            self.frame = weakref.ref(frame)
+            self.entries = {}
+        return self.entries.get(key)
+
+    def put(self, key: Any, value: Any) -> Any:
+        self.entries[key] = value
+        return value
@@ -0,0 +1,104 @@
+import sys
+from collections.abc import Iterator
+from typing import IO, Any, Optional, Union
+
+import pandas as pd
+
+PYARROW_MODULE = None
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+
+    PYARROW_MODULE = "pyarrow"
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore
+
+FORMATS = ("csv", "jsonl", "parquet", "arrow")
+BINARY_FORMATS = ("parquet", "arrow")
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def iter_chunks(
+    frame: pd.DataFrame, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[pd.DataFrame]:
+    """Yield ``frame`` in row chunks, a candle index becomes a timestamp column.
+
+    An empty frame yields one empty chunk, so headers and schemas are written.
+    """
+    for start in range(0, max(len(frame), 1), chunk_size):
+        chunk = frame.iloc[start : start + chunk_size]
+        if isinstance(chunk.index, pd.DatetimeIndex):
+            chunk = chunk.rename_axis("timestamp").reset_index()
+        yield chunk
+
+
+def _write_csv(chunks: Iterator[pd.DataFrame], handle: IO) -> None:
+    for number, chunk in enumerate(chunks):
+        chunk.to_csv(handle, index=False, header=number == 0)
+
+
+def _write_jsonl(chunks: Iterator[pd.DataFrame], handle: IO) -> None:
+    for chunk in chunks:
+        if not chunk.empty:
+            handle.write(chunk.to_json(orient="records", lines=True, date_format="iso"))
+
+
+def _write_arrow_batches(chunks: Iterator[pd.DataFrame], handle: IO, fmt: str):
+    writer: Any = None
+    schema = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            if writer is None:
+                schema = table.schema
+                if fmt == "parquet":
+                    writer = pq.ParquetWriter(handle, schema)
+                else:
+                    writer = pa_ipc.new_stream(handle, schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def export_frame(
+    frame: pd.DataFrame,
+    fmt: str,
+    output: Optional[Union[str, IO]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Write ``frame`` chunk by chunk as csv, jsonl, parquet or arrow.
+
+    ``output`` is a path, a file object or None for stdout. Only one chunk
+    is converted at a time, so large frames never exist twice in memory.
+    Returns the number of rows written.
+    """
+    fmt = fmt.lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}', use one of {', '.join(FORMATS)}")
+    if fmt in BINARY_FORMATS and not PYARROW_MODULE:
+        raise RuntimeError(f"The {fmt} format requires the 'pyarrow' package")
+    binary = fmt in BINARY_FORMATS
+    if output is None:
+        handle: IO = sys.stdout.buffer if binary else sys.stdout
+        close = False
+    elif isinstance(output, str):
+        handle = open(output, "wb") if binary else open(output, "w", newline="")
+        close = True
+    else:
+        handle, close = output, False
+    frame = frame if isinstance(frame, pd.DataFrame) else pd.DataFrame()
+    chunks = iter_chunks(frame, chunk_size)
+    try:
+        if fmt == "csv":
+            _write_csv(chunks, handle)
+        elif fmt == "jsonl":
+            _write_jsonl(chunks, handle)
+        else:
+            _write_arrow_batches(chunks, handle, fmt)
+        handle.flush()
+    finally:
+        if close:
+            handle.close()
+    return len(frame)
@@ -0,0 +1,165 @@
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Callable, Optional
+
+import pandas as pd
+
+from .ratelimit import install_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+MEMPOOL_MODULE = None
+try:
+    from pymempool import MempoolAPI
+
+    MEMPOOL_MODULE = "pymempool"
+except ImportError:  # pragma: no cover
+    pass
+
+# Frame columns holding prices, everything else (e.g. Volume) is kept as is
+PRICE_COLUMNS = ("Open", "High", "Low", "Close", "price")
+
+RatesProvider = Callable[[], Optional[dict[str, float]]]
+
+
+class FxRates:
+    """Thread safe table of fiat units per USD with a TTL per currency.
+
+    Rates are pushed by backends that see several fiats in one response and
+    pulled from the registered providers when a rate is missing or stale, so
+    a fiat price can be derived from a USD price without another request.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        retry_after: float = 30.0,
+        fallback: Optional[RatesProvider] = None,
+    ):
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self.fallback = fallback
+        self._rates: dict[str, tuple[float, float]] = {"USD": (1.0, float("inf"))}
+        self._providers: list[Any] = []
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+
+    def add_provider(self, provider: RatesProvider) -> None:
+        """Register a callable returning fiat units per USD.
+
+        Bound methods are held weakly so that services can be collected.
+        """
+        entry: Any = provider
+        if hasattr(provider, "__self__"):
+            entry = weakref.WeakMethod(provider)  # type: ignore[arg-type]
+        with self._lock:
+            if any(_resolve(existing) == provider for existing in self._providers):
+                return
+            self._providers.append(entry)
+
+    def update(self, rates: dict[str, float], now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        with self._lock:
+            for code, rate in rates.items():
+                if rate and code.upper() != "USD":
+                    self._rates[code.upper()] = (float(rate), now)
+
+    def update_from_btc_prices(
+        self, prices: dict[str, Optional[float]], now: Optional[float] = None
+    ) -> None:
+        """Derive rates from BTC prices quoted in several fiats, incl. USD."""
+        usd = prices.get("USD")
+        if not usd:
+            return
+        self.update({code: price / usd for code, price in prices.items() if price}, now)
+
+    def refresh(self, now: Optional[float] = None) -> bool:
+        """Pull a rate table from the first provider that returns one."""
+        now = time.time() if now is None else now
+        with self._lock:
+            providers = [_resolve(entry) for entry in self._providers]
+            self._providers = [
+                entry for entry, provider in zip(self._providers, providers) if provider
+            ]
+            self._last_refresh = now
+        providers.append(self.fallback)
+        for provider in providers:
+            if provider is None:
+                continue
+            try:
+                rates = provider()
+            except Exception as exc:
+                logger.warning("FX rate provider %s failed: %s", provider, exc)
+                continue
+            if rates:
+                self.update(rates, now)
+                return True
+        return False
+
+    def get_rate(self, currency: str, now: Optional[float] = None) -> Optional[float]:
+        """Return the fiat units per USD, refreshing a missing or stale rate."""
+        code = currency.upper()
+        now = time.time() if now is None else now
+        entry = self._rates.get(code)
+        if entry is not None and now - entry[1] < self.ttl:
+            return entry[0]
+        if now - self._last_refresh >= self.retry_after:
+            self.refresh(now)
+            entry = self._rates.get(code, entry)
+        if entry is None:
+            logger.warning("No FX rate for %s", code)
+            return None
+        return entry[0]
+
+    def convert(self, usd_value: Optional[float], currency: str) -> Optional[float]:
+        if usd_value is None:
+            return None
+        rate = self.get_rate(currency)
+        return usd_value * rate if rate is not None else None
+
+    def convert_frame(self, frame: Any, currency: str) -> Optional[pd.DataFrame]:
+        """Convert the price columns of a USD frame, None without a rate."""
+        rate = self.get_rate(currency)
+        if rate is None or not isinstance(frame, pd.DataFrame):
+            return None
+        converted = frame.copy()
+        for column in PRICE_COLUMNS:
+            if column in converted.columns:
+                converted[column] = converted[column].astype("float64") * rate
+        return converted
+
+
+def _resolve(entry: Any) -> Optional[RatesProvider]:
+    if isinstance(entry, weakref.WeakMethod):
+        return entry()
+    return entry
+
+
+def fetch_mempool_rates() -> Optional[dict[str, float]]:
+    """Fallback provider deriving rates from the mempool.space BTC prices."""
+    if not MEMPOOL_MODULE:
+        return None
+    client = MempoolAPI()
+    install_rate_limiter(client.session)
+    ticker = client.get_price()
+    usd = float(ticker["USD"])
+    return {
+        code: float(value) / usd
+        for code, value in ticker.items()
+        if code != "time" and value
+    }
+
+
+_default_rates: Optional[FxRates] = None
+_default_lock = threading.Lock()
+
+
+def get_fx_rates() -> FxRates:
+    """Return the process wide rate table shared by all services."""
+    global _default_rates
+    with _default_lock:
+        if _default_rates is None:
+            _default_rates = FxRates(fallback=fetch_mempool_rates)
+        return _default_rates
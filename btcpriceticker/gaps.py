@@ -0,0 +1,97 @@
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+# A step longer than this many intervals leaves at least one slot empty
+GAP_TOLERANCE = 1.5
+
+
+def to_epoch_seconds(values: Any, sort: bool = True) -> np.ndarray:
+    """Return a datetime column or index as float epoch seconds.
+
+    With ``sort`` missing values are dropped and the result is sorted,
+    otherwise it stays aligned with ``values``.
+    """
+    index = pd.DatetimeIndex(values)
+    if index.tz is None:
+        index = index.tz_localize("UTC")
+    seconds = index.as_unit("ns").asi8 / 1e9
+    if sort:
+        seconds = seconds[~index.isna()]
+        if not index.is_monotonic_increasing:
+            seconds = np.sort(seconds)
+    return seconds
+
+
+def find_gaps(timestamps: Any, interval: float) -> np.ndarray:
+    """Return the missing slots between ``timestamps`` as ``[first, last]`` rows.
+
+    ``timestamps`` are sorted epoch seconds and ``interval`` the slot length
+    in seconds. Every step longer than ``GAP_TOLERANCE`` intervals is a gap;
+    ``first`` and ``last`` are the epoch seconds of its first and last missing
+    slot. Runs in one vectorized pass.
+    """
+    seconds = np.asarray(timestamps, dtype="float64")
+    if seconds.size < 2:
+        return np.empty((0, 2), dtype="float64")
+    holes = np.flatnonzero(np.diff(seconds) > interval * GAP_TOLERANCE)
+    first = seconds[holes] + interval
+    last = np.maximum(seconds[holes + 1] - interval, first)
+    return np.column_stack((first, last))
+
+
+def count_slots(gaps: np.ndarray, interval: float) -> int:
+    """Return the number of missing slots in ``gaps``."""
+    if not len(gaps):
+        return 0
+    slots = np.rint((gaps[:, 1] - gaps[:, 0]) / interval).astype("int64") + 1
+    return int(slots.sum())
+
+
+def plan_requests(
+    gaps: np.ndarray, interval: float, page_size: Optional[int] = None
+) -> list[tuple[float, float]]:
+    """Cover ``gaps`` with the fewest ranges of at most ``page_size`` slots.
+
+    Neighbouring gaps share a range when they fit into one page, longer gaps
+    are split into full pages. ``page_size`` None means a single request can
+    return any range.
+    """
+    if not len(gaps):
+        return []
+    if page_size is None:
+        return [(float(gaps[0, 0]), float(gaps[-1, 1]))]
+    span = (max(page_size, 1) - 1) * interval
+    ranges: list[list[float]] = []
+    for first, last in gaps.tolist():
+        if ranges:
+            start = ranges[-1][0]
+            if last <= start + span:
+                ranges[-1][1] = last
+                continue
+            if first <= start + span:
+                ranges[-1][1] = start + span
+                first = min(start + span + interval, last)
+        while last > first + span:
+            ranges.append([first, first + span])
+            first += span + interval
+        ranges.append([first, last])
+    return [(start, end) for start, end in ranges]
+
+
+def in_gaps(timestamps: Any, gaps: np.ndarray, interval: float) -> np.ndarray:
+    """Return a mask of the ``timestamps`` that fall into one of ``gaps``.
+
+    Used to keep only the filled slots of a range that also returned rows
+    which are already stored.
+    """
+    seconds = np.asarray(timestamps, dtype="float64")
+    if not len(gaps):
+        return np.zeros(seconds.shape, dtype=bool)
+    lower = gaps[:, 0] - interval / 2
+    upper = gaps[:, 1] + interval / 2
+    position = np.searchsorted(lower, seconds, side="right") - 1
+    mask = position >= 0
+    mask[mask] = seconds[mask] < upper[position[mask]]
+    return mask
@@ -0,0 +1,120 @@
+import time
+from collections import deque
+from typing import Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class ServiceHealth:
+    """Rolling latency, error rate and staleness of one service plus a breaker.
+
+    The circuit opens after ``failure_threshold`` consecutive failures. While
+    it is open the service is skipped, after ``cooldown`` seconds a single
+    probe request is let through (half-open). A successful probe closes the
+    circuit, a failed one opens it again with a doubled cooldown.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        cooldown: float = 60.0,
+        max_cooldown: float = 900.0,
+        window: int = 20,
+        latency_alpha: float = 0.3,
+        prior_latency: float = 1.0,
+        stale_after: float = 3600.0,
+    ):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.latency_alpha = latency_alpha
+        self.stale_after = stale_after
+        self.state = CLOSED
+        self.latency = prior_latency
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.last_success = 0.0
+        self.last_failure = 0.0
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._probing = False
+
+    @property
+    def error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def staleness(self, now: Optional[float] = None) -> float:
+        """Return the seconds since the last success, 0 if never tried."""
+        if not self.last_success:
+            return 0.0
+        now = time.time() if now is None else now
+        return max(now - self.last_success, 0.0)
+
+    def available(self, now: Optional[float] = None) -> bool:
+        """Return whether a request would currently be let through."""
+        if self.state == CLOSED:
+            return True
+        if self.state == HALF_OPEN:
+            return not self._probing
+        now = time.time() if now is None else now
+        return now >= self.opened_at + self.cooldown
+
+    def allow_request(self, now: Optional[float] = None) -> bool:
+        """Like available(), but turns an expired open circuit into a probe."""
+        if not self.available(now):
+            return False
+        if self.state != CLOSED:
+            self.state = HALF_OPEN
+            self._probing = True
+        return True
+
+    def _record_latency(self, latency: float) -> None:
+        self.latency += self.latency_alpha * (latency - self.latency)
+
+    def record_success(self, latency: float, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        self._record_latency(latency)
+        self._outcomes.append(True)
+        self.last_success = now
+        self.consecutive_failures = 0
+        self.state = CLOSED
+        self.cooldown = self.base_cooldown
+        self._probing = False
+
+    def record_failure(self, latency: float, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        self._record_latency(latency)
+        self._outcomes.append(False)
+        self.last_failure = now
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN:
+            self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            self._open(now)
+        elif self.consecutive_failures >= self.failure_threshold:
+            self._open(now)
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self.opened_at = now
+        self._probing = False
+
+    def score(self, now: Optional[float] = None) -> float:
+        """Return a health score, higher is better and 0 means unusable."""
+        if not self.available(now):
+            return 0.0
+        freshness = 1.0 / (1.0 + self.staleness(now) / self.stale_after)
+        return (1.0 - self.error_rate) * freshness / (1.0 + self.latency)
+
+    def as_dict(self, now: Optional[float] = None) -> dict:
+        return {
+            "state": self.state,
+            "score": self.score(now),
+            "latency": self.latency,
+            "error_rate": self.error_rate,
+            "staleness": self.staleness(now),
+            "consecutive_failures": self.consecutive_failures,
+        }
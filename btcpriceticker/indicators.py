@@ -0,0 +1,335 @@
+import abc
+import math
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+# More new rows than this are cheaper to fold in with a vectorized reset
+RESET_ROWS = 256
+
+
+def _smoothed(values: np.ndarray, alpha: float) -> tuple[float, float]:
+    """Return the last two values of an exponential smoothing of ``values``."""
+    smoothed = pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    before = smoothed[-2] if len(smoothed) > 1 else math.nan
+    return float(smoothed[-1]), float(before)
+
+
+def _smooth(value: float, previous: float, alpha: float) -> float:
+    if math.isnan(previous):
+        return value
+    return alpha * value + (1 - alpha) * previous
+
+
+class Indicator(abc.ABC):
+    """Technical indicator folded in one row (high, low, close) at a time.
+
+    ``reset`` initialises the state from whole columns in a vectorized pass,
+    ``append`` adds a row and ``replace`` revises the last row, e.g. a candle
+    that is still open. Both are O(1).
+    """
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError("Expected a period of at least 1")
+        self.period = period
+        self.count = 0
+
+    @abc.abstractmethod
+    def reset(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> None:
+        """Initialise the state from whole columns."""
+
+    @abc.abstractmethod
+    def append(self, high: float, low: float, close: float) -> None:
+        """Fold in a new row."""
+
+    @abc.abstractmethod
+    def replace(self, high: float, low: float, close: float) -> None:
+        """Revise the last row."""
+
+    @property
+    @abc.abstractmethod
+    def value(self) -> Any:
+        """Return the indicator value after the last row, NaN while warming up."""
+
+
+class SMA(Indicator):
+    """Simple moving average of the close over ``period`` rows.
+
+    The running sums are recomputed from the window every ``period`` updates
+    so rounding errors of the incremental updates cannot accumulate. Squares
+    are taken relative to ``offset``, the window mean at the last recompute,
+    to keep them small at BTC price levels.
+    """
+
+    def __init__(self, period: int):
+        super().__init__(period)
+        self.reset([], [], [])
+
+    def reset(self, high, low, close) -> None:
+        tail = np.asarray(close[-self.period :], dtype="float64")
+        self.window = np.full(self.period, math.nan)
+        self.window[: len(tail)] = tail
+        self.position = len(tail) % self.period
+        self.count = len(close)
+        self._resum()
+
+    def _resum(self) -> None:
+        filled = self.window[~np.isnan(self.window)]
+        self.offset = float(filled.mean()) if len(filled) else math.nan
+        shifted = filled - self.offset
+        self.total = float(filled.sum())
+        self.total_squares = float((shifted * shifted).sum())
+        self.updates = 0
+
+    def _updated(self) -> None:
+        self.updates += 1
+        if self.updates >= self.period:
+            self._resum()
+
+    def append(self, high, low, close) -> None:
+        if math.isnan(self.offset):
+            self.offset = close
+        if self.count >= self.period:
+            oldest = self.window[self.position] - self.offset
+            self.total -= self.window[self.position]
+            self.total_squares -= oldest * oldest
+        self.window[self.position] = close
+        self.total += close
+        self.total_squares += (close - self.offset) ** 2
+        self.position = (self.position + 1) % self.period
+        self.count += 1
+        self._updated()
+
+    def replace(self, high, low, close) -> None:
+        if self.count == 0:
+            self.append(high, low, close)
+            return
+        last = (self.position - 1) % self.period
+        previous = self.window[last]
+        self.window[last] = close
+        self.total += close - previous
+        self.total_squares += (close - self.offset) ** 2 - (previous - self.offset) ** 2
+        self._updated()
+
+    @property
+    def value(self) -> float:
+        if self.count < self.period:
+            return math.nan
+        return self.total / self.period
+
+
+class BollingerBands(SMA):
+    """Moving average with bands ``deviations`` standard deviations apart."""
+
+    def __init__(self, period: int = 20, deviations: float = 2.0):
+        super().__init__(period)
+        self.deviations = deviations
+
+    @property
+    def value(self) -> dict[str, float]:
+        middle = super().value
+        shift = middle - self.offset
+        variance = self.total_squares / self.period - shift * shift
+        width = self.deviations * math.sqrt(max(variance, 0.0))
+        return {"middle": middle, "upper": middle + width, "lower": middle - width}
+
+
+class EMA(Indicator):
+    """Exponential moving average of the close, seeded with the first close."""
+
+    def __init__(self, period: int):
+        super().__init__(period)
+        self.alpha = 2 / (period + 1)
+        self.current = self.previous = math.nan
+
+    def reset(self, high, low, close) -> None:
+        self.count = len(close)
+        self.current = self.previous = math.nan
+        if self.count:
+            self.current, self.previous = _smoothed(close, self.alpha)
+
+    def append(self, high, low, close) -> None:
+        self.previous = self.current
+        self.count += 1
+        self.replace(high, low, close)
+
+    def replace(self, high, low, close) -> None:
+        if self.count == 0:
+            self.append(high, low, close)
+            return
+        self.current = _smooth(close, self.previous, self.alpha)
+
+    @property
+    def value(self) -> float:
+        return self.current if self.count >= self.period else math.nan
+
+
+class RSI(Indicator):
+    """Relative strength index with Wilder's smoothing of gains and losses."""
+
+    def __init__(self, period: int = 14):
+        super().__init__(period)
+        self.alpha = 1 / period
+        self.close = self.previous_close = math.nan
+        self.gain = self.loss = math.nan
+        self.previous_gain = self.previous_loss = math.nan
+
+    def reset(self, high, low, close) -> None:
+        self.count = len(close)
+        self.close = float(close[-1]) if self.count else math.nan
+        self.previous_close = float(close[-2]) if self.count > 1 else math.nan
+        self.gain = self.loss = math.nan
+        self.previous_gain = self.previous_loss = math.nan
+        if self.count > 1:
+            change = np.diff(np.asarray(close, dtype="float64"))
+            self.gain, self.previous_gain = _smoothed(
+                np.clip(change, 0, None), self.alpha
+            )
+            self.loss, self.previous_loss = _smoothed(
+                np.clip(-change, 0, None), self.alpha
+            )
+
+    def append(self, high, low, close) -> None:
+        self.previous_close = self.close
+        self.previous_gain, self.previous_loss = self.gain, self.loss
+        self.count += 1
+        self.replace(high, low, close)
+
+    def replace(self, high, low, close) -> None:
+        if self.count == 0:
+            self.append(high, low, close)
+            return
+        self.close = close
+        if math.isnan(self.previous_close):
+            return
+        change = close - self.previous_close
+        self.gain = _smooth(max(change, 0.0), self.previous_gain, self.alpha)
+        self.loss = _smooth(max(-change, 0.0), self.previous_loss, self.alpha)
+
+    @property
+    def value(self) -> float:
+        if self.count <= self.period:
+            return math.nan
+        if self.loss == 0:
+            return 100.0 if self.gain > 0 else 50.0
+        return 100 - 100 / (1 + self.gain / self.loss)
+
+
+class ATR(Indicator):
+    """Average true range with Wilder's smoothing, needs high and low."""
+
+    def __init__(self, period: int = 14):
+        super().__init__(period)
+        self.alpha = 1 / period
+        self.close = self.previous_close = math.nan
+        self.current = self.previous = math.nan
+
+    def reset(self, high, low, close) -> None:
+        self.count = len(close)
+        self.current = self.previous = math.nan
+        self.close = float(close[-1]) if self.count else math.nan
+        self.previous_close = float(close[-2]) if self.count > 1 else math.nan
+        if self.count:
+            high = np.asarray(high, dtype="float64")
+            low = np.asarray(low, dtype="float64")
+            prior = np.asarray(close, dtype="float64")[:-1]
+            true_range = high - low
+            true_range[1:] = np.maximum.reduce(
+                [true_range[1:], np.abs(high[1:] - prior), np.abs(low[1:] - prior)]
+            )
+            self.current, self.previous = _smoothed(true_range, self.alpha)
+
+    def append(self, high, low, close) -> None:
+        self.previous_close = self.close
+        self.previous = self.current
+        self.count += 1
+        self.replace(high, low, close)
+
+    def replace(self, high, low, close) -> None:
+        if self.count == 0:
+            self.append(high, low, close)
+            return
+        true_range = high - low
+        if not math.isnan(self.previous_close):
+            true_range = max(
+                true_range,
+                abs(high - self.previous_close),
+                abs(low - self.previous_close),
+            )
+        self.close = close
+        self.current = _smooth(true_range, self.previous, self.alpha)
+
+    @property
+    def value(self) -> float:
+        return self.current if self.count >= self.period else math.nan
+
+
+def default_indicators(candles: bool = False) -> dict[str, Indicator]:
+    """Return SMA/EMA 20, RSI 14 and Bollinger 20, plus ATR 14 for candles."""
+    indicators: dict[str, Indicator] = {
+        "sma_20": SMA(20),
+        "ema_20": EMA(20),
+        "rsi_14": RSI(14),
+        "bollinger_20": BollingerBands(20),
+    }
+    if candles:
+        indicators["atr_14"] = ATR(14)
+    return indicators
+
+
+class IndicatorEngine:
+    """Keep a set of indicators in sync with a growing series.
+
+    ``update`` compares the series with the rows folded in so far: new rows
+    after the last one are appended, a revised last row is replaced and any
+    other change (e.g. a backfilled gap) resets the indicators vectorized.
+    """
+
+    def __init__(self, indicators: Optional[dict[str, Indicator]] = None):
+        self.indicators: dict[str, Indicator] = dict(indicators or {})
+        self.rows = 0
+        self.last_time: Optional[int] = None
+        self.last_row: Optional[tuple[float, float, float]] = None
+
+    def add(self, name: str, indicator: Indicator) -> None:
+        self.indicators[name] = indicator
+        self.rows = 0
+
+    def remove(self, name: str) -> None:
+        self.indicators.pop(name, None)
+
+    def update(self, times: Any, high: Any, low: Any, close: Any) -> dict[str, Any]:
+        """Fold in the changes of the series and return the indicator values.
+
+        ``times`` are int64 timestamps and ``high``, ``low`` and ``close``
+        the aligned columns; a price series passes its prices three times.
+        """
+        rows = len(times)
+        last = self.rows - 1
+        if (
+            self.rows
+            and rows >= self.rows
+            and rows - self.rows <= RESET_ROWS
+            and times[last] == self.last_time
+        ):
+            row = (float(high[last]), float(low[last]), float(close[last]))
+            if row != self.last_row:
+                for indicator in self.indicators.values():
+                    indicator.replace(*row)
+            for index in range(self.rows, rows):
+                row = (float(high[index]), float(low[index]), float(close[index]))
+                for indicator in self.indicators.values():
+                    indicator.append(*row)
+        else:
+            for indicator in self.indicators.values():
+                indicator.reset(high, low, close)
+        self.rows = rows
+        if rows:
+            self.last_time = times[-1]
+            self.last_row = (float(high[-1]), float(low[-1]), float(close[-1]))
+        return self.values()
+
+    def values(self) -> dict[str, Any]:
+        return {name: indicator.value for name, indicator in self.indicators.items()}
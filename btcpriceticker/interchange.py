@@ -0,0 +1,53 @@
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+PYARROW_MODULE = None
+try:
+    import pyarrow as pa
+
+    PYARROW_MODULE = "pyarrow"
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore
+
+
+def _require_pyarrow() -> None:
+    if not PYARROW_MODULE:
+        raise RuntimeError("Arrow interchange requires the 'pyarrow' package")
+
+
+def column_to_arrow(values: Any) -> Any:
+    """Return a pandas column or index as an Arrow array.
+
+    Float, integer and datetime columns are wrapped without copying their
+    buffer, other dtypes (e.g. object columns) are converted.
+    """
+    dtype = values.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        data = values.to_numpy(dtype=f"datetime64[{dtype.unit}]")
+        return pa.array(data).view(pa.timestamp(dtype.unit, str(dtype.tz)))
+    if isinstance(dtype, np.dtype) and dtype.kind in "fiumM":
+        return pa.array(np.ascontiguousarray(values.to_numpy()))
+    return pa.array(values, from_pandas=True)
+
+
+def frame_to_arrow(frame: Any, index_name: str = "timestamp") -> Any:
+    """Return ``frame`` as an Arrow table backed by the frame's buffers.
+
+    A DatetimeIndex (the candle frames) becomes the first column. The table
+    is a view, it reflects later in place writes to the frame; new rows are
+    never visible since appending replaces the frame.
+    """
+    _require_pyarrow()
+    if not isinstance(frame, pd.DataFrame):
+        return pa.table({})
+    arrays = []
+    names = []
+    if isinstance(frame.index, pd.DatetimeIndex):
+        arrays.append(column_to_arrow(frame.index))
+        names.append(frame.index.name or index_name)
+    for name in frame.columns:
+        arrays.append(column_to_arrow(frame[name]))
+        names.append(str(name))
+    return pa.table(arrays, names=names)
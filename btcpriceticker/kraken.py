@@ -4,7 +4,16 @@ from typing import Any, Optional
 
 import pandas as pd
 
+from .ccxt_mixin import CcxtMixin
+from .decode import (
+    OHLC_COLUMNS,
+    OHLCV_COLUMNS,
+    rows_to_frame,
+    slice_after,
+    to_price_frame,
+)
 from .service import Service
+from .stream import KrakenTickerStream
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +26,11 @@ except ImportError:  # pragma: no cover
     ccxt = None  # type: ignore
 
 
-class Kraken(Service):
+class Kraken(CcxtMixin, Service):
+    ticker_stream = KrakenTickerStream
+    # Candles returned by one OHLCV request
+    backfill_page_size = 720
+
     def __init__(
         self,
         fiat: str,
@@ -40,20 +53,6 @@ class Kraken(Service):
         )
         self.name = "kraken"
 
-    def _get_symbol(self, currency: str) -> str:
-        quote = currency.upper()
-        return f"{self.base_asset}/{quote}"
-
-    def interval_to_seconds(self) -> int:
-        unit_multipliers = {"m": 60, "h": 3600, "d": 86400}
-        try:
-            value, unit = int(self.interval[:-1]), self.interval[-1]
-            if unit not in unit_multipliers:
-                raise ValueError
-            return value * unit_multipliers[unit]
-        except (ValueError, IndexError) as exc:  # pragma: no cover
-            raise ValueError(f"Invalid interval format {self.interval}") from exc
-
     def get_current_price(self, currency: str) -> Optional[float]:
         if self.exchange is None:
             return None
@@ -99,14 +98,10 @@ class Kraken(Service):
         logger.info(
             "Getting historical data for a %s interval from Kraken", self.interval
         )
-        existing_timestamp = self.price_history.get_timestamp_list()
+        existing_timestamp = self._get_cursor_timestamp_list("history")
         ohlcv_data = self.get_history_price(currency, existing_timestamp)
-        for candle in ohlcv_data:
-            if len(candle) < 5:
-                continue
-            timestamp_ms, _, _, _, close_price = candle[:5]
-            dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-            self.price_history.add_price(dt, float(close_price))
+        candles = rows_to_frame(ohlcv_data, OHLC_COLUMNS)
+        self.price_history.append_dataframe(to_price_frame(candles, "Close"))
 
     def get_ohlcv(self, currency: str, existing_timestamp=None) -> pd.DataFrame:
         if self.exchange is None:
@@ -124,18 +119,9 @@ class Kraken(Service):
         if not ohlcv_data:
             return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
 
-        times = [
-            datetime.fromtimestamp(candle[0] / 1000, tz=timezone.utc)
-            for candle in ohlcv_data
-        ]
-        values = [candle[1:6] for candle in ohlcv_data]
-        df = pd.DataFrame(
-            values, columns=["Open", "High", "Low", "Close", "Volume"], index=times
-        )
-
+        df = rows_to_frame(ohlcv_data, OHLCV_COLUMNS)
         if existing_timestamp:
-            cutoff = datetime.fromtimestamp(existing_timestamp[-1], tz=timezone.utc)
-            df = df[df.index > cutoff]
+            df = slice_after(df, existing_timestamp[-1])
         return df
 
     def get_ohlc(self, currency, existing_timestamp=None) -> pd.DataFrame:
@@ -17,7 +17,14 @@ except ImportError:
     pass
 
 
+# Fiats quoted by the /api/v1/prices endpoint
+MEMPOOL_FIATS = ("USD", "EUR", "GBP", "CAD", "CHF", "AUD", "JPY")
+
+
 class Mempool(Service):
+    # The historical price endpoint returns a single timestamp
+    backfill_page_size = 1
+
     def __init__(
         self,
         fiat,
@@ -38,6 +45,10 @@ class Mempool(Service):
         )
         self.name = "mempool"
 
+    def http_sessions(self) -> list[Any]:
+        session = getattr(self.api_client, "session", None)
+        return [session] if session is not None else []
+
     def get_current_price(self, currency="USD") -> Optional[float]:
         """Fetch the current price from Mempool."""
         if not self.api_client:
@@ -49,6 +60,35 @@ class Mempool(Service):
             logger.exception(f"Failed to fetch current price: {e}")
             return None
 
+    def get_current_prices(self, currencies: list[str]) -> dict[str, Optional[float]]:
+        """Read every currency from the single /api/v1/prices response."""
+        if not self.api_client:
+            return {}
+        try:
+            ticker = self.api_client.get_price()
+        except Exception as e:
+            logger.exception(f"Failed to fetch current prices: {e}")
+            return {}
+        prices: dict[str, Optional[float]] = {}
+        for currency in currencies:
+            value = ticker.get(currency.upper())
+            prices[currency.upper()] = float(value) if value is not None else None
+        return prices
+
+    def has_native_fiat(self, currency: str) -> bool:
+        return currency.upper() in MEMPOOL_FIATS
+
+    def fetch_fx_rates(self) -> Optional[dict[str, float]]:
+        if not self.api_client:
+            return None
+        ticker = self.api_client.get_price()
+        usd = float(ticker["USD"])
+        return {
+            code: float(ticker[code]) / usd
+            for code in MEMPOOL_FIATS
+            if ticker.get(code)
+        }
+
     def interval_to_seconds(self) -> int:
         """Convert a time interval string to seconds."""
         unit_multipliers = {"m": 60, "h": 3600, "d": 86400}
@@ -74,9 +114,7 @@ class Mempool(Service):
         if not existing_timestamp:
             start_time = self.calculate_start_date()
         else:
-            start_time = datetime.utcfromtimestamp(
-                existing_timestamp[-1] + 2 * intervals
-            )
+            start_time = datetime.utcfromtimestamp(existing_timestamp[-1] + intervals)
         time_vector = list(
             range(
                 int(start_time.timestamp()),
@@ -87,13 +125,12 @@ class Mempool(Service):
 
         return time_vector
 
-    def get_history_price(
-        self, currency, existing_timestamp=None
+    def _fetch_prices(
+        self, currency, time_vector: list[int]
     ) -> list[tuple[datetime, float]]:
         history_prices: list[tuple[datetime, float]] = []
         if self.api_client is None:
             return history_prices
-        time_vector = self.calculate_time_vector(existing_timestamp=existing_timestamp)
         for timestamp in time_vector:
             price = self.api_client.get_historical_price(
                 currency=currency.upper(), timestamp=timestamp
@@ -104,10 +141,29 @@ class Mempool(Service):
             )
         return history_prices
 
+    def get_history_price(
+        self, currency, existing_timestamp=None
+    ) -> list[tuple[datetime, float]]:
+        if self.api_client is None:
+            return []
+        time_vector = self.calculate_time_vector(existing_timestamp=existing_timestamp)
+        return self._fetch_prices(currency, time_vector)
+
+    def fetch_range(self, dataset, currency, start, end) -> Optional[pd.DataFrame]:
+        """Fetch the history slots from ``start`` to ``end``, one per request.
+
+        Candles are resampled from the history and cannot be fetched.
+        """
+        if dataset != "history" or self.api_client is None:
+            return None
+        time_vector = range(int(start), int(end) + 1, self.interval_to_seconds())
+        history_prices = self._fetch_prices(currency, list(time_vector))
+        return pd.DataFrame(history_prices, columns=["timestamp", "price"])
+
     def update_price_history(self, currency):
         """Fetch historical prices from Mempool."""
         logger.info(f"Getting historical data for a {self.interval} interval")
-        existing_timestamp = self.price_history.get_timestamp_list()
+        existing_timestamp = self._get_cursor_timestamp_list("history")
         history_prices = self.get_history_price(
             currency, existing_timestamp=existing_timestamp
         )
@@ -115,11 +171,7 @@ class Mempool(Service):
             self.price_history.add_price(price_time, price_value)
 
     def get_ohlcv(self, currency, existing_timestamp=None):
-        df = self.price_history.data.copy()
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        df.set_index("timestamp", inplace=True)
-
-        ohlcv_df = df["price"].resample("1h").ohlcv()
+        ohlcv_df = self.price_history.resample_to_ohlcv("1h")
         if existing_timestamp:
             cutoff = datetime.fromtimestamp(existing_timestamp[-1], tz=timezone.utc)
             ohlcv_df = ohlcv_df[ohlcv_df.index > cutoff]
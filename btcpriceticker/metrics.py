@@ -0,0 +1,166 @@
+import threading
+from bisect import bisect_left
+from typing import Any
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """Fixed bucket histogram in the Prometheus cumulative layout."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        cumulative: dict[str, int] = {}
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            cumulative["+Inf" if bound == float("inf") else f"{bound:g}"] = total
+        return {"buckets": cumulative, "sum": self.sum, "count": self.count}
+
+
+class ServiceMetrics:
+    """Request, refresh and ingestion counters of one backend.
+
+    HTTP requests are counted by a response hook on the backend sessions,
+    refreshes are timed by ``Price``. Time spent paced by the rate limiter is
+    reported apart from the network time, the rest of a refresh as parsing
+    time.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.request_errors = 0
+        self.bytes = 0
+        self.network_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.request_latency = Histogram()
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.refresh_latency = Histogram()
+        self.parse_seconds = 0.0
+        self.rows = 0
+        self._lock = threading.Lock()
+
+    def response_hook(self, response: Any, *args: Any, **kwargs: Any) -> None:
+        """requests ``response`` hook counting one HTTP exchange."""
+        if kwargs.get("stream"):
+            size = int(response.headers.get("Content-Length") or 0)
+        else:
+            size = len(response.content or b"")
+        wait = getattr(response, "rate_limit_wait", 0.0)
+        elapsed = max(response.elapsed.total_seconds() - wait, 0.0)
+        with self._lock:
+            self.requests += 1
+            if response.status_code >= 400:
+                self.request_errors += 1
+            self.bytes += size
+            self.network_seconds += elapsed
+            self.wait_seconds += wait
+            self.request_latency.observe(elapsed)
+
+    def record_refresh(
+        self, duration: float, network: float, success: bool, wait: float = 0.0
+    ) -> None:
+        """Record one refresh of ``duration`` seconds.
+
+        ``network`` of them were spent on responses and ``wait`` paced by the
+        rate limiter, neither counts as parsing time.
+        """
+        with self._lock:
+            self.refreshes += 1
+            if not success:
+                self.refresh_errors += 1
+            self.refresh_latency.observe(duration)
+            self.parse_seconds += max(duration - network - wait, 0.0)
+
+    def record_rows(self, rows: int) -> None:
+        if rows > 0:
+            with self._lock:
+                self.rows += rows
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "request_errors": self.request_errors,
+                "bytes": self.bytes,
+                "network_seconds": self.network_seconds,
+                "wait_seconds": self.wait_seconds,
+                "request_latency": self.request_latency.as_dict(),
+                "refreshes": self.refreshes,
+                "refresh_errors": self.refresh_errors,
+                "refresh_latency": self.refresh_latency.as_dict(),
+                "parse_seconds": self.parse_seconds,
+                "rows": self.rows,
+            }
+
+
+_COUNTERS = {
+    "requests": ("btcpriceticker_requests_total", "HTTP requests sent"),
+    "request_errors": (
+        "btcpriceticker_request_errors_total",
+        "HTTP responses with an error status",
+    ),
+    "bytes": ("btcpriceticker_response_bytes_total", "Response body bytes received"),
+    "network_seconds": (
+        "btcpriceticker_network_seconds_total",
+        "Seconds spent waiting on responses",
+    ),
+    "wait_seconds": (
+        "btcpriceticker_rate_limit_wait_seconds_total",
+        "Seconds requests were held back by the rate limiter",
+    ),
+    "refreshes": ("btcpriceticker_refreshes_total", "Upstream refreshes"),
+    "refresh_errors": ("btcpriceticker_refresh_errors_total", "Failed refreshes"),
+    "parse_seconds": (
+        "btcpriceticker_parse_seconds_total",
+        "Seconds of refreshes not spent on responses or rate limiting",
+    ),
+    "rows": ("btcpriceticker_rows_ingested_total", "History and candle rows ingested"),
+}
+_HISTOGRAMS = {
+    "request_latency": (
+        "btcpriceticker_request_latency_seconds",
+        "HTTP request latency",
+    ),
+    "refresh_latency": (
+        "btcpriceticker_refresh_latency_seconds",
+        "Duration of upstream refreshes",
+    ),
+}
+
+
+def format_prometheus(stats: dict[str, Any]) -> str:
+    """Render the output of ``Price.stats()`` in the Prometheus text format."""
+    services = stats.get("services", {})
+    lines = []
+    for key, (name, help_text) in _COUNTERS.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        for service, values in services.items():
+            lines.append(f'{name}{{service="{service}"}} {values[key]:g}')
+    for key, (name, help_text) in _HISTOGRAMS.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        for service, values in services.items():
+            histogram = values[key]
+            for bound, count in histogram["buckets"].items():
+                lines.append(
+                    f'{name}_bucket{{service="{service}",le="{bound}"}} {count}'
+                )
+            lines.append(f'{name}_sum{{service="{service}"}} {histogram["sum"]:g}')
+            lines.append(f'{name}_count{{service="{service}"}} {histogram["count"]}')
+    refresh = stats.get("refresh", {})
+    for key in ("checks", "cache_hits", "shared_cache_hits"):
+        name = f"btcpriceticker_refresh_{key}_total"
+        lines += [f"# TYPE {name} counter", f"{name} {refresh.get(key, 0)}"]
+    return "\n".join(lines) + "\n"
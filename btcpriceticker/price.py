@@ -1,20 +1,47 @@
 import logging
+import time
+from collections.abc import Iterable
 from datetime import datetime, timezone
-from typing import Optional
+from typing import IO, Any, Optional, Union
 
+import numpy as np
+
+from . import tracing
 from .binance import Binance
 from .bit2me import Bit2Me
 from .bitvavo import Bitvavo
 from .coinbase import Coinbase
-from .coingecko import CoinGecko
-from .coinpaprika import CoinPaprika
+from .coingecko import COINGECKO_IDS, CoinGecko
+from .coinpaprika import COINPAPRIKA_IDS, CoinPaprika
+from .export import DEFAULT_CHUNK_SIZE, export_frame
+from .health import ServiceHealth
+from .interchange import frame_to_arrow
 from .kraken import Kraken
 from .mempool import Mempool
-from .price_timeseries import PriceTimeSeries
+from .price_timeseries import AssetPriceTable, PriceTimeSeries
+from .scheduler import RefreshScheduler
 from .service import Service
+from .shared_cache import SharedQuoteCache
 
 logger = logging.getLogger(__name__)
 
+FIAT_SYMBOLS = {
+    "eur": "€",
+    "usd": "$",
+    "gbp": "£",
+    "jpy": "¥",
+    "chf": "CHF",
+    "cad": "C$",
+    "aud": "A$",
+    "mxn": "$",
+    "brl": "R$",
+    "inr": "₹",
+    "cny": "¥",
+    "cnh": "¥",
+    "sek": "kr",
+    "nzd": "NZ$",
+}
+
 
 class Price:
     def __init__(
@@ -28,8 +55,22 @@ class Price:
         enable_ohlcv: bool = False,
         enable_ohlc: bool = False,
         enable_timeseries: bool = True,
+        shared_cache: Optional[SharedQuoteCache] = None,
+        scheduler: Optional[RefreshScheduler] = None,
+        fiats: Optional[Iterable[str]] = None,
+        price_dtype: str = "float64",
+        base_asset: str = "BTC",
+        base_assets: Optional[Iterable[str]] = None,
     ) -> None:
         self.days_ago = days_ago
+        # float32 halves the memory of the history and candle stores
+        self.price_dtype = price_dtype
+        # The main fiat first, then the extra fiats quoted on every refresh
+        self.fiats = list(dict.fromkeys(f.lower() for f in [fiat, *(fiats or [])]))
+        # The main base asset first, then the extra assets quoted in bulk
+        self.base_assets = list(
+            dict.fromkeys(a.upper() for a in [base_asset, *(base_assets or [])])
+        )
         self.interval = interval
         self.available_services = [
             "mempool",
@@ -43,8 +84,13 @@ class Price:
         ]
         if service not in self.available_services:
             raise ValueError("Wrong service!")
+        if not self.supports_asset(service):
+            raise ValueError(f"Service '{service}' does not quote {base_asset}")
         self.services: dict[str, Service] = {}
+        self.health: dict[str, ServiceHealth] = {}
         self.service = service
+        # Preferred service while refreshes fall back to another one
+        self._fallback_from: Optional[str] = None
         self.enable_ohlcv = enable_ohlcv or enable_ohlc
         self.set_service(
             service,
@@ -60,6 +106,14 @@ class Price:
         self.enable_ohlc = enable_ohlc
         self.enable_ohlcv = enable_ohlcv
         self.enable_timeseries = enable_timeseries
+        self.shared_cache = shared_cache
+        self.scheduler = scheduler
+        if scheduler is not None:
+            scheduler.raise_floor(min_refresh_time)
+        # update_service calls and how many were answered without a fetch
+        self.refresh_checks = 0
+        self.cache_hits = 0
+        self.shared_cache_hits = 0
 
     def set_next_service(self, next_service: Optional[str] = None) -> None:
         fiat = self.fiat
@@ -70,21 +124,16 @@ class Price:
         enable_ohlcv = self.enable_ohlcv
         enable_timeseries = self.enable_timeseries
         if next_service is None:
-            rotation = [
-                "mempool",
-                "coingecko",
-                "coinpaprika",
-                "kraken",
-                "binance",
-                "coinbase",
-                "bitvavo",
-                "bit2me",
-            ]
-            try:
-                current_index = rotation.index(service_name)
-            except ValueError:
-                current_index = -1
-            next_service = rotation[(current_index + 1) % len(rotation)]
+            ranked = self.rank_services()
+            if ranked:
+                next_service = ranked[0]
+            else:
+                rotation = self.available_services
+                try:
+                    current_index = rotation.index(service_name)
+                except ValueError:
+                    current_index = -1
+                next_service = rotation[(current_index + 1) % len(rotation)]
 
         self.set_service(
             next_service,
@@ -109,25 +158,32 @@ class Price:
         if service_name in self.services:
             self.service = service_name
             return
+        if not self.supports_asset(service_name):
+            raise ValueError(
+                f"Service '{service_name}' does not quote {self.base_assets[0]}"
+            )
 
+        base_asset = self.base_assets[0]
         service_instance: Optional[Service] = None
         if service_name == "coingecko":
             service_instance = CoinGecko(
                 fiat,
-                whichcoin="bitcoin",
+                whichcoin=COINGECKO_IDS[base_asset],
                 days_ago=days_ago,
                 enable_ohlc=enable_ohlc,
                 enable_timeseries=enable_timeseries,
                 enable_ohlcv=enable_ohlcv,
+                base_asset=base_asset,
             )
         elif service_name == "coinpaprika":
             service_instance = CoinPaprika(
                 fiat,
-                whichcoin="btc-bitcoin",
+                whichcoin=COINPAPRIKA_IDS[base_asset],
                 interval=interval,
                 enable_ohlc=enable_ohlc,
                 enable_timeseries=enable_timeseries,
                 enable_ohlcv=enable_ohlcv,
+                base_asset=base_asset,
             )
         elif service_name == "mempool":
             service_instance = Mempool(
@@ -141,7 +197,7 @@ class Price:
         elif service_name == "kraken":
             service_instance = Kraken(
                 fiat,
-                base_asset="BTC",
+                base_asset=base_asset,
                 interval=interval,
                 days_ago=days_ago,
                 enable_ohlc=enable_ohlc,
@@ -151,7 +207,7 @@ class Price:
         elif service_name == "binance":
             service_instance = Binance(
                 fiat,
-                base_asset="BTC",
+                base_asset=base_asset,
                 interval=interval,
                 days_ago=days_ago,
                 enable_ohlc=enable_ohlc,
@@ -161,7 +217,7 @@ class Price:
         elif service_name == "coinbase":
             service_instance = Coinbase(
                 fiat,
-                base_asset="BTC",
+                base_asset=base_asset,
                 interval=interval,
                 days_ago=days_ago,
                 enable_ohlc=enable_ohlc,
@@ -171,7 +227,7 @@ class Price:
         elif service_name == "bitvavo":
             service_instance = Bitvavo(
                 fiat,
-                base_asset="BTC",
+                base_asset=base_asset,
                 interval=interval,
                 days_ago=days_ago,
                 enable_ohlc=enable_ohlc,
@@ -181,7 +237,7 @@ class Price:
         elif service_name == "bit2me":
             service_instance = Bit2Me(
                 fiat,
-                base_asset="BTC",
+                base_asset=base_asset,
                 interval=interval,
                 days_ago=days_ago,
                 enable_ohlc=enable_ohlc,
@@ -191,49 +247,268 @@ class Price:
 
         if service_instance is None:
             raise ValueError(f"Unsupported service '{service_name}'")
+        service_instance.set_extra_fiats(self.fiats[1:])
+        service_instance.set_extra_assets(self.base_assets[1:])
+        service_instance.set_price_dtype(self.price_dtype)
 
         self.service = service_name
         self.services[service_name] = service_instance
 
+    def supports_asset(self, service_name: str) -> bool:
+        """Return whether ``service_name`` can quote the main base asset."""
+        asset = self.base_assets[0]
+        if service_name == "mempool":
+            return asset == "BTC"
+        if service_name == "coingecko":
+            return asset in COINGECKO_IDS
+        if service_name == "coinpaprika":
+            return asset in COINPAPRIKA_IDS
+        return True
+
     def _fetch_prices(self):
         """Fetch prices and OHLCV data from Service."""
         if self.service not in self.services:
             self.set_next_service()
         self.services[self.service].update()
 
+    def get_health(self, service_name: Optional[str] = None) -> ServiceHealth:
+        """Return the health tracker of ``service_name`` (default: active)."""
+        service_name = service_name or self.service
+        if service_name not in self.health:
+            self.health[service_name] = ServiceHealth()
+        return self.health[service_name]
+
+    def get_service_health(self) -> dict[str, dict]:
+        return {name: health.as_dict() for name, health in self.health.items()}
+
+    def rank_services(self, now: Optional[float] = None) -> list[str]:
+        """Return the other services by health score, skipping open circuits.
+
+        Ties keep the fixed rotation order starting after the active service.
+        """
+        now = time.time() if now is None else now
+        rotation = self.available_services
+        try:
+            current_index = rotation.index(self.service)
+        except ValueError:
+            current_index = -1
+        ordered = rotation[current_index + 1 :] + rotation[: current_index + 1]
+        candidates = [
+            name
+            for name in ordered
+            if name != self.service
+            and self.supports_asset(name)
+            and self.get_health(name).available(now)
+        ]
+        return sorted(candidates, key=lambda name: -self.get_health(name).score(now))
+
+    @tracing.traced(
+        "price.refresh", lambda self: {"service": self.service, "fiat": self.fiat}
+    )
     def refresh(self):
         """Refresh the price data if necessary."""
+        if self._fallback_from is not None:
+            if self.get_health(self._fallback_from).available():
+                self.set_next_service(next_service=self._fallback_from)
+                self._fallback_from = None
         count = 0
         refresh_sucess = self.update_service()
         old_service_name = self.service
+        tried = {old_service_name}
         while not refresh_sucess and count < 3:
-            self.set_next_service()
+            candidates = [name for name in self.rank_services() if name not in tried]
+            if not candidates:
+                break
+            self.set_next_service(candidates[0])
+            tried.add(self.service)
             refresh_sucess = self.update_service()
             count += 1
 
+        if refresh_sucess and not self.get_health(old_service_name).available():
+            # Stay on the working service until the preferred one can be probed
+            if self.service != old_service_name:
+                self._fallback_from = self._fallback_from or old_service_name
+            return refresh_sucess
         self.set_next_service(next_service=old_service_name)
         return refresh_sucess
 
+    @tracing.traced(
+        "price.update_service",
+        lambda self: {"service": self.service, "fiat": self.fiat},
+    )
     def update_service(self):
         now = datetime.now(timezone.utc)
         current_time = now.timestamp()
 
-        if (
-            "timestamp" in self.price
-            and current_time - self.price["timestamp"] < self.min_refresh_time
-        ):
+        self.refresh_checks += 1
+        if self.scheduler is not None:
+            self.scheduler.record_demand(current_time)
+        if self._is_fresh(current_time):
+            self.cache_hits += 1
+            tracing.current_span().set_attribute("outcome", "cache")
+            return True
+
+        shared_cache = self._active_shared_cache()
+        if shared_cache is not None and self._load_shared_quote(shared_cache):
+            self.shared_cache_hits += 1
+            tracing.current_span().set_attribute("outcome", "shared_cache")
             return True
 
-        logger.info("Fetching price data...")
         try:
-            self._fetch_prices()
+            if not self.get_health().allow_request(current_time):
+                logger.info("Skipping %s while its circuit is open", self.service)
+                tracing.current_span().set_attribute("outcome", "circuit_open")
+                return False
+            logger.info("Fetching price data...")
+            self._fetch_with_health()
+            tracing.current_span().set_attribute("outcome", "fetched")
+            self._plan_next_refresh()
+            if shared_cache is not None:
+                self._publish_shared_quotes(shared_cache)
             return True
         except Exception as e:
             logger.warning(f"Failed to fetch from  {self.service}: {str(e)}")
+        finally:
+            if shared_cache is not None:
+                shared_cache.release_refresh(
+                    self.service, self.fiat, self.base_assets[0]
+                )
         return False
 
-    def get_price_list(self):
-        return self.services[self.service].get_price_list()
+    def _is_fresh(self, current_time: float) -> bool:
+        """Return True while the last quote is younger than the refresh interval."""
+        return (
+            "timestamp" in self.price
+            and current_time - self.price["timestamp"] < self.get_refresh_interval()
+        )
+
+    def _fetch_with_health(self) -> None:
+        """Fetch from the active service and record the outcome in its health."""
+        if self.service not in self.services:
+            self.set_next_service()
+        health = self.get_health()
+        metrics = self.services[self.service].metrics
+        network_before = metrics.network_seconds
+        wait_before = metrics.wait_seconds
+        started = time.monotonic()
+        try:
+            self._fetch_prices()
+        except Exception:
+            elapsed = time.monotonic() - started
+            health.record_failure(elapsed)
+            metrics.record_refresh(
+                elapsed,
+                metrics.network_seconds - network_before,
+                False,
+                metrics.wait_seconds - wait_before,
+            )
+            raise
+        elapsed = time.monotonic() - started
+        health.record_success(elapsed)
+        metrics.record_refresh(
+            elapsed,
+            metrics.network_seconds - network_before,
+            True,
+            metrics.wait_seconds - wait_before,
+        )
+
+    def stats(self) -> dict:
+        """Return refresh counters and the request metrics of every service."""
+        answered = self.cache_hits + self.shared_cache_hits
+        return {
+            "refresh": {
+                "checks": self.refresh_checks,
+                "cache_hits": self.cache_hits,
+                "shared_cache_hits": self.shared_cache_hits,
+                "hit_rate": answered / self.refresh_checks
+                if self.refresh_checks
+                else 0.0,
+            },
+            "services": {
+                name: service.metrics.as_dict()
+                for name, service in self.services.items()
+            },
+        }
+
+    def _plan_next_refresh(self) -> None:
+        if self.scheduler is None:
+            return
+        service = self.services[self.service]
+        self.scheduler.plan(
+            self.price["timestamp"],
+            service.price_history.data["price"].to_numpy(dtype="float64"),
+            budget=service.request_budget(),
+        )
+
+    def get_refresh_interval(self) -> float:
+        """Return the seconds a fetched quote is considered fresh."""
+        if self.scheduler is None:
+            return self.min_refresh_time
+        return self.scheduler.interval
+
+    def next_refresh_time(self) -> float:
+        """Return the epoch time of the next planned upstream fetch."""
+        return self.get_timestamp() + self.get_refresh_interval()
+
+    def _active_shared_cache(self) -> Optional[SharedQuoteCache]:
+        """Only quote-only instances can be served from the shared snapshot."""
+        if self.enable_timeseries or self.enable_ohlc or self.enable_ohlcv:
+            return None
+        return self.shared_cache
+
+    def _publish_shared_quotes(self, cache: SharedQuoteCache) -> None:
+        """Share the fetched quotes, skipping the 0.0 placeholders of failed ones."""
+        asset = self.base_assets[0]
+        if self.price.get("fiat"):
+            cache.put(self.service, self.fiat, self.price, asset)
+        for code, quote in self.services[self.service].quotes.items():
+            if quote.get("fiat"):
+                cache.put(self.service, code, quote, asset)
+
+    def _load_shared_quote(self, cache: SharedQuoteCache) -> bool:
+        """Reuse a fresh quote of another process, or take the refresh lease."""
+        max_age = self.get_refresh_interval()
+        asset = self.base_assets[0]
+        entry = cache.get_fresh(self.service, self.fiat, max_age, asset)
+        if entry is None and not cache.acquire_refresh(self.service, self.fiat, asset):
+            entry = cache.wait_for_fresh(self.service, self.fiat, max_age, asset=asset)
+        if entry is None:
+            return False
+        logger.debug("Using shared quote for %s/%s/%s", self.service, asset, self.fiat)
+        service = self.services[self.service]
+        with service.price_lock:
+            service.price.update(entry)
+        service.append_current_price(entry["fiat"])
+        return True
+
+    def start_stream(self, **kwargs) -> None:
+        """Push live prices of the active service from its WebSocket feed."""
+        self.services[self.service].start_stream(**kwargs)
+
+    def stop_stream(self) -> None:
+        for service in self.services.values():
+            service.stop_stream()
+
+    def get_ticks(self) -> list[tuple[float, float]]:
+        """Return the latest stream ticks of the active service."""
+        return self.services[self.service].get_ticks()
+
+    def get_price_list(
+        self, max_points: Optional[int] = None, method: str = "lttb"
+    ) -> list[float]:
+        """Return the prices of the ``days_ago`` window.
+
+        ``max_points`` downsamples to at most that many points for small
+        displays, with "lttb" (shape preserving) or "minmax" (bucket extremes).
+        """
+        return self.services[self.service].get_price_list(max_points, method)
+
+    def get_price_array(
+        self, max_points: Optional[int] = None, method: str = "lttb"
+    ) -> np.ndarray:
+        """Like ``get_price_list`` as a read-only array, cached until new prices
+        arrive."""
+        return self.services[self.service].get_price_array(max_points, method)
 
     def get_timeseries_list(self):
         return self.get_price_list()
@@ -254,6 +529,106 @@ class Price:
     def ohlcv(self):
         return self.services[self.service].ohlcv
 
+    def get_indicators(self, dataset: str = "history") -> dict[str, Any]:
+        """Return SMA, EMA, RSI, Bollinger bands (and ATR) of history or ohlcv.
+
+        The indicators are updated incrementally with the rows added since
+        the previous call, see ``btcpriceticker.indicators``.
+        """
+        if dataset == "history":
+            return self.timeseries.get_indicators()
+        if dataset != "ohlcv":
+            raise ValueError(f"Unknown dataset '{dataset}'")
+        return self.services[self.service].get_ohlcv_indicators()
+
+    def get_ohlcv_timeframe(self, timeframe: str) -> Any:
+        """Return the OHLCV candles aggregated to ``timeframe``, e.g. '4h' or '1w'."""
+        return self.services[self.service].get_ohlcv_timeframe(timeframe)
+
+    def get_sync_cursors(self) -> dict[tuple[str, str, str], dict[str, float]]:
+        """Return the per-dataset cursors of every cached service."""
+        return {
+            service.sync_key: dict(service.sync_cursors)
+            for service in self.services.values()
+        }
+
+    def get_quotes(self) -> dict[str, dict[str, float]]:
+        """Return the price dict of every configured fiat fetched so far."""
+        service = self.services[self.service]
+        quotes = {}
+        for fiat in self.fiats:
+            quote = service.get_quote(fiat)
+            if quote is not None:
+                quotes[fiat.upper()] = quote
+        return quotes
+
+    def get_asset_quotes(self) -> dict[str, dict[str, float]]:
+        """Return the price dict of every configured base asset fetched so far."""
+        service = self.services[self.service]
+        quotes = {}
+        for asset in self.base_assets:
+            quote = service.get_asset_quote(asset)
+            if quote is not None:
+                quotes[asset] = quote
+        return quotes
+
+    def asset_view(self, asset: str) -> "AssetView":
+        """Return a per-asset view sharing the storage of this instance."""
+        if asset.upper() not in self.base_assets:
+            raise ValueError(f"Asset '{asset}' is not quoted by this Price")
+        return AssetView(self, asset)
+
+    @property
+    def asset_history(self) -> AssetPriceTable:
+        """Prices of all base assets, one column per asset."""
+        return self.services[self.service].asset_history
+
+    def view(self, fiat: str) -> "FiatView":
+        """Return a per-fiat view sharing the storage of this instance."""
+        if fiat.lower() not in self.fiats:
+            raise ValueError(f"Fiat '{fiat}' is not quoted by this Price")
+        return FiatView(self, fiat)
+
+    def export(
+        self,
+        dataset: str = "history",
+        fmt: str = "csv",
+        output: Optional[Union[str, IO]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Write a dataset as csv, jsonl, parquet or arrow.
+
+        ``dataset`` is history, assets (all base assets), ohlc or ohlcv.
+        Returns the number of rows written, see ``export.export_frame``.
+        """
+        frames = {
+            "history": self.timeseries.data,
+            "assets": self.asset_history.data,
+            "ohlc": self.ohlc,
+            "ohlcv": self.ohlcv,
+        }
+        if dataset not in frames:
+            raise ValueError(f"Unknown dataset '{dataset}'")
+        return export_frame(frames[dataset], fmt, output, chunk_size=chunk_size)
+
+    def memory_usage(self) -> dict[str, dict[str, int]]:
+        """Return the bytes held by the stores of every instantiated service."""
+        return {name: service.memory_usage() for name, service in self.services.items()}
+
+    def to_arrow(self, dataset: str = "ohlcv") -> Any:
+        """Return the history, assets, ohlc or ohlcv data as a zero copy Table.
+
+        The table implements ``__arrow_c_stream__`` and ``__dataframe__``, so
+        Polars and DuckDB can consume it without serialization.
+        """
+        if dataset == "history":
+            return self.timeseries.to_arrow()
+        if dataset == "assets":
+            return self.asset_history.to_arrow()
+        if dataset not in ("ohlc", "ohlcv"):
+            raise ValueError(f"Unknown dataset '{dataset}'")
+        return frame_to_arrow(getattr(self, dataset))
+
     def set_days_ago(self, days_ago: int) -> None:
         self.days_ago = days_ago
         for service in self.services:
@@ -268,23 +643,7 @@ class Price:
     def get_fiat_symbol(self) -> str:
         """Return the symbol of the fiat currency."""
         fiat = self.get_fiat_currency().lower()
-        symbols = {
-            "eur": "€",
-            "usd": "$",
-            "gbp": "£",
-            "jpy": "¥",
-            "chf": "CHF",
-            "cad": "C$",
-            "aud": "A$",
-            "mxn": "$",
-            "brl": "R$",
-            "inr": "₹",
-            "cny": "¥",
-            "cnh": "¥",
-            "sek": "kr",
-            "nzd": "NZ$",
-        }
-        return symbols.get(fiat, fiat)
+        return FIAT_SYMBOLS.get(fiat, fiat)
 
     def get_fiat_price(self) -> float:
         return self.price["fiat"]
@@ -301,11 +660,157 @@ class Price:
     def get_timestamp(self) -> float:
         return self.price["timestamp"]
 
+    def get_snapshot(self) -> dict:
+        """Return the current quote as a JSON serializable dict."""
+        snapshot = {
+            "service": self.service,
+            "fiat": self.get_fiat_currency(),
+            "price": self.price["fiat"],
+            "usd": self.price["usd"],
+            "sat_fiat": self.price["sat_fiat"],
+            "sat_usd": self.price["sat_usd"],
+            "timestamp": self.price["timestamp"],
+        }
+        if len(self.fiats) > 1:
+            snapshot["quotes"] = {
+                code: quote["fiat"] for code, quote in self.get_quotes().items()
+            }
+        if len(self.base_assets) > 1:
+            snapshot["assets"] = {
+                asset: quote["fiat"] for asset, quote in self.get_asset_quotes().items()
+            }
+        return snapshot
+
     def get_price_now(self) -> str:
-        self.update_service()
+        # Reading a fresh quote is not a refresh check, only count real ones
+        if not self._is_fresh(datetime.now(timezone.utc).timestamp()):
+            self.update_service()
         price_now = self.price["fiat"]
         return f"{price_now:,.0f}" if price_now > 1000 else f"{price_now:.5g}"
 
     @property
     def timeseries(self) -> PriceTimeSeries:
         return self.services[self.service].price_history
+
+
+class FiatView:
+    """Quotes of one fiat of a multi-fiat Price.
+
+    The view owns no data: quotes come from the active service of the Price
+    and the price history of the main fiat is scaled by the current rate.
+    """
+
+    def __init__(self, price: Price, fiat: str):
+        self._price = price
+        self.fiat = fiat.lower()
+
+    @property
+    def price(self) -> dict[str, float]:
+        service = self._price.services[self._price.service]
+        quote = service.get_quote(self.fiat)
+        if quote is None:
+            return {
+                "usd": 0.0,
+                "sat_usd": 0.0,
+                "fiat": 0.0,
+                "sat_fiat": 0.0,
+                "timestamp": 0.0,
+            }
+        return quote
+
+    def get_fiat_currency(self) -> str:
+        return self.fiat.upper()
+
+    def get_fiat_symbol(self) -> str:
+        return FIAT_SYMBOLS.get(self.fiat, self.fiat)
+
+    def get_fiat_price(self) -> float:
+        return self.price["fiat"]
+
+    def get_usd_price(self) -> float:
+        return self.price["usd"]
+
+    def get_sats_per_fiat(self) -> float:
+        return 1e8 / self.price["fiat"]
+
+    def get_timestamp(self) -> float:
+        return self.price["timestamp"]
+
+    def get_price_list(
+        self, max_points: Optional[int] = None, method: str = "lttb"
+    ) -> list[float]:
+        main_price = self._price.price["fiat"]
+        if not main_price or not self.price["fiat"]:
+            return []
+        rate = self.price["fiat"] / main_price
+        if max_points is not None:
+            return (self._price.get_price_array(max_points, method) * rate).tolist()
+        return [value * rate for value in self._price.get_price_list()]
+
+    def get_snapshot(self) -> dict:
+        price = self.price
+        return {
+            "service": self._price.service,
+            "fiat": self.get_fiat_currency(),
+            "price": price["fiat"],
+            "usd": price["usd"],
+            "sat_fiat": price["sat_fiat"],
+            "sat_usd": price["sat_usd"],
+            "timestamp": price["timestamp"],
+        }
+
+
+class AssetView:
+    """Quotes of one base asset of a multi-asset Price.
+
+    Quotes come from the bulk request of the active service and the price
+    list from its shared asset table, which every refresh appends to.
+    """
+
+    def __init__(self, price: Price, asset: str):
+        self._price = price
+        self.asset = asset.upper()
+
+    @property
+    def price(self) -> dict[str, float]:
+        service = self._price.services[self._price.service]
+        quote = service.get_asset_quote(self.asset)
+        if quote is None:
+            return {
+                "usd": 0.0,
+                "sat_usd": 0.0,
+                "fiat": 0.0,
+                "sat_fiat": 0.0,
+                "timestamp": 0.0,
+            }
+        return quote
+
+    def get_fiat_currency(self) -> str:
+        return self._price.get_fiat_currency()
+
+    def get_fiat_price(self) -> float:
+        return self.price["fiat"]
+
+    def get_usd_price(self) -> float:
+        return self.price["usd"]
+
+    def get_timestamp(self) -> float:
+        return self.price["timestamp"]
+
+    def get_price_list(
+        self, max_points: Optional[int] = None, method: str = "lttb"
+    ) -> list[float]:
+        return self._price.asset_history.get_price_list(
+            self.asset, self._price.days_ago, max_points, method
+        )
+
+    def get_snapshot(self) -> dict:
+        price = self.price
+        return {
+            "service": self._price.service,
+            "asset": self.asset,
+            "fiat": self.get_fiat_currency(),
+            "price": price["fiat"],
+            "usd": price["usd"],
+            "timestamp": price["timestamp"],
+        }
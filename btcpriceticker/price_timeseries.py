@@ -1,24 +1,88 @@
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
+from .decode import OHLCV_COLUMNS, empty_frame
+from .downsample import DownsampleCache, downsample
+from .indicators import IndicatorEngine, default_indicators
+from .interchange import frame_to_arrow
+
+TIMESTAMP_DTYPE = "datetime64[ns, UTC]"
+# Supported price dtypes, float32 halves the memory of long histories
+PRICE_DTYPES = ("float64", "float32")
+
+
+def empty_price_frame(price_dtype: str = "float64") -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.Series(dtype=TIMESTAMP_DTYPE),
+            "price": pd.Series(dtype=price_dtype),
+        }
+    )
+
 
 class PriceTimeSeries:
-    def __init__(self):
-        self.data = pd.DataFrame(columns=["timestamp", "price"])
+    def __init__(self, price_dtype: str = "float64"):
+        if price_dtype not in PRICE_DTYPES:
+            raise ValueError(f"Unsupported price dtype '{price_dtype}'")
+        self.price_dtype = price_dtype
+        self.data = empty_price_frame(price_dtype)
+        self.indicators = IndicatorEngine(default_indicators())
+        self.downsampled = DownsampleCache()
+
+    def _coerce(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Return the timestamp and price columns of ``frame`` in the store dtypes."""
+        timestamp = frame["timestamp"]
+        price = frame["price"]
+        if timestamp.dtype == TIMESTAMP_DTYPE and price.dtype == self.price_dtype:
+            return frame[["timestamp", "price"]]
+        if timestamp.dtype != TIMESTAMP_DTYPE:
+            timestamp = pd.to_datetime(timestamp, utc=True).astype(TIMESTAMP_DTYPE)
+        if price.dtype != self.price_dtype:
+            price = pd.to_numeric(price, errors="coerce").astype(self.price_dtype)
+        return pd.DataFrame(
+            {
+                "timestamp": timestamp.reset_index(drop=True),
+                "price": price.reset_index(drop=True),
+            }
+        )
+
+    def set_price_dtype(self, price_dtype: str) -> None:
+        """Store prices as ``price_dtype`` from now on, converting existing rows."""
+        if price_dtype not in PRICE_DTYPES:
+            raise ValueError(f"Unsupported price dtype '{price_dtype}'")
+        self.price_dtype = price_dtype
+        self.data = self._coerce(self.data)
+
+    def memory_usage(self) -> int:
+        """Return the bytes used by the stored rows."""
+        return int(self.data.memory_usage(index=True, deep=True).sum())
 
     def add_price(self, timestamp: datetime, price: float) -> None:
         """Add a new price point to the time series."""
-        new_data = pd.DataFrame([[timestamp, price]], columns=["timestamp", "price"])
+        new_data = self._coerce(
+            pd.DataFrame({"timestamp": [timestamp], "price": [price]})
+        )
         if not self.data.empty:
             self.data = pd.concat([self.data, new_data], ignore_index=True)
         else:
             self.data = new_data.reset_index(drop=True)
 
-    def get_price_list(self, days: Optional[int] = None) -> list[float]:
-        """Return the time series as a list of (timestamp, price) tuples,
-        optionally filtered by the last `days` days."""
+    def get_price_list(
+        self,
+        days: Optional[int] = None,
+        max_points: Optional[int] = None,
+        method: str = "lttb",
+    ) -> list[float]:
+        """Return the prices, optionally filtered by the last `days` days.
+
+        With ``max_points`` at most that many points are returned, picked by
+        ``method`` ("lttb" or "minmax"), see ``get_price_array``.
+        """
+        if max_points is not None:
+            return self.get_price_array(days, max_points, method).tolist()
         if days is not None:
             cutoff = datetime.now(timezone.utc) - timedelta(days=days)
             filtered_data = self.data[self.data["timestamp"] >= cutoff]
@@ -26,9 +90,17 @@ class PriceTimeSeries:
             filtered_data = self.data
         return filtered_data.loc[:, "price"].values.tolist()
 
-    def get_timestamp_list(self, days: Optional[int] = None) -> list[float]:
-        """Return the time series as a list of (timestamp, price) tuples,
-        optionally filtered by the last `days` days."""
+    def get_timestamp_list(
+        self,
+        days: Optional[int] = None,
+        max_points: Optional[int] = None,
+        method: str = "lttb",
+    ) -> list[float]:
+        """Return the timestamps as epoch seconds, optionally filtered by the
+        last `days` days and downsampled like ``get_price_list``."""
+        if max_points is not None:
+            times = self._downsample(days, max_points, method)[0]
+            return (times / 1e9).tolist()
         if days is not None:
             cutoff = datetime.now(timezone.utc) - timedelta(days=days)
             filtered_data = self.data[self.data["timestamp"] >= cutoff]
@@ -36,6 +108,43 @@ class PriceTimeSeries:
             filtered_data = self.data
         return (filtered_data["timestamp"].astype("int64") / 1e9).values.tolist()
 
+    def get_price_array(
+        self,
+        days: Optional[int] = None,
+        max_points: Optional[int] = None,
+        method: str = "lttb",
+    ) -> np.ndarray:
+        """Return the prices as a read-only numpy array.
+
+        ``max_points`` downsamples to at most that many points for drawing:
+        "lttb" keeps the visual shape, "minmax" the minimum and maximum of
+        every bucket. The result is cached until the next append.
+        """
+        return self._downsample(days, max_points, method)[1]
+
+    def _downsample(
+        self, days: Optional[int], max_points: Optional[int], method: str
+    ) -> tuple[np.ndarray, np.ndarray]:
+        key = (days, max_points, method)
+        cached = self.downsampled.get(self.data, key)
+        if cached is not None:
+            return cached
+        data = self.get_data(days)
+        times = data["timestamp"].array.asi8
+        prices = data["price"].to_numpy()
+        if max_points is not None:
+            index = downsample(times, prices, max_points, method)
+            times, prices = times[index], prices[index]
+        times, prices = times.view(), prices.view()
+        times.flags.writeable = prices.flags.writeable = False
+        return self.downsampled.put(key, (times, prices))
+
+    def get_last_timestamp(self) -> Optional[float]:
+        """Return the newest timestamp in the series as epoch seconds."""
+        if self.data.empty:
+            return None
+        return pd.Timestamp(self.data["timestamp"].max()).timestamp()
+
     def get_data(self, days: Optional[int] = None) -> pd.DataFrame:
         """Return the time series as a Pandas DataFrame,
         optionally filtered by the last `days` days."""
@@ -44,6 +153,28 @@ class PriceTimeSeries:
             return self.data[self.data["timestamp"] >= cutoff]
         return self.data
 
+    def get_indicators(self) -> dict[str, Any]:
+        """Return the latest indicator values over the prices.
+
+        Only the rows added since the previous call are folded in.
+        """
+        prices = self.data["price"].to_numpy()
+        return self.indicators.update(
+            self.data["timestamp"].array.asi8, prices, prices, prices
+        )
+
+    def to_arrow(self) -> Any:
+        """Return the series as a pyarrow Table sharing the column buffers."""
+        return frame_to_arrow(self.data)
+
+    def __arrow_c_stream__(self, requested_schema: Any = None) -> Any:
+        """Arrow PyCapsule stream, e.g. for ``polars.DataFrame(series)``."""
+        return self.to_arrow().__arrow_c_stream__(requested_schema)
+
+    def __dataframe__(self, nan_as_null: bool = False, allow_copy: bool = True) -> Any:
+        """DataFrame interchange protocol, served by the Arrow table."""
+        return self.to_arrow().__dataframe__(nan_as_null, allow_copy)
+
     def append_dataframe(self, other_df: pd.DataFrame) -> None:
         """Append another dataframe containing timestamp
         and price columns to the time series."""
@@ -51,6 +182,7 @@ class PriceTimeSeries:
             raise ValueError("DataFrame must contain 'timestamp' and 'price' columns")
         if other_df.empty:
             return
+        other_df = self._coerce(other_df)
         if not self.data.empty:
             self.data = pd.concat([self.data, other_df], ignore_index=True)
         else:
@@ -80,7 +212,7 @@ class PriceTimeSeries:
             "Low", "Close", "Volume"]
         """
         if self.data.empty:
-            return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
+            return empty_frame(OHLCV_COLUMNS, self.price_dtype)
 
         df = self.data.copy()
         df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
@@ -92,3 +224,93 @@ class PriceTimeSeries:
 
         ohlcv_df = pd.concat([ohlc, volume], axis=1)
         return ohlcv_df.dropna(how="all")
+
+
+class AssetPriceTable:
+    """Prices of several base assets in one table with a column per asset.
+
+    Every bulk quote appends one row sharing its timestamp, assets missing
+    from a quote are NaN.
+    """
+
+    def __init__(self, price_dtype: str = "float64"):
+        if price_dtype not in PRICE_DTYPES:
+            raise ValueError(f"Unsupported price dtype '{price_dtype}'")
+        self.price_dtype = price_dtype
+        self.data = pd.DataFrame({"timestamp": pd.Series(dtype=TIMESTAMP_DTYPE)})
+        self.downsampled = DownsampleCache()
+
+    @property
+    def assets(self) -> list[str]:
+        return [column for column in self.data.columns if column != "timestamp"]
+
+    def set_price_dtype(self, price_dtype: str) -> None:
+        if price_dtype not in PRICE_DTYPES:
+            raise ValueError(f"Unsupported price dtype '{price_dtype}'")
+        self.price_dtype = price_dtype
+        self.data = self.data.astype(dict.fromkeys(self.assets, price_dtype))
+
+    def memory_usage(self) -> int:
+        return int(self.data.memory_usage(index=True, deep=True).sum())
+
+    def add_prices(self, timestamp: datetime, prices: dict[str, Optional[float]]):
+        """Append one row with the price of every asset in ``prices``."""
+        row = {"timestamp": pd.DatetimeIndex([timestamp]).astype(TIMESTAMP_DTYPE)}
+        for asset, price in prices.items():
+            value = np.nan if price is None else price
+            row[asset.upper()] = np.array([value], dtype=self.price_dtype)
+        new_data = pd.DataFrame(row)
+        if self.data.empty:
+            columns = list(dict.fromkeys([*self.data.columns, *new_data.columns]))
+            self.data = new_data.reindex(columns=columns)
+        else:
+            self.data = pd.concat([self.data, new_data], ignore_index=True)
+        self.data = self.data.astype(dict.fromkeys(self.assets, self.price_dtype))
+
+    def get_data(self, asset: str, days: Optional[int] = None) -> pd.DataFrame:
+        """Return the timestamp and price rows of ``asset``, without gaps."""
+        asset = asset.upper()
+        if asset not in self.data.columns:
+            return empty_price_frame(self.price_dtype)
+        data = self.data[["timestamp", asset]].rename(columns={asset: "price"})
+        if days is not None:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+            data = data[data["timestamp"] >= cutoff]
+        return data.dropna().reset_index(drop=True)
+
+    def get_price_list(
+        self,
+        asset: str,
+        days: Optional[int] = None,
+        max_points: Optional[int] = None,
+        method: str = "lttb",
+    ) -> list[float]:
+        if max_points is not None:
+            return self.get_price_array(asset, days, max_points, method).tolist()
+        return self.get_data(asset, days)["price"].tolist()
+
+    def get_price_array(
+        self,
+        asset: str,
+        days: Optional[int] = None,
+        max_points: Optional[int] = None,
+        method: str = "lttb",
+    ) -> np.ndarray:
+        """Return the prices of ``asset`` as a read-only numpy array, cached
+        until the next append, see ``PriceTimeSeries.get_price_array``."""
+        key = (asset.upper(), days, max_points, method)
+        cached = self.downsampled.get(self.data, key)
+        if cached is not None:
+            return cached
+        data = self.get_data(asset, days)
+        prices = data["price"].to_numpy()
+        if max_points is not None:
+            index = downsample(data["timestamp"].array.asi8, prices, max_points, method)
+            prices = prices[index]
+        prices = prices.view()
+        prices.flags.writeable = False
+        return self.downsampled.put(key, prices)
+
+    def to_arrow(self) -> Any:
+        """Return the table as a pyarrow Table sharing the column buffers."""
+        return frame_to_arrow(self.data)
@@ -0,0 +1,87 @@
+import cProfile
+import io
+import pstats
+import time
+from typing import Any
+
+# Imported first by the package, so this marks the start of the imports
+IMPORT_STARTED = time.perf_counter()
+
+
+class CommandProfile:
+    """Profile one CLI command with cProfile and split its wall time.
+
+    The wall time since the package import started is divided into imports,
+    upstream requests (the ``http.request`` spans, including the CPU spent
+    inside them on TLS and decoding), CPU outside the requests and the
+    remainder, e.g. sleeps. The parts add up to the wall time.
+    """
+
+    def __init__(self, path: str, top: int = 20, import_started: float = 0.0):
+        self.path = path
+        self.top = top
+        self.import_started = import_started or IMPORT_STARTED
+        self.profiler = cProfile.Profile()
+        self.started = 0.0
+        self.cpu_started = 0.0
+        self.network = 0.0
+        self.request_cpu = 0.0
+        self.rate_limit_wait = 0.0
+        self.requests = 0
+
+    def _on_span(self, span: Any) -> None:
+        if span.name == "http.request":
+            self.requests += 1
+            self.network += span.duration
+            self.request_cpu += span.cpu_time
+            self.rate_limit_wait += span.attributes.get("rate_limit_wait") or 0.0
+
+    def start(self) -> None:
+        from . import tracing
+
+        self.started = time.perf_counter()
+        self.cpu_started = time.process_time()
+        tracing.add_hook(self._on_span)
+        self.profiler.enable()
+
+    def stop(self) -> str:
+        """Stop profiling, write the pstats dump and return the summary."""
+        from . import tracing
+
+        self.profiler.disable()
+        tracing.remove_hook(self._on_span)
+        self.profiler.dump_stats(self.path)
+        return self.summary()
+
+    def split(self) -> dict[str, float]:
+        """Return the wall time so far and its import, network, cpu and other parts."""
+        now = time.perf_counter()
+        imports = max(self.started - self.import_started, 0.0)
+        command = now - self.started
+        cpu = max(time.process_time() - self.cpu_started - self.request_cpu, 0.0)
+        return {
+            "wall": imports + command,
+            "import": imports,
+            "network": self.network,
+            "cpu": cpu,
+            "other": command - self.network - cpu,
+        }
+
+    def summary(self) -> str:
+        parts = self.split()
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profiler, stream=stream)
+        stats.strip_dirs().sort_stats("cumulative").print_stats(self.top)
+        lines = [
+            f"Profile written to {self.path}",
+            f"wall {parts['wall']:.3f}s: import {parts['import']:.3f}s, "
+            f"network wait {parts['network']:.3f}s in {self.requests} requests "
+            f"(rate limit {self.rate_limit_wait:.3f}s), "
+            f"cpu {parts['cpu']:.3f}s, other {parts['other']:.3f}s",
+        ]
+        # Skip the pstats preamble up to the column header
+        report = stream.getvalue().splitlines()
+        header = next(
+            (i for i, line in enumerate(report) if "ncalls" in line), len(report)
+        )
+        return "\n".join(lines + report[header:]).rstrip() + "\n"
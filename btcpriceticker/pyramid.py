@@ -0,0 +1,98 @@
+from typing import Optional
+
+import pandas as pd
+
+from .decode import OHLCV_COLUMNS, coerce_candles, empty_frame
+
+TIMEFRAME_UNITS = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+# Buckets are aligned to a Monday midnight, so weeks start on Mondays
+BUCKET_ORIGIN = pd.Timestamp("1970-01-05", tz="UTC")
+AGGREGATIONS = {
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Volume": "sum",
+}
+
+
+def timeframe_to_seconds(timeframe: str) -> int:
+    """Convert a timeframe such as '15m', '4h', '1d' or '1w' to seconds."""
+    try:
+        value, unit = int(timeframe[:-1]), timeframe[-1].lower()
+        if value <= 0 or unit not in TIMEFRAME_UNITS:
+            raise ValueError
+    except (ValueError, IndexError) as exc:
+        raise ValueError(f"Invalid timeframe '{timeframe}'") from exc
+    return value * TIMEFRAME_UNITS[unit]
+
+
+def aggregate_candles(candles: pd.DataFrame, seconds: int) -> pd.DataFrame:
+    """Aggregate OHLCV candles into buckets of ``seconds``.
+
+    Buckets are labelled with their start and only contain the candles
+    inside them, empty buckets are dropped.
+    """
+    if candles.empty:
+        return empty_frame(OHLCV_COLUMNS, str(candles["Close"].dtype))
+    aggregations = {c: f for c, f in AGGREGATIONS.items() if c in candles.columns}
+    buckets = candles.resample(
+        pd.Timedelta(seconds=seconds),
+        origin=BUCKET_ORIGIN,
+        label="left",
+        closed="left",
+    ).agg(aggregations)
+    buckets = buckets[buckets["Open"].notna()]
+    return coerce_candles(buckets, str(candles["Close"].dtype))
+
+
+class CandlePyramid:
+    """Coarser timeframes aggregated from the fetched candles and cached.
+
+    ``mark_changed`` records the oldest base candle that changed; the next
+    ``get`` of a timeframe only re-aggregates the buckets from there on. A
+    cached timeframe without changes is returned as is.
+    """
+
+    def __init__(self) -> None:
+        self.levels: dict[int, pd.DataFrame] = {}
+        # Oldest changed base candle per cached level, None when up to date
+        self.changed: dict[int, Optional[pd.Timestamp]] = {}
+
+    def reset(self) -> None:
+        self.levels.clear()
+        self.changed.clear()
+
+    def mark_changed(self, since: pd.Timestamp) -> None:
+        """Note that the base candles from ``since`` on were added or replaced."""
+        for seconds, current in self.changed.items():
+            if current is None or since < current:
+                self.changed[seconds] = since
+
+    def get(self, base: pd.DataFrame, seconds: int) -> pd.DataFrame:
+        """Return the candles of ``base`` aggregated to ``seconds`` buckets."""
+        cached = self.levels.get(seconds)
+        if cached is not None and self.changed.get(seconds) is None:
+            return cached
+        if cached is None:
+            level = aggregate_candles(base, seconds)
+        else:
+            step = pd.Timedelta(seconds=seconds)
+            since = self.changed[seconds]
+            start = BUCKET_ORIGIN + ((since - BUCKET_ORIGIN) // step) * step
+            head = cached.iloc[: cached.index.searchsorted(start)]
+            tail = aggregate_candles(
+                base.iloc[base.index.searchsorted(start) :], seconds
+            )
+            level = pd.concat([head, tail]) if not head.empty else tail
+        self.levels[seconds] = level
+        self.changed[seconds] = None
+        return level
+
+    def memory_usage(self) -> int:
+        return int(
+            sum(
+                level.memory_usage(index=True, deep=True).sum()
+                for level in self.levels.values()
+            )
+        )
@@ -0,0 +1,270 @@
+import email.utils
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import tracing
+
+logger = logging.getLogger(__name__)
+
+# Sustained requests per second and burst size of the public APIs
+HOST_LIMITS: dict[str, tuple[float, int]] = {
+    "api.coingecko.com": (0.5, 5),
+    "pro-api.coingecko.com": (8.0, 10),
+    "api.coinpaprika.com": (1.0, 5),
+    "mempool.space": (1.0, 5),
+    "gateway.bit2me.com": (4.0, 10),
+    "api.kraken.com": (1.0, 15),
+    "api.binance.com": (20.0, 50),
+    "api.coinbase.com": (10.0, 30),
+    "api.bitvavo.com": (15.0, 30),
+}
+DEFAULT_LIMIT = (2.0, 5)
+# Wait used for a 429 response without a Retry-After header
+DEFAULT_PENALTY = 5.0
+# Longest wait for a request, a longer block fails it so Price can fail over
+MAX_WAIT = 60.0
+
+_REMAINING_HEADERS = ("x-ratelimit-remaining", "ratelimit-remaining")
+_LIMIT_HEADERS = ("x-ratelimit-limit", "ratelimit-limit")
+_RESET_HEADERS = ("x-ratelimit-reset", "ratelimit-reset")
+_USED_WEIGHT_HEADER = "x-mbx-used-weight-1m"
+_BINANCE_WEIGHT_LIMIT = 6000.0
+
+
+class RateLimitExceeded(requests.RequestException):
+    """The host asked to wait longer than the adapter is willing to block."""
+
+
+class TokenBucket:
+    """Thread safe token bucket shared by every client of one host."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.blocked_until = 0.0
+        self.reported_remaining: Optional[float] = None
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if now <= self._updated:
+            return
+        elapsed = now - self._updated
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """Take ``tokens`` if possible and return 0, else the seconds to wait."""
+        with self._lock:
+            now = self._clock()
+            if now < self.blocked_until:
+                return self.blocked_until - now
+            self._refill(now)
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return 0.0
+            return (tokens - self.tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0, max_wait: Optional[float] = None) -> float:
+        """Block until ``tokens`` are available and return the time waited.
+
+        Raises RateLimitExceeded instead of waiting more than ``max_wait``
+        seconds in total.
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return waited
+            if max_wait is not None and waited + wait > max_wait:
+                raise RateLimitExceeded(
+                    f"Rate limit wait of {wait:.1f}s exceeds {max_wait:.1f}s"
+                )
+            self._sleep(wait)
+            waited += wait
+
+    def block_for(self, seconds: float) -> None:
+        """Pause the bucket, e.g. after a Retry-After response header."""
+        with self._lock:
+            now = self._clock()
+            self.blocked_until = max(self.blocked_until, now + seconds)
+            # Allow a single request once the block ends, then pace again
+            self.tokens = min(1.0, float(self.capacity))
+            self._updated = self.blocked_until
+
+    def remaining_fraction(self) -> float:
+        """Return the share of the budget left, using server hints if known."""
+        with self._lock:
+            self._refill(self._clock())
+            local = self.tokens / self.capacity
+            if self._clock() < self.blocked_until:
+                return 0.0
+        if self.reported_remaining is not None:
+            return min(local, self.reported_remaining)
+        return local
+
+    def update_from_response(self, response: requests.Response) -> None:
+        """Adjust the bucket from the rate limit headers of a response."""
+        headers = response.headers
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        if retry_after is not None:
+            self.block_for(retry_after)
+        elif response.status_code == 429:
+            self.block_for(DEFAULT_PENALTY)
+
+        remaining = _first_float(headers, _REMAINING_HEADERS)
+        limit = _first_float(headers, _LIMIT_HEADERS)
+        if remaining is not None and limit:
+            self.reported_remaining = max(remaining / limit, 0.0)
+            if remaining <= 0 and retry_after is None:
+                reset = _first_float(headers, _RESET_HEADERS)
+                if reset is not None:
+                    # Either seconds until the reset or an epoch timestamp
+                    seconds = reset - time.time() if reset > 1e9 else reset
+                    self.block_for(max(seconds, 0.0))
+        used_weight = _first_float(headers, (_USED_WEIGHT_HEADER,))
+        if used_weight is not None:
+            self.reported_remaining = max(1 - used_weight / _BINANCE_WEIGHT_LIMIT, 0)
+
+
+def _first_float(headers: Any, names: tuple[str, ...]) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(str(value).split(",")[0])
+        except ValueError:
+            continue
+    return None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(
+    host: str, rate: Optional[float] = None, capacity: Optional[int] = None
+) -> TokenBucket:
+    """Return the process wide bucket of ``host``, creating it on first use."""
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            default_rate, default_capacity = HOST_LIMITS.get(host, DEFAULT_LIMIT)
+            bucket = TokenBucket(rate or default_rate, capacity or default_capacity)
+            _buckets[host] = bucket
+        return bucket
+
+
+def reset_buckets() -> None:
+    with _buckets_lock:
+        _buckets.clear()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """Transport adapter that paces requests with the bucket of their host."""
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        capacity: Optional[int] = None,
+        max_rate_limit_retries: int = 1,
+        max_wait: Optional[float] = MAX_WAIT,
+        **kwargs: Any,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.max_wait = max_wait
+        self.hosts: set[str] = set()
+        super().__init__(**kwargs)
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        host = urlsplit(url).hostname or ""
+        self.hosts.add(host)
+        return get_bucket(host, self.rate, self.capacity)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any):  # type: ignore[override]
+        bucket = self.bucket_for(request.url or "")
+        attempt = 0
+        waited_total = 0.0
+        with tracing.span(
+            "http.request", method=request.method, url=request.url
+        ) as span:
+            while True:
+                waited = bucket.acquire(max_wait=self.max_wait)
+                if waited:
+                    waited_total += waited
+                    logger.debug(
+                        "Waited %.2fs for the rate limit of %s", waited, request.url
+                    )
+                response = super().send(request, **kwargs)
+                bucket.update_from_response(response)
+                if (
+                    response.status_code != 429
+                    or attempt >= self.max_rate_limit_retries
+                ):
+                    if not kwargs.get("stream"):
+                        # Download the body inside the span, Session.send would
+                        # otherwise read it after the span closed
+                        response.content  # noqa: B018
+                    span.set_attribute("status", response.status_code)
+                    span.set_attribute("retries", attempt)
+                    span.set_attribute("rate_limit_wait", waited_total)
+                    # Read by ServiceMetrics, requests counts it in elapsed
+                    response.rate_limit_wait = waited_total  # type: ignore[attr-defined]
+                    return response
+                attempt += 1
+                logger.info("Rate limited by %s, retrying", request.url)
+                response.close()
+
+    def remaining_fraction(self) -> float:
+        if not self.hosts:
+            return 1.0
+        return min(get_bucket(host).remaining_fraction() for host in self.hosts)
+
+
+def install_rate_limiter(
+    session: requests.Session,
+    rate: Optional[float] = None,
+    capacity: Optional[int] = None,
+) -> RateLimitedAdapter:
+    """Mount a RateLimitedAdapter on ``session``, keeping its retry settings."""
+    current = session.get_adapter("https://")
+    if isinstance(current, RateLimitedAdapter):
+        return current
+    max_retries = getattr(current, "max_retries", 0)
+    adapter = RateLimitedAdapter(rate=rate, capacity=capacity, max_retries=max_retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return adapter
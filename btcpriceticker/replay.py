@@ -0,0 +1,297 @@
+import abc
+import base64
+import io
+import json
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+# Query parameters derived from the current time, ignored when matching a request
+VOLATILE_PARAMS = frozenset(
+    {"since", "from", "to", "start", "end", "time", "startTime", "endTime", "limit"}
+)
+# Headers describing the wire format of a body that is stored decoded
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+_patch_lock = threading.Lock()
+_active: Optional["_Harness"] = None
+
+
+def request_key(
+    method: str, url: str, ignore_params: frozenset = VOLATILE_PARAMS
+) -> str:
+    """Return the method and URL with sorted query, minus ``ignore_params``."""
+    parts = urlsplit(url)
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name not in ignore_params
+    )
+    url = urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+    return f"{method.upper()} {url}"
+
+
+class Cassette:
+    """Recorded HTTP interactions, stored as JSON."""
+
+    def __init__(self, interactions: Optional[list[dict[str, Any]]] = None):
+        self.interactions = interactions or []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {data.get('version')}")
+        return cls(data["interactions"])
+
+    def save(self, path: str) -> None:
+        with self._lock:
+            data = {"version": CASSETTE_VERSION, "interactions": self.interactions}
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(data, handle, indent=1)
+
+    def append(
+        self, request: requests.PreparedRequest, response: requests.Response
+    ) -> None:
+        content = response.content or b""
+        try:
+            body, encoding = content.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode("ascii"), "base64"
+        interaction = {
+            "method": request.method,
+            "url": request.url,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _WIRE_HEADERS
+            },
+            "body": body,
+            "encoding": encoding,
+            "elapsed": response.elapsed.total_seconds(),
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+
+
+class Fault:
+    """Latency and errors injected into replayed responses."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: Optional[int] = 503,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        # None raises a ConnectionError instead of answering with a status
+        self.error_status = error_status
+
+
+class _Harness(abc.ABC):
+    """Swap ``HTTPAdapter.send`` for every session while active."""
+
+    def __init__(self):
+        self._original: Optional[Callable[..., Any]] = None
+
+    def start(self) -> "_Harness":
+        global _active
+        with _patch_lock:
+            if _active is not None:
+                raise RuntimeError("A record or replay harness is already active")
+            self._original = HTTPAdapter.send
+            harness = self
+
+            def send(adapter, request, **kwargs):
+                return harness._send(adapter, request, **kwargs)
+
+            HTTPAdapter.send = send  # type: ignore[method-assign]
+            _active = self
+        return self
+
+    def stop(self) -> None:
+        global _active
+        with _patch_lock:
+            if _active is not self:
+                return
+            HTTPAdapter.send = self._original  # type: ignore[method-assign]
+            _active = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @abc.abstractmethod
+    def _send(self, adapter: HTTPAdapter, request: requests.PreparedRequest, **kwargs):
+        """Answer ``request`` in place of ``HTTPAdapter.send``."""
+
+
+class Recorder(_Harness):
+    """Record every upstream HTTP exchange to a cassette file.
+
+    All backends talk to their APIs through requests sessions, so this
+    captures CoinGecko, CoinPaprika, mempool.space, Bit2Me and the ccxt
+    exchanges alike::
+
+        with Recorder("cassette.json"):
+            Price(service="kraken").refresh()
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self.cassette = Cassette()
+
+    def stop(self) -> None:
+        if _active is self:
+            super().stop()
+            self.cassette.save(self.path)
+            logger.info(
+                "Recorded %d requests to %s",
+                len(self.cassette.interactions),
+                self.path,
+            )
+
+    def _send(self, adapter, request, **kwargs):
+        response = self._original(adapter, request, **kwargs)
+        self.cassette.append(request, response)
+        return response
+
+
+class Replayer(_Harness):
+    """Answer HTTP requests from a cassette without touching the network.
+
+    Repeated requests cycle through their recorded responses in order, and
+    ``fault`` (or a per host entry of ``host_faults``) adds latency and
+    errors drawn from a generator seeded with ``seed``. With ``realtime``
+    the recorded response time is waited as well. Requests missing from
+    the cassette raise a ``ConnectionError``.
+    """
+
+    def __init__(
+        self,
+        cassette: Any,
+        fault: Optional[Fault] = None,
+        host_faults: Optional[dict[str, Fault]] = None,
+        seed: int = 0,
+        realtime: bool = False,
+        ignore_params: frozenset = VOLATILE_PARAMS,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        super().__init__()
+        if not isinstance(cassette, Cassette):
+            cassette = Cassette.load(cassette)
+        self.cassette = cassette
+        self.fault = fault or Fault()
+        self.host_faults = host_faults or {}
+        self.seed = seed
+        self.realtime = realtime
+        self.ignore_params = ignore_params
+        self.sleep = sleep
+        self.requests = 0
+        self.misses = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._index: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for interaction in cassette.interactions:
+            key = request_key(interaction["method"], interaction["url"], ignore_params)
+            self._index[key].append(interaction)
+        self._reset()
+
+    def _reset(self) -> None:
+        self._random = random.Random(self.seed)
+        self._positions: dict[str, int] = defaultdict(int)
+
+    def start(self) -> "_Harness":
+        self._reset()
+        return super().start()
+
+    def _next(
+        self, key: str
+    ) -> tuple[Optional[dict[str, Any]], float, Optional[Fault]]:
+        """Return the next interaction, the delay and the fault to inject."""
+        host = urlsplit(key.split(" ", 1)[1]).hostname or ""
+        fault = self.host_faults.get(host, self.fault)
+        with self._lock:
+            self.requests += 1
+            delay = fault.latency + fault.jitter * self._random.random()
+            failed = self._random.random() < fault.error_rate
+            interactions = self._index.get(key)
+            if not interactions:
+                self.misses += 1
+                return None, delay, None
+            position = self._positions[key]
+            self._positions[key] = position + 1
+            if failed:
+                self.errors += 1
+            return (
+                interactions[position % len(interactions)],
+                delay,
+                fault if failed else None,
+            )
+
+    def _send(self, adapter, request, **kwargs):
+        key = request_key(
+            request.method or "GET", request.url or "", self.ignore_params
+        )
+        interaction, delay, fault = self._next(key)
+        if interaction is not None and self.realtime:
+            delay += interaction.get("elapsed", 0.0)
+        if delay > 0:
+            self.sleep(delay)
+        if interaction is None:
+            raise requests.exceptions.ConnectionError(
+                f"No recorded response for {key}", request=request
+            )
+        if fault is not None and fault.error_status is None:
+            raise requests.exceptions.ConnectionError(
+                f"Injected connection error for {key}", request=request
+            )
+        if fault is not None:
+            interaction = {
+                "status": fault.error_status,
+                "reason": "Injected error",
+                "headers": {},
+                "body": "",
+            }
+        return self._build_response(adapter, request, interaction, delay)
+
+    @staticmethod
+    def _build_response(adapter, request, interaction, delay) -> requests.Response:
+        body = interaction.get("body", "")
+        if interaction.get("encoding") == "base64":
+            content = base64.b64decode(body)
+        else:
+            content = body.encode("utf-8")
+        raw = HTTPResponse(
+            body=io.BytesIO(content),
+            headers=interaction.get("headers", {}),
+            status=interaction["status"],
+            reason=interaction.get("reason"),
+            preload_content=False,
+            decode_content=False,
+        )
+        response = adapter.build_response(request, raw)
+        response.elapsed = timedelta(seconds=delay)
+        return response
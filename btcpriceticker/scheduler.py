@@ -0,0 +1,88 @@
+import math
+import time
+from collections import deque
+from typing import Optional
+
+import numpy as np
+
+
+class RefreshScheduler:
+    """Pick the refresh interval between a floor and a ceiling.
+
+    The interval shrinks when the recent realised volatility of the price
+    history rises and when consumers ask for prices often, and it grows when
+    the request budget of the active backend runs low.
+    """
+
+    def __init__(
+        self,
+        floor: float = 30.0,
+        ceiling: float = 600.0,
+        target_volatility: float = 0.001,
+        volatility_window: int = 30,
+        demand_window: float = 600.0,
+    ):
+        if floor <= 0 or ceiling < floor:
+            raise ValueError("Expected 0 < floor <= ceiling")
+        self.floor = floor
+        self.ceiling = ceiling
+        self.target_volatility = target_volatility
+        self.volatility_window = volatility_window
+        self.demand_window = demand_window
+        self.interval = ceiling
+        self.next_refresh = 0.0
+        self._demand: deque[float] = deque()
+
+    def raise_floor(self, minimum: float) -> None:
+        """Never plan refreshes closer than ``minimum`` seconds apart."""
+        self.floor = max(self.floor, minimum)
+        self.ceiling = max(self.ceiling, self.floor)
+        self.interval = min(max(self.interval, self.floor), self.ceiling)
+
+    def record_demand(self, now: Optional[float] = None) -> None:
+        """Note that a consumer asked for the current price."""
+        now = time.time() if now is None else now
+        self._demand.append(now)
+        self._expire_demand(now)
+
+    def _expire_demand(self, now: float) -> None:
+        while self._demand and now - self._demand[0] > self.demand_window:
+            self._demand.popleft()
+
+    def demand(self, now: Optional[float] = None) -> float:
+        """Return the consumer requests per minute in the demand window."""
+        now = time.time() if now is None else now
+        self._expire_demand(now)
+        return len(self._demand) * 60.0 / self.demand_window
+
+    def realised_volatility(self, prices: np.ndarray) -> float:
+        """Return the standard deviation of the recent log returns."""
+        prices = np.asarray(prices, dtype="float64")[-(self.volatility_window + 1) :]
+        prices = prices[prices > 0]
+        if len(prices) < 3:
+            return 0.0
+        return float(np.std(np.diff(np.log(prices))))
+
+    def compute_interval(
+        self, volatility: float, budget: float = 1.0, demand: float = 0.0
+    ) -> float:
+        """Combine volatility, remaining budget (0..1) and demand to an interval."""
+        volatility_factor = 1.0 / (1.0 + volatility / self.target_volatility)
+        demand_factor = 1.0 / (1.0 + math.log1p(max(demand, 0.0)))
+        budget_factor = 1.0 / max(budget, self.floor / self.ceiling)
+        interval = self.ceiling * volatility_factor * demand_factor * budget_factor
+        return min(max(interval, self.floor), self.ceiling)
+
+    def plan(
+        self,
+        last_refresh: float,
+        prices: np.ndarray,
+        budget: float = 1.0,
+        now: Optional[float] = None,
+    ) -> float:
+        """Plan the next refresh after ``last_refresh`` and return its time."""
+        self.interval = self.compute_interval(
+            self.realised_volatility(prices), budget, self.demand(now)
+        )
+        self.next_refresh = last_refresh + self.interval
+        return self.next_refresh
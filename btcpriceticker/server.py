@@ -0,0 +1,161 @@
+import json
+import logging
+import os
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional, Union
+
+import pandas as pd
+
+from .metrics import format_prometheus
+from .price import Price
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _frame_to_json(frame: Any) -> bytes:
+    if not isinstance(frame, pd.DataFrame) or frame.empty:
+        return b"[]"
+    data = frame.copy()
+    data.index.name = "timestamp"
+    return data.reset_index().to_json(orient="records", date_format="iso").encode()
+
+
+class _PriceRequestHandler(BaseHTTPRequestHandler):
+    server: Any
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0].rstrip("/") or "/"
+        content_type = "application/json"
+        if path == "/metrics":
+            body = self.server.price_server.get_metrics()
+            content_type = PROMETHEUS_CONTENT_TYPE
+        else:
+            body = self.server.price_server.get_response(path)
+        if body is None:
+            self.send_response(404)
+            body = json.dumps({"error": f"unknown endpoint {path}"}).encode()
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(format, *args)
+
+
+class _ThreadingUnixHTTPServer(
+    socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    daemon_threads = True
+
+
+class PriceServer:
+    """Serve the quotes of one shared Price instance to many local consumers.
+
+    Responses are serialized once per refresh and then returned from memory,
+    so N consumers cost a single upstream fetch per refresh interval.
+    """
+
+    def __init__(self, price: Price, refresh_interval: Optional[float] = None):
+        self.price = price
+        self.refresh_interval = max(
+            refresh_interval or price.min_refresh_time, price.min_refresh_time
+        )
+        self._responses: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self.httpd: Optional[socketserver.BaseServer] = None
+        self._serving = threading.Event()
+        self.last_refresh = 0.0
+
+    def refresh(self) -> bool:
+        """Refresh the price and rebuild the cached responses."""
+        success = self.price.refresh()
+        timestamp = self.price.get_timestamp()
+        if not self._responses or timestamp != self.last_refresh:
+            self._build_responses()
+            self.last_refresh = timestamp
+        return success
+
+    def _build_responses(self) -> None:
+        snapshot = json.dumps(self.price.get_snapshot()).encode()
+        responses = {
+            "/": snapshot,
+            "/price": snapshot,
+            "/price_list": json.dumps(self.price.get_price_list()).encode(),
+            "/ohlc": _frame_to_json(self.price.ohlc),
+            "/ohlcv": _frame_to_json(self.price.ohlcv),
+        }
+        with self._lock:
+            self._responses = responses
+
+    def get_response(self, path: str) -> Optional[bytes]:
+        with self._lock:
+            return self._responses.get(path)
+
+    def get_metrics(self) -> bytes:
+        """Return ``Price.stats()`` in the Prometheus text format."""
+        return format_prometheus(self.price.stats()).encode()
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception as exc:  # pragma: no cover - keep serving old data
+                logger.warning("Refreshing the price failed: %s", exc)
+
+    def bind(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8787,
+        unix_socket: Optional[str] = None,
+    ) -> Union[ThreadingHTTPServer, _ThreadingUnixHTTPServer]:
+        """Create the listening socket, TCP by default or a Unix domain socket."""
+        httpd: Union[ThreadingHTTPServer, _ThreadingUnixHTTPServer]
+        if unix_socket:
+            if os.path.exists(unix_socket):
+                os.unlink(unix_socket)
+            httpd = _ThreadingUnixHTTPServer(unix_socket, _PriceRequestHandler)
+        else:
+            httpd = ThreadingHTTPServer((host, port), _PriceRequestHandler)
+            httpd.daemon_threads = True
+        httpd.price_server = self  # type: ignore[union-attr]
+        self.httpd = httpd
+        return httpd
+
+    def start(self) -> None:
+        """Fill the cache and start refreshing it in a background thread."""
+        self.refresh()
+        self._stop.clear()
+        self._refresh_thread = threading.Thread(target=self._refresh_loop, daemon=True)
+        self._refresh_thread.start()
+
+    def serve_forever(self) -> None:
+        httpd = self.httpd if self.httpd is not None else self.bind()
+        self.start()
+        self._serving.set()
+        try:
+            httpd.serve_forever()
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        self._stop.set()
+        httpd, self.httpd = self.httpd, None
+        if httpd is None:
+            return
+        if self._serving.is_set():
+            self._serving.clear()
+            httpd.shutdown()
+        httpd.server_close()
+        if isinstance(httpd, socketserver.UnixStreamServer):
+            address = httpd.server_address
+            if isinstance(address, str) and os.path.exists(address):
+                os.unlink(address)
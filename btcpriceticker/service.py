@@ -1,13 +1,37 @@
 import abc
+import logging
+import threading
+from collections import deque
 from datetime import datetime, timezone
 from typing import Any, Optional, Union
 
+import numpy as np
 import pandas as pd
 
-from .price_timeseries import PriceTimeSeries
+from . import gaps, tracing
+from .decode import OHLC_COLUMNS, OHLCV_COLUMNS, coerce_candles, empty_frame
+from .fx import FxRates, get_fx_rates
+from .indicators import IndicatorEngine, default_indicators
+from .metrics import ServiceMetrics
+from .price_timeseries import AssetPriceTable, PriceTimeSeries
+from .pyramid import CandlePyramid, timeframe_to_seconds
+from .ratelimit import RateLimitedAdapter, install_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+SYNC_DATASETS = ("history", "ohlc", "ohlcv")
 
 
 class Service(metaclass=abc.ABCMeta):
+    # TickerStream subclass used by start_stream, None if not supported
+    ticker_stream: Optional[type] = None
+    # Number of the latest stream ticks kept by get_ticks
+    stream_buffer_size = 10_000
+    # Slots returned by one fetch_range request, None if the range is unlimited
+    backfill_page_size: Optional[int] = None
+    # Asset quoted by get_current_price, backends with a base_asset override it
+    base_asset = "BTC"
+
     @abc.abstractmethod
     def __init__(self, fiat):
         self.initialize(fiat)
@@ -28,13 +52,13 @@ class Service(metaclass=abc.ABCMeta):
         self.enable_ohlc = enable_ohlc
         self.enable_ohlcv = enable_ohlcv
         self.enable_timeseries = enable_timeseries
-        self.ohlc: Union[pd.DataFrame, Any] = pd.DataFrame(
-            columns=["Open", "High", "Low", "Close"]
-        )
-
-        self.ohlcv: Union[pd.DataFrame, Any] = pd.DataFrame(
-            columns=["Open", "High", "Low", "Close", "Volume"]
-        )
+        # dtype of prices and volumes in the history and candle stores
+        self.price_dtype = "float64"
+        self.ohlc: Union[pd.DataFrame, Any] = empty_frame(OHLC_COLUMNS)
+        self.ohlcv: Union[pd.DataFrame, Any] = empty_frame(OHLCV_COLUMNS)
+        # Coarser timeframes aggregated from self.ohlcv
+        self.ohlcv_pyramid = CandlePyramid()
+        self.ohlcv_indicators = IndicatorEngine(default_indicators(candles=True))
         self.price = {
             "usd": 0.0,
             "sat_usd": 0.0,
@@ -43,12 +67,48 @@ class Service(metaclass=abc.ABCMeta):
             "timestamp": 0.0,
         }
         self.price_history = PriceTimeSeries()
+        # High-water marks (epoch seconds) of the data already fetched per dataset
+        self.sync_cursors: dict[str, float] = dict.fromkeys(SYNC_DATASETS, 0.0)
+        # Fetch missing slots of the stored datasets on every update
+        self.backfill = True
+        # Gaps already requested that the API had no rows for
+        self.empty_gaps: dict[str, set[tuple[float, float]]] = {
+            dataset: set() for dataset in SYNC_DATASETS
+        }
+        self.stream: Optional[Any] = None
+        self.stream_timestamp = 0.0
+        # (epoch seconds, price) of the latest stream ticks, kept apart from the
+        # fetched history so ticks never move the history sync cursor
+        self.ticks: deque[tuple[float, float]] = deque(maxlen=self.stream_buffer_size)
+        # Guards self.price and self.ticks, the stream writes from its own thread
+        self.price_lock = threading.Lock()
+        # Additional fiats quoted on every update, see set_extra_fiats
+        self.extra_fiats: list[str] = []
+        self.quotes: dict[str, dict[str, float]] = {}
+        # Additional base assets quoted on every update, see set_extra_assets
+        self.extra_assets: list[str] = []
+        self.asset_quotes: dict[str, dict[str, float]] = {}
+        self.asset_history = AssetPriceTable()
+        self.fx_rates: FxRates = get_fx_rates()
+        if type(self).fetch_fx_rates is not Service.fetch_fx_rates:
+            self.fx_rates.add_provider(self.fetch_fx_rates)
+        self.metrics = ServiceMetrics()
+        self.rate_limiters: list[RateLimitedAdapter] = []
+        for session in self.http_sessions():
+            self.rate_limiters.append(install_rate_limiter(session))
+            session.hooks["response"].append(self.metrics.response_hook)
+
+    def http_sessions(self) -> list[Any]:
+        """Return the requests sessions used to call the API."""
+        return []
 
     def get_name(self):
         return self.name
 
     def get_price(self):
-        return self.price
+        """Return a consistent copy of the latest quote."""
+        with self.price_lock:
+            return dict(self.price)
 
     def _safe_get_current_price(self, currency: str) -> Optional[float]:
         variations = (currency, currency.upper(), currency.lower())
@@ -61,37 +121,321 @@ class Service(metaclass=abc.ABCMeta):
                 return price
         return None
 
+    def set_extra_fiats(self, fiats: list[str]) -> None:
+        """Quote ``fiats`` in addition to the main fiat on every update."""
+        primary = self.fiat.upper()
+        self.extra_fiats = [
+            code for code in dict.fromkeys(f.upper() for f in fiats) if code != primary
+        ]
+
+    def set_extra_assets(self, assets: list[str]) -> None:
+        """Quote ``assets`` in addition to the base asset on every update."""
+        primary = self.base_asset.upper()
+        self.extra_assets = [
+            code for code in dict.fromkeys(a.upper() for a in assets) if code != primary
+        ]
+
+    def set_price_dtype(self, dtype: str) -> None:
+        """Store prices and volumes as ``dtype`` (float64 or float32)."""
+        self.price_history.set_price_dtype(dtype)
+        self.asset_history.set_price_dtype(dtype)
+        self.price_dtype = dtype
+        if isinstance(self.ohlc, pd.DataFrame):
+            self.ohlc = coerce_candles(self.ohlc, dtype)
+        if isinstance(self.ohlcv, pd.DataFrame):
+            self.ohlcv = coerce_candles(self.ohlcv, dtype)
+        self.ohlcv_pyramid.reset()
+
+    def memory_usage(self) -> dict[str, int]:
+        """Return the bytes held by the history and candle stores."""
+        usage = {"history": self.price_history.memory_usage()}
+        if self.extra_assets:
+            usage["assets"] = self.asset_history.memory_usage()
+        for dataset in ("ohlc", "ohlcv"):
+            frame = getattr(self, dataset)
+            if isinstance(frame, pd.DataFrame):
+                usage[dataset] = int(frame.memory_usage(index=True, deep=True).sum())
+        if self.ohlcv_pyramid.levels:
+            usage["ohlcv_pyramid"] = self.ohlcv_pyramid.memory_usage()
+        return usage
+
+    def get_quote_currencies(self) -> list[str]:
+        return list(dict.fromkeys(["USD", self.fiat.upper(), *self.extra_fiats]))
+
+    def get_current_prices(self, currencies: list[str]) -> dict[str, Optional[float]]:
+        """Return the current price of USD and the main fiat.
+
+        Other currencies are left to derive_prices(). Backends that return
+        all currencies in one response override this to make a single request.
+        """
+        prices: dict[str, Optional[float]] = {}
+        for currency in currencies:
+            code = currency.upper()
+            if code in ("USD", self.fiat.upper()) and self.has_native_fiat(code):
+                prices[code] = self._safe_get_current_price(currency)
+        return prices
+
+    def get_asset_prices(
+        self, assets: list[str], currencies: list[str]
+    ) -> dict[str, dict[str, float]]:
+        """Return ``{asset: {currency: price}}`` with as few requests as possible.
+
+        Backends without a bulk quote of other assets return an empty dict.
+        """
+        return {}
+
+    def has_native_fiat(self, currency: str) -> bool:
+        """Return whether the API quotes BTC in ``currency`` directly."""
+        return True
+
+    def fetch_fx_rates(self) -> Optional[dict[str, float]]:
+        """Return fiat units per USD if the API exposes a rate table.
+
+        Services overriding this are registered as providers of the shared
+        FX rates when they are created.
+        """
+        return None
+
+    def derive_prices(
+        self, prices: dict[str, Optional[float]]
+    ) -> dict[str, Optional[float]]:
+        """Fill the missing quote currencies from the USD price and FX rates."""
+        derived = dict(prices)
+        usd_price = prices.get("USD")
+        if not usd_price:
+            return derived
+        for code in self.get_quote_currencies():
+            if derived.get(code) is None:
+                derived[code] = self.fx_rates.convert(usd_price, code)
+        return derived
+
+    def get_data_currency(self, currency: str) -> str:
+        """Return the currency to fetch history and candles of ``currency`` in."""
+        return currency if self.has_native_fiat(currency) else "USD"
+
+    @tracing.traced(
+        "service.update",
+        lambda self: {
+            "service": self.name,
+            "fiat": self.fiat,
+            "interval": self.interval,
+        },
+    )
     def update(self):
         now = datetime.now(timezone.utc)
         current_time = now.timestamp()
 
-        # Get USD price, defaulting to 0.0 if None is returned
-        usd_price = self._safe_get_current_price("USD")
-        self.price["usd"] = usd_price if usd_price is not None else 0.0
-        self.price["sat_usd"] = 1e8 / self.price["usd"] if self.price["usd"] else 0.0
+        prices: dict[str, Optional[float]]
+        with tracing.span("service.quotes") as span:
+            if self.extra_fiats:
+                prices = self.get_current_prices(self.get_quote_currencies())
+            else:
+                prices = {"USD": self._safe_get_current_price("USD")}
+                if self.fiat.upper() != "USD" and self.has_native_fiat(self.fiat):
+                    prices[self.fiat.upper()] = self._safe_get_current_price(self.fiat)
+            self.fx_rates.update_from_btc_prices(prices)
+            prices = self.derive_prices(prices)
+            span.set_attribute("currencies", len(prices))
+        usd_price = prices.get("USD")
+        fiat_price = prices.get(self.fiat.upper())
+        if usd_price is None and fiat_price is None:
+            # Keep the previous quote and let Price count the failure
+            raise RuntimeError(f"{self.name} returned no price")
+
+        with self.price_lock:
+            # Get USD price, defaulting to 0.0 if None is returned
+            self.price["usd"] = usd_price if usd_price is not None else 0.0
+            self.price["sat_usd"] = (
+                1e8 / self.price["usd"] if self.price["usd"] else 0.0
+            )
+
+            # Get fiat price, defaulting to 0.0 if None is returned
+            self.price["fiat"] = fiat_price if fiat_price is not None else 0.0
+            self.price["sat_fiat"] = (
+                1e8 / self.price["fiat"] if self.price["fiat"] else 0.0
+            )
 
-        # Get fiat price, defaulting to 0.0 if None is returned
-        fiat_price = self._safe_get_current_price(self.fiat)
-        self.price["fiat"] = fiat_price if fiat_price is not None else 0.0
-        self.price["sat_fiat"] = 1e8 / self.price["fiat"] if self.price["fiat"] else 0.0
+        if self.extra_assets:
+            with tracing.span("service.assets") as span:
+                self.update_asset_quotes(current_time)
+                span.set_attribute("assets", len(self.asset_quotes))
 
         if self.enable_timeseries:
-            self.update_price_history(self.fiat)
+            with tracing.span("service.history"):
+                self._update_history(self.fiat)
+                self._backfill("history")
         else:
             self.append_current_price(self.price["fiat"])
         if self.enable_ohlcv:
-            self.update_ohlcv(self.fiat)
+            with tracing.span("service.ohlcv"):
+                self.update_ohlcv(self.fiat)
+                self._backfill("ohlcv")
         if self.enable_ohlc:
-            self.update_ohlc(self.fiat)
+            with tracing.span("service.ohlc"):
+                self.update_ohlc(self.fiat)
+                self._backfill("ohlc")
+
+        with self.price_lock:
+            self.price["timestamp"] = current_time
+        self.update_quotes(prices)
+
+    def _update_history(self, currency: str) -> None:
+        source = self.get_data_currency(currency)
+        before = self.price_history.get_last_timestamp()
+        rows_before = len(self.price_history.data)
+        self.update_price_history(source)
+        self._record_rows(len(self.price_history.data) - rows_before)
+        if source.upper() != currency.upper():
+            self._convert_history_after(before, currency)
+        last_timestamp = self.price_history.get_last_timestamp()
+        if last_timestamp is not None:
+            self.advance_sync_cursor("history", last_timestamp)
+
+    def _record_rows(self, rows: int) -> None:
+        self.metrics.record_rows(rows)
+        tracing.current_span().set_attribute("rows", max(rows, 0))
+
+    def _convert_history_after(self, before: Optional[float], currency: str) -> None:
+        """Convert the USD rows appended after ``before`` to ``currency``."""
+        data = self.price_history.data
+        if data.empty:
+            return
+        mask = pd.Series(True, index=data.index)
+        if before is not None:
+            mask = data["timestamp"] > pd.Timestamp(before, unit="s", tz="UTC")
+        rate = self.fx_rates.get_rate(currency)
+        if rate is None:
+            self.price_history.data = data[~mask].reset_index(drop=True)
+            return
+        converted = data.loc[mask, "price"].astype("float64") * rate
+        data.loc[mask, "price"] = converted.astype(data["price"].dtype)
+
+    def update_quotes(self, prices: dict[str, Optional[float]]) -> None:
+        """Store a price dict for every extra fiat."""
+        quotes = {}
+        for code in self.extra_fiats:
+            value = prices.get(code)
+            if not value:
+                continue
+            quotes[code] = {
+                "usd": self.price["usd"],
+                "sat_usd": self.price["sat_usd"],
+                "fiat": value,
+                "sat_fiat": 1e8 / value,
+                "timestamp": self.price["timestamp"],
+            }
+        self.quotes = quotes
+
+    def update_asset_quotes(self, timestamp: float) -> None:
+        """Quote the extra assets in one bulk request and store their prices.
+
+        Each update appends one row with every asset, including the base
+        asset, to ``asset_history``.
+        """
+        fiat = self.fiat.upper()
+        currencies = list(dict.fromkeys(["USD", fiat]))
+        fetched = self.get_asset_prices(self.extra_assets, currencies)
+        # The base asset quotes imply the rate, the FX table is the fallback
+        rate: Optional[float] = 1.0
+        if fiat != "USD":
+            rate = None
+            if self.price["usd"] and self.price["fiat"]:
+                rate = self.price["fiat"] / self.price["usd"]
+        quotes = {}
+        for asset in self.extra_assets:
+            prices = fetched.get(asset, {})
+            usd_price = prices.get("USD")
+            value = prices.get(fiat)
+            if rate is None and (usd_price is None) != (value is None):
+                rate = self.fx_rates.get_rate(fiat)
+            if value is None and usd_price and rate:
+                value = usd_price * rate
+            if usd_price is None and value and rate:
+                usd_price = value / rate
+            if not value:
+                continue
+            quotes[asset] = {
+                "usd": usd_price or 0.0,
+                "sat_usd": 1e8 / usd_price if usd_price else 0.0,
+                "fiat": value,
+                "sat_fiat": 1e8 / value,
+                "timestamp": timestamp,
+            }
+        self.asset_quotes = quotes
+        row: dict[str, Optional[float]] = {self.base_asset: self.price["fiat"] or None}
+        row.update({asset: quote["fiat"] for asset, quote in quotes.items()})
+        self.asset_history.add_prices(
+            datetime.fromtimestamp(timestamp, tz=timezone.utc), row
+        )
+
+    def get_asset_quote(self, asset: str) -> Optional[dict[str, float]]:
+        """Return the price dict of ``asset``, the base asset uses self.price."""
+        code = asset.upper()
+        if code == self.base_asset.upper():
+            return self.price
+        return self.asset_quotes.get(code)
 
-        self.price["timestamp"] = current_time
+    def get_quote(self, fiat: str) -> Optional[dict[str, float]]:
+        """Return the price dict of ``fiat``, the main fiat uses self.price."""
+        code = fiat.upper()
+        if code == self.fiat.upper():
+            return self.price
+        return self.quotes.get(code)
 
     def append_current_price(self, current_price):
         now = datetime.now(timezone.utc)
         self.price_history.add_price(now, current_price)
 
-    def get_price_list(self):
-        return self.price_history.get_price_list(days=self.days_ago)
+    def request_budget(self) -> float:
+        """Return the remaining share (0..1) of the request budget of the API."""
+        if not self.rate_limiters:
+            return 1.0
+        return min(limiter.remaining_fraction() for limiter in self.rate_limiters)
+
+    def on_stream_price(self, price: float) -> None:
+        """Apply a price pushed by a ticker stream, called from its thread.
+
+        The tick updates the quote and goes to the bounded ``ticks`` buffer.
+        The fetched history and its sync cursor stay with the REST updates.
+        """
+        now = datetime.now(timezone.utc).timestamp()
+        with self.price_lock:
+            self.price["fiat"] = price
+            self.price["sat_fiat"] = 1e8 / price if price else 0.0
+            if self.fiat.upper() == "USD":
+                self.price["usd"] = price
+                self.price["sat_usd"] = self.price["sat_fiat"]
+            self.stream_timestamp = now
+            self.ticks.append((now, price))
+
+    def get_ticks(self) -> list[tuple[float, float]]:
+        """Return the buffered stream ticks as (epoch seconds, price), oldest first."""
+        with self.price_lock:
+            return list(self.ticks)
+
+    def start_stream(self, **kwargs) -> Any:
+        """Start pushing prices from the exchange WebSocket feed."""
+        if self.ticker_stream is None:
+            raise ValueError(f"Service '{self.name}' does not support streaming")
+        if self.stream is None:
+            self.stream = self.ticker_stream(self, **kwargs)
+        self.stream.start()
+        return self.stream
+
+    def stop_stream(self) -> None:
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream = None
+
+    def get_price_list(
+        self, max_points: Optional[int] = None, method: str = "lttb"
+    ) -> list[float]:
+        return self.price_history.get_price_list(self.days_ago, max_points, method)
+
+    def get_price_array(
+        self, max_points: Optional[int] = None, method: str = "lttb"
+    ) -> np.ndarray:
+        return self.price_history.get_price_array(self.days_ago, max_points, method)
 
     def get_price_change(self):
         change_percentage = self.price_history.get_percentage_change(self.days_ago)
@@ -99,46 +443,232 @@ class Service(metaclass=abc.ABCMeta):
             return ""
         return f"{change_percentage:+.2f}%"
 
-    def _get_ohlcv_timestamp_list(self) -> list[float]:
-        if isinstance(self.ohlcv, pd.DataFrame) and not self.ohlcv.empty:
-            if isinstance(self.ohlcv.index, pd.DatetimeIndex):
-                timestamps = self.ohlcv.index.astype("int64") / 1e9
-                return timestamps.tolist()
-        return []
+    @property
+    def sync_key(self) -> tuple[str, str, str]:
+        """Identify the cursors of this service by name, fiat and interval."""
+        return (self.name, self.fiat.lower(), self.interval)
+
+    def get_sync_cursor(self, dataset: str) -> float:
+        """Return the newest timestamp already stored for ``dataset``."""
+        if dataset not in self.sync_cursors:
+            raise ValueError(f"Unknown dataset '{dataset}'")
+        return self.sync_cursors[dataset]
+
+    def advance_sync_cursor(self, dataset: str, timestamp: float) -> None:
+        """Move the cursor of ``dataset`` forward, never backwards."""
+        current = self.get_sync_cursor(dataset)
+        self.sync_cursors[dataset] = max(current, float(timestamp))
+
+    def reset_sync_cursors(self) -> None:
+        self.sync_cursors = dict.fromkeys(SYNC_DATASETS, 0.0)
+
+    def _get_cursor_timestamp_list(self, dataset: str) -> list[float]:
+        """Return the cursor in the ``existing_timestamp`` format of the backends."""
+        cursor = self.get_sync_cursor(dataset)
+        return [cursor] if cursor else []
+
+    def _advance_cursor_from_frame(self, dataset: str, frame: Any) -> None:
+        if isinstance(frame, pd.DataFrame) and not frame.empty:
+            if isinstance(frame.index, pd.DatetimeIndex):
+                self.advance_sync_cursor(dataset, frame.index.max().timestamp())
+
+    def _get_candles(
+        self, getter: Any, currency: str, existing_timestamp: list[float]
+    ) -> Any:
+        """Fetch candles in ``currency`` or convert them from USD candles."""
+        source = self.get_data_currency(currency)
+        candles = getter(source, existing_timestamp=existing_timestamp)
+        if isinstance(candles, pd.DataFrame):
+            self._record_rows(len(candles))
+        if source.upper() == currency.upper():
+            return candles
+        return self.fx_rates.convert_frame(candles, currency)
+
+    def _merge_candles(self, dataset: str, candles: pd.DataFrame) -> None:
+        """Merge ``candles`` into the store, fetched rows replace stored ones."""
+        new_data = coerce_candles(candles, self.price_dtype).sort_index()
+        if dataset == "ohlcv" and not new_data.empty:
+            self.ohlcv_pyramid.mark_changed(new_data.index[0])
+        stored = getattr(self, dataset)
+        if isinstance(stored, pd.DataFrame) and not stored.empty:
+            combined = pd.concat([stored, new_data])
+            combined = combined[~combined.index.duplicated(keep="last")]  # type: ignore[index]
+            new_data = combined.sort_index()
+        setattr(self, dataset, new_data)
 
     def update_ohlcv(self, currency: str) -> None:
-        existing_timestamp = self._get_ohlcv_timestamp_list()
-        ohlcv_data = self.get_ohlcv(currency, existing_timestamp=existing_timestamp)
+        existing_timestamp = self._get_cursor_timestamp_list("ohlcv")
+        ohlcv_data = self._get_candles(self.get_ohlcv, currency, existing_timestamp)
+        if ohlcv_data is None:
+            return
 
         if isinstance(ohlcv_data, pd.DataFrame):
             if ohlcv_data.empty:
                 return
-            new_data = ohlcv_data.sort_index()
-            if isinstance(self.ohlcv, pd.DataFrame) and not self.ohlcv.empty:
-                combined = pd.concat([self.ohlcv, new_data])
-                combined = combined[~combined.index.duplicated(keep="last")]  # type: ignore[index]
-                self.ohlcv = combined.sort_index()
-            else:
-                self.ohlcv = new_data
+            self._merge_candles("ohlcv", ohlcv_data)
         else:
             self.ohlcv = ohlcv_data
+            self.ohlcv_pyramid.reset()
+        self._advance_cursor_from_frame("ohlcv", self.ohlcv)
 
     def update_ohlc(self, currency: str) -> None:
-        existing_timestamp = self._get_ohlcv_timestamp_list()
-        ohlc_data = self.get_ohlc(currency, existing_timestamp=existing_timestamp)
+        existing_timestamp = self._get_cursor_timestamp_list("ohlc")
+        ohlc_data = self._get_candles(self.get_ohlc, currency, existing_timestamp)
+        if ohlc_data is None:
+            return
 
         if isinstance(ohlc_data, pd.DataFrame):
             if ohlc_data.empty:
                 return
-            new_data = ohlc_data.sort_index()
-            if isinstance(self.ohlc, pd.DataFrame) and not self.ohlc.empty:
-                combined = pd.concat([self.ohlc, new_data])
-                combined = combined[~combined.index.duplicated(keep="last")]  # type: ignore[index]
-                self.ohlc = combined.sort_index()
-            else:
-                self.ohlc = new_data
+            self._merge_candles("ohlc", ohlc_data)
         else:
             self.ohlc = ohlc_data
+        self._advance_cursor_from_frame("ohlc", self.ohlc)
+
+    def get_ohlcv_timeframe(self, timeframe: str) -> Any:
+        """Return the OHLCV candles aggregated to a coarser ``timeframe``.
+
+        The timeframe is derived from the fetched candles and cached until
+        they change, switching between timeframes needs no request.
+        """
+        seconds = timeframe_to_seconds(timeframe)
+        base_seconds = self.get_slot_seconds("ohlcv")
+        if base_seconds and seconds % base_seconds:
+            raise ValueError(
+                f"Timeframe '{timeframe}' is not a multiple of the "
+                f"{base_seconds}s candles"
+            )
+        if seconds == base_seconds or not isinstance(self.ohlcv, pd.DataFrame):
+            return self.ohlcv
+        return self.ohlcv_pyramid.get(self.ohlcv, seconds)
+
+    def get_ohlcv_indicators(self) -> dict[str, Any]:
+        """Return the latest indicator values over the OHLCV candles.
+
+        Only the candles added or revised since the previous call are folded in.
+        """
+        if not isinstance(self.ohlcv, pd.DataFrame) or self.ohlcv.empty:
+            return self.ohlcv_indicators.update([], [], [], [])
+        return self.ohlcv_indicators.update(
+            self.ohlcv.index.asi8,
+            self.ohlcv["High"].to_numpy(),
+            self.ohlcv["Low"].to_numpy(),
+            self.ohlcv["Close"].to_numpy(),
+        )
+
+    def get_slot_seconds(self, dataset: str) -> Optional[int]:
+        """Return the spacing of the rows of ``dataset`` in seconds."""
+        to_seconds = getattr(self, "interval_to_seconds", None)
+        return to_seconds() if to_seconds is not None else None
+
+    def get_backfill_page_size(self, dataset: str) -> Optional[int]:
+        return self.backfill_page_size
+
+    def _get_timestamps(self, dataset: str) -> np.ndarray:
+        if dataset == "history":
+            return gaps.to_epoch_seconds(self.price_history.data["timestamp"])
+        frame = getattr(self, dataset)
+        if isinstance(frame, pd.DataFrame) and isinstance(
+            frame.index, pd.DatetimeIndex
+        ):
+            return gaps.to_epoch_seconds(frame.index)
+        return np.empty(0)
+
+    def find_gaps(self, dataset: str, since: Optional[float] = None) -> np.ndarray:
+        """Return the missing slots of ``dataset`` as ``[first, last]`` rows.
+
+        ``since`` drops the gaps that end before this epoch second.
+        """
+        if dataset not in SYNC_DATASETS:
+            raise ValueError(f"Unknown dataset '{dataset}'")
+        interval = self.get_slot_seconds(dataset)
+        if not interval:
+            return np.empty((0, 2))
+        found = gaps.find_gaps(self._get_timestamps(dataset), interval)
+        if since is not None:
+            found = found[found[:, 1] >= since]
+        return found
+
+    def fetch_range(
+        self, dataset: str, currency: str, start: float, end: float
+    ) -> Optional[pd.DataFrame]:
+        """Return the rows of ``dataset`` from ``start`` to ``end`` (epoch seconds).
+
+        History is returned as timestamp/price rows, candles as a time indexed
+        frame. None means the API cannot fetch a range of this dataset.
+        """
+        return None
+
+    def _backfill(self, dataset: str) -> None:
+        if self.backfill:
+            self.fill_gaps(dataset)
+
+    def fill_gaps(self, dataset: str, currency: Optional[str] = None) -> int:
+        """Fetch the missing slots of ``dataset`` in the last ``days_ago`` days.
+
+        The gaps are covered with the fewest range requests the page size
+        allows and only rows inside the gaps are stored. Gaps the API returned
+        nothing for are not requested again, failed requests are retried on
+        the next call. Returns the number of rows added.
+        """
+        interval = self.get_slot_seconds(dataset)
+        if type(self).fetch_range is Service.fetch_range or not interval:
+            return 0
+        currency = currency or self.fiat
+        since = datetime.now(timezone.utc).timestamp() - self.days_ago * 86400
+        empty = self.empty_gaps[dataset]
+        found = np.array(
+            [
+                gap
+                for gap in self.find_gaps(dataset, since).tolist()
+                if tuple(gap) not in empty
+            ],
+            dtype="float64",
+        ).reshape(-1, 2)
+        if not len(found):
+            return 0
+        source = self.get_data_currency(currency)
+        page_size = self.get_backfill_page_size(dataset)
+        rows = 0
+        failed = False
+        for start, end in gaps.plan_requests(found, interval, page_size):
+            try:
+                frame = self.fetch_range(dataset, source, start, end)
+            except Exception as exc:
+                logger.warning(
+                    "Could not backfill %s from %s: %s", dataset, self.name, exc
+                )
+                failed = True
+                continue
+            if frame is None:
+                return rows
+            if source.upper() != currency.upper():
+                frame = self.fx_rates.convert_frame(frame, currency)
+                if frame is None:
+                    failed = True
+                    continue
+            rows += self._merge_gap_rows(dataset, frame, found, interval)
+        if not failed:
+            empty.update(map(tuple, found.tolist()))
+        self.metrics.record_rows(rows)
+        tracing.current_span().set_attribute("backfilled", rows)
+        return rows
+
+    def _merge_gap_rows(
+        self, dataset: str, frame: pd.DataFrame, found: np.ndarray, interval: int
+    ) -> int:
+        if frame.empty:
+            return 0
+        if dataset == "history":
+            seconds = gaps.to_epoch_seconds(frame["timestamp"], sort=False)
+            mask = gaps.in_gaps(seconds, found, interval)
+            self.price_history.append_dataframe(frame[mask])
+        else:
+            seconds = gaps.to_epoch_seconds(frame.index, sort=False)
+            mask = gaps.in_gaps(seconds, found, interval)
+            if mask.any():
+                self._merge_candles(dataset, frame[mask])
+        return int(mask.sum())
 
     @abc.abstractmethod
     def get_current_price(self, currency) -> Optional[float]:
@@ -0,0 +1,172 @@
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+PRICE_FIELDS = ("usd", "sat_usd", "fiat", "sat_fiat", "timestamp")
+# Bumped whenever the table layout changes, older cache files are rebuilt
+SCHEMA_VERSION = 1
+
+
+def default_cache_path() -> str:
+    return os.path.join(tempfile.gettempdir(), "btcpriceticker-cache.sqlite")
+
+
+class SharedQuoteCache:
+    """Host wide quote cache in a SQLite WAL file.
+
+    Entries are keyed by service, base asset and fiat.
+
+    Every Price instance on the host can read a fresh entry instead of calling
+    the upstream API. A short lease makes sure that only one process refreshes
+    a stale entry while the others wait for its result.
+    """
+
+    def __init__(self, path: Optional[str] = None, lease_time: float = 30.0):
+        self.path = path or default_cache_path()
+        self.lease_time = lease_time
+        self.owner = f"{os.getpid()}:{id(self)}"
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, timeout=10, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+
+    def _create_tables(self) -> None:
+        cursor = self._connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            (version,) = cursor.execute("PRAGMA user_version").fetchone()
+            if version < SCHEMA_VERSION:
+                cursor.execute("DROP TABLE IF EXISTS quotes")
+                cursor.execute("DROP TABLE IF EXISTS leases")
+                cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS quotes ("
+                "service TEXT, asset TEXT, fiat TEXT, usd REAL, sat_usd REAL, "
+                "fiat_price REAL, sat_fiat REAL, timestamp REAL, "
+                "PRIMARY KEY (service, asset, fiat))"
+            )
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS leases ("
+                "service TEXT, asset TEXT, fiat TEXT, owner TEXT, expires REAL, "
+                "PRIMARY KEY (service, asset, fiat))"
+            )
+            cursor.execute("COMMIT")
+        except sqlite3.Error:
+            cursor.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def get(
+        self, service: str, fiat: str, asset: str = "BTC"
+    ) -> Optional[dict[str, float]]:
+        """Return the cached price dict of ``asset`` in ``fiat`` if present."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT usd, sat_usd, fiat_price, sat_fiat, timestamp FROM quotes "
+                "WHERE service = ? AND asset = ? AND fiat = ?",
+                (service, asset.upper(), fiat.lower()),
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(PRICE_FIELDS, row))
+
+    def get_fresh(
+        self, service: str, fiat: str, max_age: float, asset: str = "BTC"
+    ) -> Optional[dict[str, float]]:
+        entry = self.get(service, fiat, asset)
+        if entry is None or time.time() - entry["timestamp"] >= max_age:
+            return None
+        return entry
+
+    def put(
+        self, service: str, fiat: str, price: dict[str, float], asset: str = "BTC"
+    ) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO quotes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    service,
+                    asset.upper(),
+                    fiat.lower(),
+                    price["usd"],
+                    price["sat_usd"],
+                    price["fiat"],
+                    price["sat_fiat"],
+                    price["timestamp"],
+                ),
+            )
+
+    def acquire_refresh(self, service: str, fiat: str, asset: str = "BTC") -> bool:
+        """Try to become the only process refreshing ``service`` and ``fiat``."""
+        now = time.time()
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                row = cursor.execute(
+                    "SELECT owner, expires FROM leases "
+                    "WHERE service = ? AND asset = ? AND fiat = ?",
+                    (service, asset.upper(), fiat.lower()),
+                ).fetchone()
+                if row is not None and row[0] != self.owner and row[1] > now:
+                    cursor.execute("ROLLBACK")
+                    return False
+                cursor.execute(
+                    "INSERT OR REPLACE INTO leases VALUES (?, ?, ?, ?, ?)",
+                    (
+                        service,
+                        asset.upper(),
+                        fiat.lower(),
+                        self.owner,
+                        now + self.lease_time,
+                    ),
+                )
+                cursor.execute("COMMIT")
+            except sqlite3.Error:
+                cursor.execute("ROLLBACK")
+                raise
+        return True
+
+    def release_refresh(self, service: str, fiat: str, asset: str = "BTC") -> None:
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM leases "
+                "WHERE service = ? AND asset = ? AND fiat = ? AND owner = ?",
+                (service, asset.upper(), fiat.lower(), self.owner),
+            )
+
+    def wait_for_fresh(
+        self,
+        service: str,
+        fiat: str,
+        max_age: float,
+        poll: float = 0.1,
+        asset: str = "BTC",
+    ) -> Optional[dict[str, float]]:
+        """Wait while another process refreshes ``service`` and ``fiat``.
+
+        Returns the published quote, or None once the lease could be taken
+        over, in which case the caller has to refresh and release it.
+        """
+        while True:
+            entry = self.get_fresh(service, fiat, max_age, asset)
+            if entry is not None:
+                return entry
+            if self.acquire_refresh(service, fiat, asset):
+                logger.debug(
+                    "Took over the refresh lease of %s/%s/%s", service, asset, fiat
+                )
+                return None
+            time.sleep(poll)
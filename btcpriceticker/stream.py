@@ -0,0 +1,213 @@
+import abc
+import asyncio
+import json
+import logging
+import threading
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+WEBSOCKETS_MODULE = None
+try:
+    import websockets
+
+    WEBSOCKETS_MODULE = "websockets"
+except ImportError:  # pragma: no cover
+    websockets = None  # type: ignore
+
+
+class TickerStream(abc.ABC):
+    """Push prices from a public exchange WebSocket ticker feed into a Service.
+
+    The feed runs in a background thread with its own event loop and
+    reconnects with exponential backoff when the connection drops.
+    """
+
+    url = ""
+
+    def __init__(
+        self,
+        service: Any,
+        url: Optional[str] = None,
+        min_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ):
+        if not WEBSOCKETS_MODULE:
+            raise RuntimeError("Streaming requires the 'websockets' package")
+        self.service = service
+        self.url = url or self.url
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.reconnects = 0
+        self.messages = 0
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._ws: Any = None
+        self._ready = threading.Event()
+
+    @property
+    def symbol(self) -> str:
+        return f"{self.service.base_asset}/{self.service.fiat.upper()}"
+
+    def subscribe_messages(self) -> list[dict[str, Any]]:
+        """Return the messages sent after connecting."""
+        return []
+
+    @abc.abstractmethod
+    def parse_price(self, message: Any) -> Optional[float]:
+        """Extract the last traded price from a decoded feed message."""
+
+    def handle_message(self, raw: Any) -> Optional[float]:
+        try:
+            message = json.loads(raw)
+            price = self.parse_price(message)
+        except (ValueError, TypeError, KeyError, IndexError):
+            logger.debug("Ignoring unexpected stream message %s", raw)
+            return None
+        if price is None:
+            return None
+        self.messages += 1
+        self.service.on_stream_price(price)
+        return price
+
+    async def _connect_once(self) -> None:
+        async with websockets.connect(self.url) as ws:
+            self._ws = ws
+            for message in self.subscribe_messages():
+                await ws.send(json.dumps(message))
+            async for raw in ws:
+                self.handle_message(raw)
+
+    async def _run(self) -> None:
+        self._stopping = asyncio.Event()
+        self._ready.set()
+        backoff = self.min_backoff
+        while not self._stopping.is_set():
+            received = self.messages
+            try:
+                await self._connect_once()
+            except Exception as exc:
+                logger.warning("Ticker stream %s failed: %s", self.url, exc)
+            finally:
+                self._ws = None
+            if self._stopping.is_set():
+                break
+            if self.messages > received:
+                backoff = self.min_backoff
+            self.reconnects += 1
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=backoff)
+            except asyncio.TimeoutError:
+                pass
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def _thread_main(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(self._run())
+        finally:
+            self._loop.close()
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._thread_main, daemon=True)
+        self._thread.start()
+
+    def _request_stop(self) -> None:
+        assert self._stopping is not None
+        self._stopping.set()
+        if self._ws is not None:
+            asyncio.ensure_future(self._ws.close())
+
+    def stop(self, timeout: float = 5.0) -> None:
+        if self._thread is None:
+            return
+        if self._ready.wait(timeout) and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._request_stop)
+        self._thread.join(timeout)
+        self._thread = None
+
+
+class KrakenTickerStream(TickerStream):
+    url = "wss://ws.kraken.com/v2"
+
+    def subscribe_messages(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "method": "subscribe",
+                "params": {"channel": "ticker", "symbol": [self.symbol]},
+            }
+        ]
+
+    def parse_price(self, message: Any) -> Optional[float]:
+        if not isinstance(message, dict) or message.get("channel") != "ticker":
+            return None
+        for entry in message.get("data", []):
+            if entry.get("symbol") == self.symbol and entry.get("last") is not None:
+                return float(entry["last"])
+        return None
+
+
+class BinanceTickerStream(TickerStream):
+    url = "wss://stream.binance.com:9443/ws"
+
+    def subscribe_messages(self) -> list[dict[str, Any]]:
+        stream = self.symbol.replace("/", "").lower() + "@ticker"
+        return [{"method": "SUBSCRIBE", "params": [stream], "id": 1}]
+
+    def parse_price(self, message: Any) -> Optional[float]:
+        if not isinstance(message, dict) or message.get("e") != "24hrTicker":
+            return None
+        if message.get("s") != self.symbol.replace("/", ""):
+            return None
+        return float(message["c"])
+
+
+class CoinbaseTickerStream(TickerStream):
+    url = "wss://ws-feed.exchange.coinbase.com"
+
+    @property
+    def product_id(self) -> str:
+        return self.symbol.replace("/", "-")
+
+    def subscribe_messages(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "type": "subscribe",
+                "product_ids": [self.product_id],
+                "channels": ["ticker"],
+            }
+        ]
+
+    def parse_price(self, message: Any) -> Optional[float]:
+        if not isinstance(message, dict) or message.get("type") != "ticker":
+            return None
+        if message.get("product_id") != self.product_id:
+            return None
+        return float(message["price"])
+
+
+class BitvavoTickerStream(TickerStream):
+    url = "wss://ws.bitvavo.com/v2/"
+
+    @property
+    def market(self) -> str:
+        return self.symbol.replace("/", "-")
+
+    def subscribe_messages(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "action": "subscribe",
+                "channels": [{"name": "ticker", "markets": [self.market]}],
+            }
+        ]
+
+    def parse_price(self, message: Any) -> Optional[float]:
+        if not isinstance(message, dict) or message.get("event") != "ticker":
+            return None
+        if message.get("market") != self.market or "lastPrice" not in message:
+            return None
+        return float(message["lastPrice"])
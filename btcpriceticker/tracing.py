@@ -0,0 +1,177 @@
+import contextvars
+import functools
+import logging
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+OTEL_MODULE = None
+try:
+    from opentelemetry import trace as otel_trace
+
+    OTEL_MODULE = "opentelemetry"
+except ImportError:  # pragma: no cover
+    otel_trace = None  # type: ignore
+
+# Attributes a span takes over from its parent unless given explicitly
+INHERITED_ATTRIBUTES = ("service", "fiat")
+
+SpanHook = Callable[["Span"], None]
+
+_hooks: list[SpanHook] = []
+_tracer: Optional[Any] = None
+_current: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "btcpriceticker_span", default=None
+)
+
+
+class _NoopSpan:
+    """Shared stand-in returned while tracing is disabled."""
+
+    name = ""
+    attributes: dict[str, Any] = {}
+    parent = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """One timed stage of a refresh, handed to the hooks when it ends."""
+
+    def __init__(self, name: str, attributes: dict[str, Any]):
+        self.name = name
+        self.parent = _current.get()
+        if self.parent is not None:
+            for key in INHERITED_ATTRIBUTES:
+                if key not in attributes and key in self.parent.attributes:
+                    attributes[key] = self.parent.attributes[key]
+        self.attributes = attributes
+        self.start = 0.0
+        self.end = 0.0
+        self.cpu_start = 0.0
+        self.cpu_end = 0.0
+        self.error: Optional[BaseException] = None
+        self._token: Optional[contextvars.Token] = None
+        self._otel_context: Optional[Any] = None
+        self._otel_span: Optional[Any] = None
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    @property
+    def cpu_time(self) -> float:
+        """CPU seconds of the process while the span was open."""
+        return self.cpu_end - self.cpu_start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+        if self._otel_span is not None and value is not None:
+            self._otel_span.set_attribute(key, value)
+
+    def __enter__(self) -> "Span":
+        if _tracer is not None:
+            attributes = {k: v for k, v in self.attributes.items() if v is not None}
+            self._otel_context = _tracer.start_as_current_span(
+                self.name, attributes=attributes
+            )
+            self._otel_span = self._otel_context.__enter__()
+        self._token = _current.set(self)
+        self.start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.end = time.perf_counter()
+        self.cpu_end = time.process_time()
+        if self._token is not None:
+            _current.reset(self._token)
+        if exc is not None:
+            self.error = exc
+            self.attributes["error"] = repr(exc)
+        if self._otel_context is not None:
+            self._otel_context.__exit__(exc_type, exc, traceback)
+        for hook in list(_hooks):
+            try:
+                hook(self)
+            except Exception as hook_error:
+                logger.warning("Span hook %s failed: %s", hook, hook_error)
+
+
+def enabled() -> bool:
+    return bool(_hooks) or _tracer is not None
+
+
+def span(name: str, **attributes: Any) -> Any:
+    """Return a context manager timing ``name``, a shared no-op when disabled."""
+    if not _hooks and _tracer is None:
+        return NOOP_SPAN
+    return Span(name, attributes)
+
+
+def current_span() -> Any:
+    """Return the innermost active span, or the no-op span."""
+    return _current.get() or NOOP_SPAN
+
+
+def traced(
+    name: str, attributes: Optional[Callable[[Any], dict[str, Any]]] = None
+) -> Callable:
+    """Decorate a method to run inside ``span(name)``.
+
+    ``attributes`` is called with the instance to build the span attributes,
+    a bool, number or str return value is added as ``result``.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _hooks and _tracer is None:
+                return func(*args, **kwargs)
+            values = attributes(args[0]) if attributes is not None else {}
+            with Span(name, values) as current:
+                result = func(*args, **kwargs)
+                if isinstance(result, (bool, int, float, str)):
+                    current.set_attribute("result", result)
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+def add_hook(hook: SpanHook) -> None:
+    """Call ``hook`` with every finished span."""
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+
+def remove_hook(hook: SpanHook) -> None:
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def enable_opentelemetry(tracer: Optional[Any] = None) -> None:
+    """Emit every span to OpenTelemetry, by default the global tracer provider."""
+    global _tracer
+    if not OTEL_MODULE:
+        raise RuntimeError(
+            "OpenTelemetry spans require the 'opentelemetry-api' package"
+        )
+    _tracer = tracer or otel_trace.get_tracer("btcpriceticker")
+
+
+def disable_opentelemetry() -> None:
+    global _tracer
+    _tracer = None
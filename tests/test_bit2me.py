@@ -45,6 +45,20 @@ class TestBit2Me(unittest.TestCase):
         assert prices[0] == approx(16000.0)
         assert prices[1] == approx(16400.0)
 
+    def test_update_price_history_drops_incomplete_rows(self):
+        chart_data = [
+            [1712497400000, "0.00005", "0.8"],
+            [1712498400000, None, "0.8"],
+            [1712499400000, "0.00005", None],
+            [1712500400000, "0.00005", "0.82"],
+        ]
+        with patch.object(Bit2Me, "_chart", return_value=chart_data):
+            service = Bit2Me("EUR")
+            service.update_price_history("EUR")
+
+        prices = service.price_history.data["price"].tolist()
+        assert prices == [approx(16000.0), approx(16400.0)]
+
     def test_fetch_ohlc_point_converts_prices(self):
         service = Bit2Me("EUR")
         target_dt = datetime(2025, 1, 1, tzinfo=timezone.utc)
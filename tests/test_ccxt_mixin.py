@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import MagicMock
+
+from btcpriceticker.binance import Binance
+from btcpriceticker.bitvavo import Bitvavo
+from btcpriceticker.coinbase import Coinbase
+from btcpriceticker.kraken import Kraken
+
+BACKENDS = (Kraken, Binance, Coinbase, Bitvavo)
+
+
+def make_service(cls):
+    service = cls("EUR", interval="1h", enable_timeseries=False)
+    service.exchange = MagicMock()
+    return service
+
+
+class TestCcxtMixin(unittest.TestCase):
+    def test_fetch_range_is_capped_at_the_page_size(self):
+        for cls in BACKENDS:
+            with self.subTest(backend=cls.__name__):
+                service = make_service(cls)
+                service.exchange.fetch_ohlcv.return_value = [
+                    [1609459200000, 29000, 29500, 28500, 29200, 10.5],
+                ]
+                start = 1609459200
+                end = start + 5000 * 3600
+
+                candles = service.fetch_range("ohlcv", "EUR", start, end)
+
+                service.exchange.fetch_ohlcv.assert_called_once_with(
+                    "BTC/EUR",
+                    timeframe="1h",
+                    since=start * 1000,
+                    limit=cls.backfill_page_size,
+                )
+                self.assertEqual(len(candles), 1)
+
+    def test_has_native_fiat_checks_the_markets(self):
+        for cls in BACKENDS:
+            with self.subTest(backend=cls.__name__):
+                service = make_service(cls)
+                service.exchange.load_markets.return_value = {"BTC/EUR": {}}
+
+                self.assertTrue(service.has_native_fiat("eur"))
+                self.assertFalse(service.has_native_fiat("CHF"))
+
+    def test_asset_prices_skip_unlisted_pairs(self):
+        service = make_service(Kraken)
+        service.exchange.load_markets.return_value = {"ETH/EUR": {}, "SOL/USD": {}}
+        service.exchange.fetch_tickers.return_value = {
+            "ETH/EUR": {"last": 2000},
+            "SOL/USD": {"close": 100},
+        }
+
+        prices = service.get_asset_prices(["eth", "sol"], ["EUR", "USD"])
+
+        self.assertEqual(prices, {"ETH": {"EUR": 2000.0}, "SOL": {"USD": 100.0}})
+        service.exchange.fetch_tickers.assert_called_once_with(["ETH/EUR", "SOL/USD"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,5 @@
+import json
+import pstats
 from unittest.mock import MagicMock, patch
 
 from typer.testing import CliRunner
@@ -17,7 +19,14 @@ class TestCLI:
         assert isinstance(_version.version_tuple, tuple)
 
     def test_main_updates_state(self):
-        main(verbose=1, service="kraken")
+        main(
+            MagicMock(),
+            verbose=1,
+            service="kraken",
+            record=None,
+            replay=None,
+            profile=None,
+        )
 
         assert state["verbose"] == 1
         assert state["service"] == "kraken"
@@ -91,3 +100,108 @@ class TestCLI:
                 enable_ohlcv=False,
             )
             assert state["service"] == "kraken"
+
+    def test_watch_streams_json_lines(self):
+        snapshot = {
+            "service": "mempool",
+            "fiat": "EUR",
+            "price": 42000.0,
+            "usd": 50000.0,
+            "sat_fiat": 2380.95,
+            "sat_usd": 2000.0,
+            "timestamp": 1700000000.0,
+        }
+        with (
+            patch("btcpriceticker.cli.Price") as mock_price,
+            patch("btcpriceticker.cli.time.sleep") as mock_sleep,
+        ):
+            price_instance = mock_price.return_value
+            price_instance.refresh.return_value = True
+            price_instance.get_snapshot.return_value = snapshot
+
+            result = self.runner.invoke(
+                app,
+                ["watch", "eur", "--json", "--count", "3", "--min-refresh-time", "5"],
+            )
+
+            assert result.exit_code == 0
+            mock_price.assert_called_once_with(
+                service="mempool",
+                fiat="eur",
+                min_refresh_time=5,
+                enable_ohlc=False,
+                enable_timeseries=False,
+                enable_ohlcv=False,
+            )
+            lines = result.stdout.strip().splitlines()
+            assert len(lines) == 3
+            assert json.loads(lines[0])["price"] == 42000.0
+            assert price_instance.refresh.call_count == 3
+            assert mock_sleep.call_count == 2
+            assert all(call.args[0] <= 5 for call in mock_sleep.call_args_list)
+
+    def test_watch_prints_text_lines(self):
+        with (
+            patch("btcpriceticker.cli.Price") as mock_price,
+            patch("btcpriceticker.cli.time.sleep"),
+        ):
+            price_instance = mock_price.return_value
+            price_instance.refresh.return_value = True
+            price_instance.get_price_now.return_value = "42,000"
+            price_instance.get_snapshot.return_value = {
+                "fiat": "EUR",
+                "timestamp": 1700000000.0,
+            }
+
+            result = self.runner.invoke(app, ["watch", "eur", "--count", "1"])
+
+            assert result.exit_code == 0
+            assert result.stdout.strip() == "2023-11-14T22:13:20+00:00 42,000 EUR"
+
+    def test_serve_binds_and_serves_shared_price(self):
+        with (
+            patch("btcpriceticker.cli.Price") as mock_price,
+            patch("btcpriceticker.cli.PriceServer") as mock_server,
+        ):
+            result = self.runner.invoke(
+                app, ["serve", "eur", "--port", "9000", "--ohlcv"]
+            )
+
+            assert result.exit_code == 0
+            assert mock_price.call_args.kwargs["enable_ohlcv"] is True
+            mock_server.assert_called_once_with(mock_price.return_value)
+            server = mock_server.return_value
+            server.bind.assert_called_once_with(
+                host="127.0.0.1", port=9000, unix_socket=None
+            )
+            server.serve_forever.assert_called_once()
+
+    def test_profile_writes_dump_and_summary(self, tmp_path):
+        path = tmp_path / "price.prof"
+        with patch("btcpriceticker.cli.Price") as mock_price:
+            mock_price.return_value.get_price_now.return_value = "123"
+
+            result = self.runner.invoke(
+                app, ["--profile", str(path), "--profile-top", "5", "price", "eur"]
+            )
+
+            assert result.exit_code == 0
+            assert "network wait 0.000s in 0 requests" in result.output
+            assert "ncalls" in result.output
+            assert pstats.Stats(str(path)).total_calls > 0
+
+    def test_ohlcv_exports_requested_format(self, tmp_path):
+        path = str(tmp_path / "candles.jsonl")
+        with patch("btcpriceticker.cli.Price") as mock_price:
+            price_instance = mock_price.return_value
+
+            result = self.runner.invoke(
+                app, ["ohlcv", "usd", "1h", "--format", "jsonl", "--output", path]
+            )
+
+            assert result.exit_code == 0
+            price_instance.export.assert_called_once_with("ohlcv", "jsonl", path)
+
+            price_instance.export.side_effect = ValueError("Unknown format 'xml'")
+            result = self.runner.invoke(app, ["ohlc", "usd", "1h", "--format", "xml"])
+            assert result.exit_code == 2
@@ -1,4 +1,5 @@
 import unittest
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
 from btcpriceticker.coingecko import CoinGecko
@@ -39,6 +40,93 @@ class TestCoinGecko(unittest.TestCase):
             history, {"prices": [[1609459200000, 40000], [1609545600000, 50000.0]]}
         )
 
+    @patch("btcpriceticker.coingecko.CoinGeckoAPI.get_coin_ohlc_by_id")
+    def test_get_ohlcv_uses_smallest_bucket_of_same_tier(
+        self, mock_get_coin_ohlc_by_id
+    ):
+        now = datetime.now(timezone.utc)
+        mock_get_coin_ohlc_by_id.return_value = [
+            [(now - timedelta(hours=1)).timestamp() * 1000, 1, 2, 0.5, 1.5],
+            [now.timestamp() * 1000, 1.5, 2.5, 1, 2],
+        ]
+
+        cg = CoinGecko("usd", whichcoin="bitcoin", days_ago=365)
+        existing = [(now - timedelta(minutes=90)).timestamp()]
+        df = cg.get_ohlcv("usd", existing_timestamp=existing)
+
+        # 4 day candles are stored, smaller buckets would return 30m or 4h ones
+        mock_get_coin_ohlc_by_id.assert_called_once_with("bitcoin", "usd", 90)
+        self.assertEqual(len(df), 2)
+        self.assertEqual(df["Volume"].tolist(), [0.0, 0.0])
+
+        self.assertEqual(cg._ohlc_bucket(), 365)
+        old = [(now - timedelta(days=100)).timestamp()]
+        self.assertEqual(cg._ohlc_bucket(old), 180)
+        cg.days_ago = 30
+        self.assertEqual(cg._ohlc_bucket(existing), 7)
+        self.assertEqual(cg._ohlc_bucket(old), 30)
+        cg.days_ago = 1
+        self.assertEqual(cg._ohlc_bucket(existing), 1)
+
+    @patch("btcpriceticker.coingecko.CoinGeckoAPI.get_coin_ohlc_by_id_range")
+    def test_get_ohlcv_uses_range_endpoint_with_api_key(self, mock_range):
+        mock_range.return_value = []
+        cg = CoinGecko("usd", whichcoin="bitcoin", days_ago=30)
+        cg.api_key = "key"
+        last = (datetime.now(timezone.utc) - timedelta(hours=3)).timestamp()
+
+        cg.get_ohlcv("usd", existing_timestamp=[last])
+
+        kwargs = mock_range.call_args.kwargs
+        self.assertEqual(kwargs["from_timestamp"], int(last) + 1)
+        self.assertEqual(kwargs["interval"], "hourly")
+
+    @patch("btcpriceticker.coingecko.CoinGeckoAPI.get_coin_ohlc_by_id")
+    @patch("btcpriceticker.coingecko.CoinGeckoAPI.get_coin_ohlc_by_id_range")
+    def test_range_candles_are_aggregated_to_stored_size(self, mock_range, mock_ohlc):
+        now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        last = now - timedelta(hours=5)
+        mock_range.return_value = [
+            [(last + timedelta(hours=h)).timestamp() * 1000, h, h + 1, h - 1, h]
+            for h in range(1, 6)
+        ]
+        cg = CoinGecko("usd", whichcoin="bitcoin", days_ago=30)
+        cg.api_key = "key"
+
+        df = cg.get_ohlcv("usd", existing_timestamp=[last.timestamp()])
+
+        self.assertEqual(
+            df.index.tolist(), [last + timedelta(hours=4), last + timedelta(hours=8)]
+        )
+        self.assertEqual(
+            df.iloc[0][["Open", "High", "Low", "Close"]].tolist(), [1, 5, 0, 4]
+        )
+        self.assertEqual(df.iloc[1]["Close"], 5)
+
+        # 30 minute candles can not be built from hourly ones
+        cg.days_ago = 1
+        mock_ohlc.return_value = []
+        cg.get_ohlcv("usd", existing_timestamp=[last.timestamp()])
+        mock_ohlc.assert_called_once_with("bitcoin", "usd", 1)
+        self.assertEqual(mock_range.call_count, 1)
+
+    @patch("btcpriceticker.coingecko.CoinGeckoAPI.get_price")
+    def test_get_asset_prices_uses_one_request(self, mock_get_price):
+        mock_get_price.return_value = {
+            "ethereum": {"usd": 2500, "eur": 2000},
+            "solana": {"usd": 150},
+        }
+
+        cg = CoinGecko("eur", whichcoin="bitcoin")
+        prices = cg.get_asset_prices(["eth", "SOL", "unknown"], ["USD", "EUR"])
+
+        mock_get_price.assert_called_once_with(
+            ids="ethereum,solana", vs_currencies="usd,eur"
+        )
+        self.assertEqual(
+            prices, {"ETH": {"USD": 2500.0, "EUR": 2000.0}, "SOL": {"USD": 150.0}}
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
 from btcpriceticker.coinpaprika import CoinPaprika
@@ -13,6 +14,19 @@ class TestCoinpaprika(unittest.TestCase):
         price = cp.get_current_price("USD")
         self.assertEqual(price, 50000)
 
+    @patch("coinpaprika.client.Client.ticker")
+    def test_get_current_prices_batches_quotes(self, mock_ticker):
+        mock_ticker.side_effect = lambda coin, quotes: {
+            "quotes": {code: {"price": 1000.0} for code in quotes.split(",")}
+        }
+
+        cp = CoinPaprika("USD", whichcoin="btc-bitcoin")
+        prices = cp.get_current_prices(["USD", "EUR", "GBP", "CHF"])
+
+        self.assertEqual(mock_ticker.call_count, 2)
+        self.assertEqual(mock_ticker.call_args_list[0].kwargs["quotes"], "USD,EUR,GBP")
+        self.assertEqual(prices["CHF"], 1000.0)
+
     @patch("coinpaprika.client.Client.exchange_markets")
     def test_get_exchange_usd_price(self, mock_markets):
         mock_markets.return_value = [
@@ -23,6 +37,68 @@ class TestCoinpaprika(unittest.TestCase):
         price = cp.get_exchange_usd_price("binance", "BTC/USDC")
         self.assertEqual(price, 50000)
 
+    @patch("coinpaprika.client.Client.ohlcv")
+    def test_get_ohlcv_decodes_records(self, mock_ohlcv):
+        mock_ohlcv.return_value = [
+            {
+                "time_open": f"2024-01-0{day}T00:00:00Z",
+                "open": 100.0 * day,
+                "high": 110.0 * day,
+                "low": 90.0 * day,
+                "close": 105.0 * day,
+                "volume": 1.0,
+            }
+            for day in range(1, 5)
+        ]
+
+        cp = CoinPaprika("USD", whichcoin="btc-bitcoin", days_ago=1)
+        df = cp.get_ohlcv("USD")
+
+        self.assertListEqual(
+            list(df.columns), ["Open", "High", "Low", "Close", "Volume"]
+        )
+        self.assertListEqual(df["Open"].tolist(), [300.0, 400.0])
+
+    @patch("coinpaprika.client.Client.ohlcv")
+    def test_get_ohlcv_requests_only_missing_range(self, mock_ohlcv):
+        mock_ohlcv.return_value = []
+        cp = CoinPaprika("USD", whichcoin="btc-bitcoin", days_ago=30)
+        last_candle = datetime.now(timezone.utc) - timedelta(days=2)
+
+        cp.get_ohlcv("USD", existing_timestamp=[last_candle.timestamp()])
+
+        kwargs = mock_ohlcv.call_args.kwargs
+        start = datetime.strptime(kwargs["start"], "%Y-%m-%dT%H:%M:%SZ")
+        self.assertEqual(
+            start.replace(tzinfo=timezone.utc),
+            (last_candle + timedelta(days=1)).replace(microsecond=0),
+        )
+        self.assertEqual(kwargs["limit"], 2)
+
+    @patch("coinpaprika.client.Client.ohlcv")
+    def test_get_ohlcv_skips_request_when_up_to_date(self, mock_ohlcv):
+        cp = CoinPaprika("USD", whichcoin="btc-bitcoin")
+        last_candle = datetime.now(timezone.utc) - timedelta(hours=1)
+
+        df = cp.get_ohlcv("USD", existing_timestamp=[last_candle.timestamp()])
+
+        mock_ohlcv.assert_not_called()
+        self.assertTrue(df.empty)
+
+    @patch("coinpaprika.client.Client.tickers")
+    def test_get_asset_prices_reads_one_tickers_response(self, mock_tickers):
+        mock_tickers.return_value = [
+            {"id": "btc-bitcoin", "quotes": {"USD": {"price": 50000}}},
+            {"id": "eth-ethereum", "quotes": {"USD": {"price": 2500}}},
+            {"id": "sol-solana", "quotes": {"USD": {"price": 150}}},
+        ]
+
+        cp = CoinPaprika("USD", whichcoin="btc-bitcoin")
+        prices = cp.get_asset_prices(["ETH", "SOL"], ["USD"])
+
+        mock_tickers.assert_called_once_with(quotes="USD")
+        self.assertEqual(prices, {"ETH": {"USD": 2500.0}, "SOL": {"USD": 150.0}})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,87 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from btcpriceticker.decode import (
+    OHLCV_COLUMNS,
+    epoch_to_datetime,
+    iso_to_datetime,
+    records_to_frame,
+    rows_to_frame,
+    slice_after,
+    slice_last_days,
+    to_price_frame,
+)
+
+
+class TestDecode:
+    def test_epoch_to_datetime(self):
+        index = epoch_to_datetime([1609459200000, 1609462800000])
+
+        assert str(index.dtype) == "datetime64[ns, UTC]"
+        assert index[0] == datetime(2021, 1, 1, tzinfo=timezone.utc)
+        assert index[1] == datetime(2021, 1, 1, 1, tzinfo=timezone.utc)
+
+    def test_iso_to_datetime(self):
+        index = iso_to_datetime(["2021-01-01T00:00:00Z", "2021-01-01T01:00:00Z"])
+
+        assert str(index.dtype) == "datetime64[ns, UTC]"
+        assert index[1] == datetime(2021, 1, 1, 1, tzinfo=timezone.utc)
+
+    def test_rows_to_frame(self):
+        rows = [
+            [1609459200000, 29000, 29500, 28500, 29200, 10.5],
+            [1609462800000, 29200, 29600, 28900, 29450, 8.3],
+        ]
+        df = rows_to_frame(rows, OHLCV_COLUMNS)
+
+        assert list(df.columns) == OHLCV_COLUMNS
+        assert (df.dtypes == np.float64).all()
+        assert df.iloc[1]["Close"] == 29450.0
+        assert df.index[0] == pd.Timestamp("2021-01-01", tz="UTC")
+
+    def test_rows_to_frame_skips_incomplete_rows(self):
+        rows = [
+            [1609459200000, "0.5", "2"],
+            [],
+            [1609462800000, "invalid", "2"],
+            [1609466400000, "0.25"],
+            [1609470000000, "0.25", "3"],
+        ]
+        df = rows_to_frame(rows, ["inverse", "multiplier"])
+
+        assert len(df) == 2
+        assert df["multiplier"].tolist() == [2.0, 3.0]
+
+    def test_rows_to_frame_empty(self):
+        df = rows_to_frame([], OHLCV_COLUMNS)
+
+        assert df.empty
+        assert list(df.columns) == OHLCV_COLUMNS
+        assert isinstance(df.index, pd.DatetimeIndex)
+
+    def test_records_to_frame(self):
+        records = [
+            {"timestamp": "2023-01-01T12:00:00Z", "price": 42000},
+            {"timestamp": "2023-01-01T13:00:00Z", "price": "42100.5"},
+        ]
+        df = records_to_frame(records, "timestamp", {"price": "price"})
+
+        assert df["price"].tolist() == [42000.0, 42100.5]
+        assert df.index[0] == pd.Timestamp("2023-01-01T12:00:00Z")
+
+    def test_to_price_frame(self):
+        df = rows_to_frame([[1609459200000, 1.0], [1609462800000, 2.0]], ["Close"])
+        prices = to_price_frame(df, "Close")
+
+        assert list(prices.columns) == ["timestamp", "price"]
+        assert prices["price"].tolist() == [1.0, 2.0]
+
+    def test_slice_after_and_last_days(self):
+        rows = [[1609459200000 + i * 86400000, float(i)] for i in range(5)]
+        df = rows_to_frame(rows, ["Close"])
+
+        assert slice_after(df, 1609459200 + 86400)["Close"].tolist() == [2, 3, 4]
+        assert slice_after(df, None) is df
+        assert slice_last_days(df, 1)["Close"].tolist() == [3.0, 4.0]
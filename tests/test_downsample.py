@@ -0,0 +1,81 @@
+import unittest
+
+import numpy as np
+
+from btcpriceticker.downsample import DownsampleCache, downsample, lttb, minmax
+
+
+def reference_lttb(x, y, max_points):
+    """Straightforward LTTB, one point at a time."""
+    size = len(y)
+    every = (size - 2) / (max_points - 2)
+    selected = [0]
+    for bucket in range(max_points - 2):
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        if bucket == max_points - 3:
+            next_x, next_y = x[-1], y[-1]
+        else:
+            next_end = int((bucket + 2) * every) + 1
+            next_x, next_y = x[end:next_end].mean(), y[end:next_end].mean()
+        a = selected[-1]
+        areas = [
+            abs((x[a] - next_x) * (y[j] - y[a]) - (x[a] - x[j]) * (next_y - y[a]))
+            for j in range(start, end)
+        ]
+        selected.append(start + int(np.argmax(areas)))
+    selected.append(size - 1)
+    return selected
+
+
+class TestDownsample(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.prices = 100 + np.cumsum(rng.normal(size=1000))
+        self.times = np.arange(1000, dtype="int64") * 60 * 10**9
+
+    def test_lttb_matches_reference(self):
+        x = np.arange(1000, dtype="float64")
+        for max_points in (3, 10, 100, 250):
+            self.assertEqual(
+                lttb(x, self.prices, max_points).tolist(),
+                reference_lttb(x, self.prices, max_points),
+            )
+        self.assertEqual(lttb(x, self.prices, 2000).tolist(), list(range(1000)))
+
+    def test_minmax_keeps_extremes(self):
+        index = minmax(self.prices, 100)
+        self.assertLessEqual(len(index), 100)
+        self.assertTrue((np.diff(index) > 0).all())
+        self.assertEqual(index[0], 0)
+        self.assertEqual(index[-1], 999)
+        self.assertEqual(self.prices[index].min(), self.prices.min())
+        self.assertEqual(self.prices[index].max(), self.prices.max())
+
+    def test_downsample_skips_nan(self):
+        prices = self.prices.copy()
+        prices[[0, 500]] = np.nan
+        for method in ("lttb", "minmax"):
+            index = downsample(self.times, prices, 50, method)
+            self.assertFalse(np.isnan(prices[index]).any())
+            self.assertEqual(index[0], 1)
+            self.assertEqual(index[-1], 999)
+        self.assertEqual(len(downsample([], [], 10)), 0)
+
+    def test_downsample_validates_arguments(self):
+        with self.assertRaises(ValueError):
+            downsample(self.times, self.prices, 100, "mean")
+        with self.assertRaises(ValueError):
+            downsample(self.times, self.prices, 1)
+
+    def test_cache_is_dropped_for_new_frame(self):
+        cache = DownsampleCache()
+        first, second = np.zeros(1), np.zeros(1)
+        self.assertIsNone(cache.get(first, "key"))
+        cache.put("key", 1)
+        self.assertEqual(cache.get(first, "key"), 1)
+        self.assertIsNone(cache.get(second, "key"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from btcpriceticker.export import PYARROW_MODULE, export_frame, iter_chunks
+from btcpriceticker.price import Price
+
+try:
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pass
+
+
+def make_candles(size=5):
+    index = pd.date_range("2024-01-01", periods=size, freq="1h", tz="UTC")
+    close = [float(i) for i in range(size)]
+    return pd.DataFrame(
+        {"Open": close, "High": close, "Low": close, "Close": close, "Volume": close},
+        index=index,
+    )
+
+
+class TestExportFrame(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def test_chunks_move_index_to_timestamp(self):
+        chunks = list(iter_chunks(make_candles(), chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(chunks[0].columns[0], "timestamp")
+        self.assertEqual(len(list(iter_chunks(pd.DataFrame(), chunk_size=2))), 1)
+
+    def test_csv_writes_one_header(self):
+        handle = io.StringIO()
+        self.assertEqual(export_frame(make_candles(), "csv", handle, chunk_size=2), 5)
+
+        lines = handle.getvalue().splitlines()
+        self.assertEqual(len(lines), 6)
+        self.assertTrue(lines[0].startswith("timestamp,Open"))
+
+    def test_jsonl_writes_one_record_per_line(self):
+        path = self.path("candles.jsonl")
+        export_frame(make_candles(), "jsonl", path, chunk_size=2)
+
+        with open(path) as handle:
+            records = [json.loads(line) for line in handle]
+        self.assertEqual(len(records), 5)
+        self.assertEqual(records[4]["Close"], 4.0)
+        self.assertTrue(records[0]["timestamp"].startswith("2024-01-01T00:00:00"))
+
+    @unittest.skipUnless(PYARROW_MODULE, "requires pyarrow")
+    def test_parquet_and_arrow_stream_row_groups(self):
+        candles = make_candles()
+        export_frame(candles, "parquet", self.path("c.parquet"), chunk_size=2)
+        export_frame(candles, "arrow", self.path("c.arrow"), chunk_size=2)
+
+        parquet = pyarrow.parquet.ParquetFile(self.path("c.parquet"))
+        self.assertEqual(parquet.metadata.num_row_groups, 3)
+        self.assertEqual(parquet.read().column("Close").to_pylist()[-1], 4.0)
+        with pyarrow.ipc.open_stream(self.path("c.arrow")) as reader:
+            table = reader.read_all()
+        self.assertEqual(table.num_rows, 5)
+        self.assertEqual(table.schema.field("timestamp").type.tz, "UTC")
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            export_frame(make_candles(), "xlsx", io.StringIO())
+
+
+class TestPriceExport(unittest.TestCase):
+    def test_history_is_exported(self):
+        price = Price(service="mempool", enable_timeseries=True)
+        price.timeseries.add_price(pd.Timestamp("2024-01-01", tz="UTC"), 42000.0)
+        handle = io.StringIO()
+
+        self.assertEqual(price.export("history", "csv", handle), 1)
+        self.assertEqual(
+            handle.getvalue().splitlines()[1], "2024-01-01 00:00:00+00:00,42000.0"
+        )
+        with self.assertRaises(ValueError):
+            price.export("trades", "csv", handle)
+
+
+if __name__ == "__main__":
+    unittest.main()
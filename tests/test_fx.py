@@ -0,0 +1,97 @@
+import gc
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from btcpriceticker.fx import FxRates
+from btcpriceticker.kraken import Kraken
+
+
+class RateSource:
+    def __init__(self, rates):
+        self.rates = rates
+        self.calls = 0
+
+    def fetch(self):
+        self.calls += 1
+        return self.rates
+
+
+class TestFxRates(unittest.TestCase):
+    def test_rates_are_cached_until_ttl(self):
+        source = RateSource({"EUR": 0.9})
+        fx = FxRates(ttl=300, retry_after=0)
+        fx.add_provider(source.fetch)
+        fx.add_provider(source.fetch)
+
+        self.assertEqual(fx.get_rate("eur", now=1000), 0.9)
+        self.assertEqual(fx.get_rate("EUR", now=1200), 0.9)
+        self.assertEqual(source.calls, 1)
+        source.rates = {"EUR": 0.95}
+        self.assertEqual(fx.get_rate("EUR", now=1400), 0.95)
+        self.assertEqual(source.calls, 2)
+        self.assertEqual(fx.get_rate("USD"), 1.0)
+
+    def test_stale_rate_is_used_when_providers_fail(self):
+        fx = FxRates(ttl=10, retry_after=0, fallback=lambda: None)
+        fx.update({"GBP": 0.8}, now=0)
+
+        self.assertEqual(fx.get_rate("GBP", now=100), 0.8)
+        self.assertIsNone(fx.get_rate("JPY", now=100))
+
+    def test_update_from_btc_prices(self):
+        fx = FxRates()
+        fx.update_from_btc_prices({"USD": 50000.0, "EUR": 45000.0, "CHF": None})
+
+        self.assertAlmostEqual(fx.get_rate("EUR"), 0.9)
+        self.assertAlmostEqual(fx.convert(100.0, "EUR"), 90.0)
+
+    def test_providers_of_collected_services_are_dropped(self):
+        fallback = MagicMock(return_value={"EUR": 0.9})
+        fx = FxRates(retry_after=0, fallback=fallback)
+        source = RateSource({"EUR": 0.5})
+        fx.add_provider(source.fetch)
+        del source
+        gc.collect()
+
+        self.assertEqual(fx.get_rate("EUR"), 0.9)
+        fallback.assert_called_once()
+
+    def test_convert_frame_keeps_volume(self):
+        fx = FxRates()
+        fx.update({"EUR": 0.5})
+        frame = pd.DataFrame(
+            {"Open": [10], "High": [12], "Low": [8], "Close": [11], "Volume": [3]}
+        )
+
+        converted = fx.convert_frame(frame, "EUR")
+
+        self.assertEqual(converted["Close"].iloc[0], 5.5)
+        self.assertEqual(converted["Volume"].iloc[0], 3)
+
+
+class TestServiceDerivation(unittest.TestCase):
+    @patch("btcpriceticker.kraken.ccxt.kraken")
+    def test_missing_pair_is_derived_from_usd(self, mock_kraken):
+        exchange = MagicMock()
+        exchange.load_markets.return_value = {"BTC/USD": {}}
+        exchange.fetch_ticker.return_value = {"last": 50000}
+        exchange.fetch_ohlcv.return_value = [[1700000000000, 1, 2, 0.5, 1.5, 7]]
+        mock_kraken.return_value = exchange
+
+        service = Kraken("CHF", enable_ohlc=False, enable_timeseries=True)
+        service.fx_rates = FxRates()
+        service.fx_rates.update({"CHF": 0.9})
+        service.update()
+
+        self.assertEqual(service.price["fiat"], 45000.0)
+        symbols = {call.args[0] for call in exchange.fetch_ticker.call_args_list}
+        self.assertEqual(symbols, {"BTC/USD"})
+        self.assertEqual(service.ohlcv["Close"].iloc[0], 1.35)
+        self.assertEqual(service.ohlcv["Volume"].iloc[0], 7)
+        self.assertEqual(service.price_history.get_price_list(), [1.35])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from btcpriceticker.gaps import (
+    count_slots,
+    find_gaps,
+    in_gaps,
+    plan_requests,
+    to_epoch_seconds,
+)
+
+HOUR = 3600.0
+
+
+class TestFindGaps(unittest.TestCase):
+    def test_finds_missing_slots(self):
+        timestamps = np.array([0, 1, 2, 5, 6, 9]) * HOUR
+
+        gaps = find_gaps(timestamps, HOUR)
+
+        self.assertEqual(gaps.tolist(), [[3 * HOUR, 4 * HOUR], [7 * HOUR, 8 * HOUR]])
+        self.assertEqual(count_slots(gaps, HOUR), 4)
+
+    def test_tolerates_jitter_and_dense_points(self):
+        timestamps = np.array([0, 0.2, 1.3, 2.1, 3.0]) * HOUR
+        self.assertEqual(len(find_gaps(timestamps, HOUR)), 0)
+        self.assertEqual(find_gaps(np.array([]), HOUR).shape, (0, 2))
+
+    def test_to_epoch_seconds_sorts_and_drops_missing(self):
+        index = pd.DatetimeIndex(
+            ["1970-01-01 02:00", None, "1970-01-01 01:00"], tz="UTC"
+        )
+        self.assertEqual(to_epoch_seconds(index).tolist(), [HOUR, 2 * HOUR])
+        self.assertEqual(len(to_epoch_seconds(index, sort=False)), 3)
+
+
+class TestPlanRequests(unittest.TestCase):
+    def test_merges_gaps_that_fit_one_page(self):
+        gaps = np.array([[3, 4], [7, 8], [30, 30]]) * HOUR
+
+        self.assertEqual(
+            plan_requests(gaps, HOUR, page_size=10),
+            [(3 * HOUR, 8 * HOUR), (30 * HOUR, 30 * HOUR)],
+        )
+        self.assertEqual(plan_requests(gaps, HOUR), [(3 * HOUR, 30 * HOUR)])
+
+    def test_splits_long_gaps_into_pages(self):
+        gaps = np.array([[0, 9], [11, 12]]) * HOUR
+
+        ranges = plan_requests(gaps, HOUR, page_size=4)
+
+        self.assertEqual(
+            ranges,
+            [(0, 3 * HOUR), (4 * HOUR, 7 * HOUR), (8 * HOUR, 11 * HOUR)]
+            + [(12 * HOUR, 12 * HOUR)],
+        )
+
+    def test_single_slot_pages(self):
+        gaps = np.array([[3, 4]]) * HOUR
+        self.assertEqual(
+            plan_requests(gaps, HOUR, page_size=1),
+            [(3 * HOUR, 3 * HOUR), (4 * HOUR, 4 * HOUR)],
+        )
+
+
+class TestInGaps(unittest.TestCase):
+    def test_masks_rows_inside_gaps(self):
+        gaps = np.array([[3, 4], [7, 7]]) * HOUR
+        timestamps = np.array([2, 3, 4, 5, 6, 7, 8]) * HOUR
+
+        mask = in_gaps(timestamps, gaps, HOUR)
+
+        self.assertEqual(mask.tolist(), [False, True, True, False, False, True, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from btcpriceticker.binance import Binance
+from btcpriceticker.coingecko import CoinGecko
+from btcpriceticker.health import CLOSED, HALF_OPEN, OPEN, ServiceHealth
+from btcpriceticker.mempool import Mempool
+from btcpriceticker.price import Price
+
+
+class TestServiceHealth(unittest.TestCase):
+    def setUp(self):
+        self.health = ServiceHealth(failure_threshold=2, cooldown=10, max_cooldown=15)
+
+    def test_opens_after_consecutive_failures(self):
+        self.health.record_failure(1.0, now=100)
+        self.assertEqual(self.health.state, CLOSED)
+        self.health.record_failure(1.0, now=101)
+
+        self.assertEqual(self.health.state, OPEN)
+        self.assertFalse(self.health.allow_request(now=105))
+        self.assertEqual(self.health.score(now=105), 0.0)
+
+    def test_half_open_probe(self):
+        self.health.record_failure(1.0, now=100)
+        self.health.record_failure(1.0, now=100)
+
+        self.assertTrue(self.health.allow_request(now=110))
+        self.assertEqual(self.health.state, HALF_OPEN)
+        self.assertFalse(self.health.allow_request(now=110))
+
+        self.health.record_failure(1.0, now=111)
+        self.assertEqual(self.health.state, OPEN)
+        self.assertEqual(self.health.cooldown, 15)
+        self.assertFalse(self.health.available(now=125))
+
+        self.assertTrue(self.health.allow_request(now=126))
+        self.health.record_success(0.2, now=126)
+        self.assertEqual(self.health.state, CLOSED)
+        self.assertEqual(self.health.cooldown, 10)
+
+    def test_score_prefers_fast_reliable_fresh_services(self):
+        fast = ServiceHealth()
+        slow = ServiceHealth()
+        fast.record_success(0.1, now=1000)
+        slow.record_success(3.0, now=1000)
+        self.assertGreater(fast.score(now=1000), slow.score(now=1000))
+
+        flaky = ServiceHealth()
+        flaky.record_success(0.1, now=1000)
+        flaky.record_failure(0.1, now=1000)
+        self.assertGreater(fast.score(now=1000), flaky.score(now=1000))
+        self.assertGreater(fast.score(now=1000), fast.score(now=10000))
+
+
+class TestPriceFailover(unittest.TestCase):
+    def test_rank_keeps_rotation_order_when_healthy(self):
+        price = Price(service="mempool", enable_timeseries=False)
+        self.assertEqual(price.rank_services()[:2], ["coingecko", "coinpaprika"])
+
+        price.get_health("coingecko").record_failure(1.0)
+        self.assertEqual(price.rank_services()[0], "coinpaprika")
+
+    @patch.object(CoinGecko, "update")
+    @patch.object(Mempool, "update", side_effect=RuntimeError("timeout"))
+    def test_open_circuit_is_skipped(self, mempool_update, coingecko_update):
+        price = Price(service="mempool", enable_timeseries=False)
+
+        for _ in range(3):
+            self.assertTrue(price.refresh())
+        self.assertEqual(price.get_health("mempool").state, OPEN)
+        self.assertEqual(price.service, "coingecko")
+
+        self.assertTrue(price.refresh())
+        self.assertEqual(mempool_update.call_count, 3)
+        self.assertEqual(coingecko_update.call_count, 4)
+        self.assertEqual(price.get_service_health()["coingecko"]["state"], CLOSED)
+
+    @patch.object(Binance, "update")
+    def test_raising_backend_fails_over(self, binance_update):
+        price = Price(service="kraken", enable_timeseries=False)
+        kraken = price.services["kraken"]
+        kraken.exchange = MagicMock()
+        kraken.exchange.fetch_ticker.side_effect = RuntimeError("timeout")
+        kraken.price["usd"] = 50000.0
+
+        self.assertTrue(price.refresh())
+        self.assertEqual(price.get_health("kraken").consecutive_failures, 1)
+        binance_update.assert_called_once()
+        self.assertEqual(kraken.get_price()["usd"], 50000.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
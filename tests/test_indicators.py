@@ -0,0 +1,151 @@
+import math
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from btcpriceticker.indicators import (
+    ATR,
+    EMA,
+    RESET_ROWS,
+    RSI,
+    SMA,
+    BollingerBands,
+    Indicator,
+    IndicatorEngine,
+    default_indicators,
+)
+
+
+def random_candles(rows, seed=1):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, rows))
+    high = close + rng.uniform(0, 2, rows)
+    low = close - rng.uniform(0, 2, rows)
+    times = np.arange(rows, dtype="int64") * 3600 * 10**9
+    return times, high, low, close
+
+
+def reference(high, low, close):
+    close = pd.Series(close)
+    sma = close.rolling(20).mean()
+    std = close.rolling(20).std(ddof=0)
+    change = close.diff()
+    gain = change.clip(lower=0).ewm(alpha=1 / 14, adjust=False).mean()
+    loss = (-change).clip(lower=0).ewm(alpha=1 / 14, adjust=False).mean()
+    prior = close.shift()
+    true_range = pd.concat(
+        [
+            pd.Series(high - low),
+            (pd.Series(high) - prior).abs(),
+            (pd.Series(low) - prior).abs(),
+        ],
+        axis=1,
+    ).max(axis=1)
+    return {
+        "sma_20": sma.iloc[-1],
+        "ema_20": close.ewm(span=20, adjust=False).mean().iloc[-1],
+        "rsi_14": (100 - 100 / (1 + gain / loss)).iloc[-1],
+        "bollinger_20": {
+            "middle": sma.iloc[-1],
+            "upper": sma.iloc[-1] + 2 * std.iloc[-1],
+            "lower": sma.iloc[-1] - 2 * std.iloc[-1],
+        },
+        "atr_14": true_range.ewm(alpha=1 / 14, adjust=False).mean().iloc[-1],
+    }
+
+
+class TestIndicators(unittest.TestCase):
+    def assertValuesEqual(self, values, expected):
+        self.assertEqual(values.keys(), expected.keys())
+        for name, value in values.items():
+            if isinstance(value, dict):
+                for band, number in value.items():
+                    self.assertAlmostEqual(number, expected[name][band], places=8)
+            else:
+                self.assertAlmostEqual(value, expected[name], places=8)
+
+    def test_not_enough_rows(self):
+        engine = IndicatorEngine(default_indicators(candles=True))
+        times, high, low, close = random_candles(10)
+        values = engine.update(times, high, low, close)
+        self.assertTrue(math.isnan(values["sma_20"]))
+        self.assertTrue(math.isnan(values["ema_20"]))
+        self.assertTrue(math.isnan(values["rsi_14"]))
+        self.assertTrue(math.isnan(values["bollinger_20"]["upper"]))
+        self.assertTrue(math.isnan(engine.update([], [], [], [])["atr_14"]))
+
+    def test_appended_rows_match_vectorized(self):
+        engine = IndicatorEngine(default_indicators(candles=True))
+        times, high, low, close = random_candles(300)
+        for rows in (1, 5, 40, 41, 120, 300):
+            values = engine.update(times[:rows], high[:rows], low[:rows], close[:rows])
+        self.assertEqual(engine.rows, 300)
+        self.assertValuesEqual(values, reference(high, low, close))
+
+    def test_revised_last_row_is_replaced(self):
+        engine = IndicatorEngine(default_indicators(candles=True))
+        times, high, low, close = random_candles(100)
+        engine.update(times, high, low, close)
+        high, low, close = high.copy(), low.copy(), close.copy()
+        close[-1] += 5
+        high[-1] = max(high[-1], close[-1])
+        values = engine.update(times, high, low, close)
+        self.assertValuesEqual(values, reference(high, low, close))
+
+        close = np.append(close, close[-1] - 3)
+        high = np.append(high, close[-1] + 1)
+        low = np.append(low, close[-1] - 1)
+        times = np.append(times, times[-1] + 3600 * 10**9)
+        close[-2] -= 1
+        values = engine.update(times, high, low, close)
+        self.assertValuesEqual(values, reference(high, low, close))
+
+    def test_backfill_resets(self):
+        engine = IndicatorEngine(default_indicators(candles=True))
+        times, high, low, close = random_candles(100)
+        keep = np.r_[0:30, 40:100]
+        engine.update(times[keep], high[keep], low[keep], close[keep])
+        values = engine.update(times, high, low, close)
+        self.assertValuesEqual(values, reference(high, low, close))
+
+        times, high, low, close = random_candles(100 + RESET_ROWS + 1)
+        values = engine.update(times, high, low, close)
+        self.assertValuesEqual(values, reference(high, low, close))
+
+    def test_add_and_remove(self):
+        engine = IndicatorEngine()
+        times, high, low, close = random_candles(50)
+        engine.update(times, high, low, close)
+        engine.add("sma_5", SMA(5))
+        values = engine.update(times, high, low, close)
+        self.assertAlmostEqual(values["sma_5"], close[-5:].mean())
+        engine.remove("sma_5")
+        self.assertEqual(engine.values(), {})
+
+    def test_bollinger_width_stays_exact_on_long_runs(self):
+        rng = np.random.default_rng(7)
+        close = 60000 + np.cumsum(rng.normal(0, 0.01, 200_000))
+        bands = BollingerBands(20)
+        for value in close:
+            bands.append(value, value, value)
+        bands.replace(close[-1] + 0.5, close[-1] + 0.5, close[-1] + 0.5)
+        close[-1] += 0.5
+
+        std = pd.Series(close).rolling(20).std(ddof=0).iloc[-1]
+        value = bands.value
+        # pandas' own online window drifts by about 1e-8 over this run
+        self.assertAlmostEqual(value["upper"] - value["lower"], 4 * std, places=6)
+
+    def test_invalid_period(self):
+        for indicator in (SMA, EMA, RSI, ATR, BollingerBands):
+            with self.assertRaises(ValueError):
+                indicator(0)
+
+    def test_base_indicator_is_abstract(self):
+        with self.assertRaises(TypeError):
+            Indicator(5)
+
+
+if __name__ == "__main__":
+    unittest.main()
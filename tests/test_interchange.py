@@ -0,0 +1,81 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from btcpriceticker.interchange import PYARROW_MODULE, frame_to_arrow
+from btcpriceticker.price import Price
+from btcpriceticker.price_timeseries import PriceTimeSeries
+
+try:
+    import pyarrow as pa
+    import pyarrow.interchange
+except ImportError:  # pragma: no cover
+    pass
+
+
+def buffer_address(table, column):
+    return table.column(column).chunk(0).buffers()[1].address
+
+
+@unittest.skipUnless(PYARROW_MODULE, "requires pyarrow")
+class TestArrowInterchange(unittest.TestCase):
+    def setUp(self):
+        self.series = PriceTimeSeries()
+        self.series.append_dataframe(
+            pd.DataFrame(
+                {
+                    "timestamp": pd.date_range(
+                        "2024-01-01", periods=4, freq="1h", tz="UTC"
+                    ),
+                    "price": [1.0, 2.0, 3.0, 4.0],
+                }
+            )
+        )
+
+    def test_time_series_table_shares_buffers(self):
+        table = self.series.to_arrow()
+        data = self.series.data
+
+        self.assertEqual(table.column_names, ["timestamp", "price"])
+        self.assertEqual(table.schema.field("timestamp").type.tz, "UTC")
+        self.assertEqual(
+            buffer_address(table, "price"), data["price"].to_numpy().ctypes.data
+        )
+        self.assertEqual(
+            buffer_address(table, "timestamp"),
+            data["timestamp"].array._ndarray.ctypes.data,
+        )
+
+    def test_protocols(self):
+        self.assertEqual(pa.table(self.series).num_rows, 4)
+        self.assertEqual(
+            pa.interchange.from_dataframe(self.series).column("price").to_pylist(),
+            [1.0, 2.0, 3.0, 4.0],
+        )
+
+    def test_candles_keep_index_as_timestamp(self):
+        index = pd.date_range("2024-01-01", periods=3, freq="1h", tz="UTC")
+        candles = pd.DataFrame(
+            {"Close": np.arange(3.0), "Volume": np.ones(3)}, index=index
+        )
+
+        table = frame_to_arrow(candles)
+
+        self.assertEqual(table.column_names, ["timestamp", "Close", "Volume"])
+        self.assertEqual(
+            buffer_address(table, "Close"), candles["Close"].to_numpy().ctypes.data
+        )
+
+    def test_price_to_arrow(self):
+        price = Price(service="mempool", enable_timeseries=True)
+        price.timeseries.append_dataframe(self.series.data)
+
+        self.assertEqual(price.to_arrow("history").num_rows, 4)
+        self.assertEqual(price.to_arrow("ohlcv").num_rows, 0)
+        with self.assertRaises(ValueError):
+            price.to_arrow("trades")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
 from btcpriceticker.mempool import Mempool
@@ -13,6 +14,51 @@ class TestMempool(unittest.TestCase):
         price = m.get_current_price("USD")
         self.assertEqual(price, 50000)
 
+    @patch("pymempool.MempoolAPI.get_price")
+    def test_get_current_prices_uses_one_request(self, mock_get_price):
+        mock_get_price.return_value = {"USD": 50000, "EUR": 46000, "GBP": 40000}
+
+        m = Mempool("EUR")
+        prices = m.get_current_prices(["USD", "eur", "gbp", "xyz"])
+
+        self.assertEqual(mock_get_price.call_count, 1)
+        self.assertEqual(
+            prices, {"USD": 50000.0, "EUR": 46000.0, "GBP": 40000.0, "XYZ": None}
+        )
+
+    def test_get_ohlcv_resamples_history(self):
+        m = Mempool("USD")
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for minutes, price in [(0, 100.0), (20, 120.0), (40, 90.0), (70, 110.0)]:
+            m.price_history.add_price(start + timedelta(minutes=minutes), price)
+
+        ohlcv = m.get_ohlcv("USD")
+
+        self.assertEqual(
+            list(ohlcv.columns), ["Open", "High", "Low", "Close", "Volume"]
+        )
+        self.assertEqual(ohlcv.iloc[0].tolist(), [100.0, 120.0, 90.0, 90.0, 3])
+        cutoff = [(start + timedelta(minutes=30)).timestamp()]
+        self.assertEqual(len(m.get_ohlcv("USD", existing_timestamp=cutoff)), 1)
+
+    def test_time_vector_starts_at_the_next_slot(self):
+        m = Mempool("USD")
+        last = datetime.now(timezone.utc).timestamp() - 5 * 3600
+        time_vector = m.calculate_time_vector(existing_timestamp=[last])
+        self.assertEqual(time_vector[0], int(last + 3600))
+        self.assertEqual(len(time_vector), 4)
+
+    @patch("pymempool.MempoolAPI.get_historical_price")
+    def test_fetch_range_requests_only_missing_slots(self, mock_historical):
+        mock_historical.return_value = {"prices": [{"USD": 42000}]}
+        m = Mempool("USD")
+
+        history = m.fetch_range("history", "USD", 7200, 14400)
+
+        self.assertEqual(mock_historical.call_count, 3)
+        self.assertEqual(history["price"].tolist(), [42000.0] * 3)
+        self.assertIsNone(m.fetch_range("ohlcv", "USD", 7200, 14400))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+from unittest.mock import patch
+
+import requests
+import responses
+
+from btcpriceticker.bit2me import Bit2Me
+from btcpriceticker.metrics import Histogram, ServiceMetrics, format_prometheus
+from btcpriceticker.price import Price
+from btcpriceticker.ratelimit import install_rate_limiter, reset_buckets
+
+
+class TestHistogram(unittest.TestCase):
+    def test_buckets_are_cumulative(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        self.assertEqual(
+            histogram.as_dict(),
+            {"buckets": {"0.1": 2, "1": 3, "+Inf": 4}, "sum": 3.65, "count": 4},
+        )
+
+
+class TestServiceMetrics(unittest.TestCase):
+    @responses.activate
+    def test_response_hook_counts_requests(self):
+        responses.get("https://example.com/ok", body=b"12345")
+        responses.get("https://example.com/fail", status=500, body=b"no")
+        metrics = ServiceMetrics()
+        session = requests.Session()
+        session.hooks["response"].append(metrics.response_hook)
+
+        session.get("https://example.com/ok")
+        session.get("https://example.com/fail")
+
+        stats = metrics.as_dict()
+        self.assertEqual(stats["requests"], 2)
+        self.assertEqual(stats["request_errors"], 1)
+        self.assertEqual(stats["bytes"], 7)
+        self.assertEqual(stats["request_latency"]["count"], 2)
+
+    @responses.activate
+    def test_rate_limit_wait_is_not_network_time(self):
+        responses.get("https://paced.example.com/ticker", body=b"1")
+        metrics = ServiceMetrics()
+        session = requests.Session()
+        install_rate_limiter(session, rate=20, capacity=1)
+        session.hooks["response"].append(metrics.response_hook)
+        self.addCleanup(reset_buckets)
+
+        session.get("https://paced.example.com/ticker")
+        session.get("https://paced.example.com/ticker")
+
+        stats = metrics.as_dict()
+        self.assertGreater(stats["wait_seconds"], 0.0)
+        self.assertLess(stats["network_seconds"], stats["wait_seconds"])
+        self.assertIn(
+            "btcpriceticker_rate_limit_wait_seconds_total",
+            format_prometheus({"services": {"paced": stats}}),
+        )
+
+    def test_backend_sessions_are_instrumented(self):
+        service = Bit2Me("EUR")
+        self.assertIn(service.metrics.response_hook, service.session.hooks["response"])
+
+    def test_refresh_splits_network_and_parse_time(self):
+        metrics = ServiceMetrics()
+        metrics.record_refresh(1.5, 1.0, True)
+        metrics.record_refresh(0.2, 0.4, False)
+        metrics.record_refresh(3.0, 0.5, True, wait=2.5)
+        metrics.record_rows(24)
+        metrics.record_rows(-3)
+
+        stats = metrics.as_dict()
+        self.assertEqual((stats["refreshes"], stats["refresh_errors"]), (3, 1))
+        self.assertAlmostEqual(stats["parse_seconds"], 0.5)
+        self.assertEqual(stats["rows"], 24)
+
+
+class TestPriceStats(unittest.TestCase):
+    @patch("btcpriceticker.mempool.Mempool.update")
+    def test_short_circuit_hit_rate(self, mock_update):
+        def update():
+            price.services["mempool"].price.update(fiat=50000.0, timestamp=1e12)
+
+        mock_update.side_effect = update
+        price = Price(service="mempool", enable_timeseries=False)
+        for _ in range(4):
+            self.assertTrue(price.refresh())
+
+        stats = price.stats()
+        self.assertEqual(mock_update.call_count, 1)
+        self.assertEqual(stats["refresh"]["checks"], 4)
+        self.assertEqual(stats["refresh"]["cache_hits"], 3)
+        self.assertEqual(stats["refresh"]["hit_rate"], 0.75)
+        self.assertEqual(stats["services"]["mempool"]["refreshes"], 1)
+
+        # Reading the fresh quote is not a refresh check
+        price.get_price_now()
+        self.assertEqual(price.stats()["refresh"]["checks"], 4)
+        self.assertEqual(price.stats()["refresh"]["cache_hits"], 3)
+
+        text = format_prometheus(stats)
+        self.assertIn('btcpriceticker_refreshes_total{service="mempool"} 1', text)
+        bucket = 'btcpriceticker_refresh_latency_seconds_bucket{service="mempool"'
+        self.assertIn(f'{bucket},le="+Inf"}} 1', text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 from datetime import datetime, timezone
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 
@@ -156,11 +156,125 @@ class TestPrice(unittest.TestCase):
 
         self.assertTrue(price_instance.get_price_now())
 
+    @patch.object(Mempool, "get_current_price")
+    def test_get_snapshot(self, mock_get_current_price):
+        mock_get_current_price.side_effect = lambda currency: {
+            "USD": 50000,
+            "EUR": 40000,
+        }[currency]
+
+        price_instance = Price(fiat="eur", enable_timeseries=False)
+        price_instance.refresh()
+        snapshot = price_instance.get_snapshot()
+
+        self.assertEqual(snapshot["service"], "mempool")
+        self.assertEqual(snapshot["fiat"], "EUR")
+        self.assertEqual(snapshot["price"], 40000)
+        self.assertEqual(snapshot["sat_usd"], 2000)
+        self.assertGreater(snapshot["timestamp"], 0)
+
     def test_set_days_ago(self):
         price_instance = Price(fiat="eur", days_ago=1)
         price_instance.set_days_ago(7)
         self.assertEqual(price_instance.days_ago, 7)
 
+    @patch("pymempool.MempoolAPI.get_price")
+    def test_multi_fiat_views_share_one_request(self, mock_get_price):
+        mock_get_price.return_value = {"USD": 50000, "EUR": 40000, "GBP": 25000}
+
+        price_instance = Price(
+            fiat="eur", fiats=["usd", "gbp"], enable_timeseries=False
+        )
+        self.assertTrue(price_instance.refresh())
+
+        self.assertEqual(mock_get_price.call_count, 1)
+        self.assertEqual(set(price_instance.get_quotes()), {"EUR", "USD", "GBP"})
+        gbp = price_instance.view("gbp")
+        self.assertEqual(gbp.get_fiat_price(), 25000)
+        self.assertEqual(gbp.get_sats_per_fiat(), 4000)
+        self.assertEqual(gbp.get_price_list(), [25000])
+        self.assertEqual(price_instance.get_snapshot()["quotes"]["USD"], 50000)
+        with self.assertRaises(ValueError):
+            price_instance.view("jpy")
+
+    @patch("btcpriceticker.kraken.ccxt.kraken")
+    def test_multi_asset_quotes_use_one_bulk_request(self, mock_kraken):
+        exchange = MagicMock()
+        exchange.load_markets.return_value = {
+            symbol: {} for symbol in ("BTC/USD", "BTC/EUR", "ETH/EUR", "SOL/USD")
+        }
+        exchange.fetch_ticker.side_effect = lambda symbol: {
+            "BTC/USD": {"last": 50000},
+            "BTC/EUR": {"last": 40000},
+        }[symbol]
+        exchange.fetch_tickers.return_value = {
+            "ETH/EUR": {"last": 2000},
+            "SOL/USD": {"last": 150},
+        }
+        mock_kraken.return_value = exchange
+
+        price_instance = Price(
+            service="kraken",
+            fiat="eur",
+            base_assets=["eth", "sol", "btc"],
+            enable_timeseries=False,
+        )
+        self.assertTrue(price_instance.refresh())
+
+        exchange.fetch_tickers.assert_called_once_with(["ETH/EUR", "SOL/USD"])
+        eth = price_instance.asset_view("eth")
+        self.assertEqual(eth.get_fiat_price(), 2000)
+        self.assertEqual(eth.get_usd_price(), 2500)
+        self.assertEqual(price_instance.asset_view("sol").get_fiat_price(), 120)
+        self.assertEqual(eth.get_price_list(), [2000])
+        self.assertEqual(
+            price_instance.get_snapshot()["assets"],
+            {"BTC": 40000, "ETH": 2000, "SOL": 120},
+        )
+        self.assertEqual(price_instance.asset_history.assets, ["BTC", "ETH", "SOL"])
+        with self.assertRaises(ValueError):
+            price_instance.asset_view("doge")
+
+    def test_base_asset_selects_supporting_services(self):
+        price_instance = Price(service="coingecko", fiat="usd", base_asset="eth")
+        service = price_instance.services["coingecko"]
+        self.assertEqual(service.whichcoin, "ethereum")
+        self.assertNotIn("mempool", price_instance.rank_services())
+        with self.assertRaises(ValueError):
+            Price(service="mempool", fiat="usd", base_asset="eth")
+
+    def test_get_indicators(self):
+        price_instance = Price(fiat="eur", enable_timeseries=False)
+        for hour in range(25):
+            price_instance.timeseries.add_price(
+                datetime(2024, 1, 1, hour % 24, tzinfo=timezone.utc)
+                + pd.Timedelta(days=hour // 24),
+                100.0,
+            )
+        indicators = price_instance.get_indicators()
+        self.assertEqual(indicators["sma_20"], 100.0)
+        self.assertEqual(indicators["bollinger_20"]["upper"], 100.0)
+        self.assertIn("atr_14", price_instance.get_indicators("ohlcv"))
+        with self.assertRaises(ValueError):
+            price_instance.get_indicators("ohlc")
+
+    def test_get_price_list_max_points(self):
+        price_instance = Price(fiat="eur", days_ago=1, enable_timeseries=False)
+        now = pd.Timestamp.now(tz="UTC")
+        for minute in range(300):
+            price_instance.timeseries.add_price(
+                now - pd.Timedelta(minutes=minute), float(minute)
+            )
+        price_instance.services["mempool"].price["fiat"] = 1.0
+        prices = price_instance.get_price_list(max_points=50, method="minmax")
+        self.assertEqual(len(prices), 50)
+        self.assertEqual((min(prices), max(prices)), (0.0, 299.0))
+        self.assertIs(
+            price_instance.get_price_array(max_points=50),
+            price_instance.get_price_array(max_points=50),
+        )
+        self.assertEqual(len(price_instance.get_price_list()), 300)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,7 +3,7 @@ from datetime import datetime, timedelta, timezone
 import pandas as pd
 import pytest
 
-from btcpriceticker.price_timeseries import PriceTimeSeries
+from btcpriceticker.price_timeseries import AssetPriceTable, PriceTimeSeries
 
 
 class TestPriceTimeSeries:
@@ -95,3 +95,89 @@ class TestPriceTimeSeries:
         result = self.series.resample_to_ohlcv("1h")
 
         assert result.empty
+
+    def test_ingestion_enforces_dtypes(self):
+        assert str(self.series.data["timestamp"].dtype) == "datetime64[ns, UTC]"
+        assert self.series.data["price"].dtype == "float64"
+
+        self.series.add_price(datetime(2024, 1, 1, tzinfo=timezone.utc), 100)
+        self.series.append_dataframe(
+            pd.DataFrame({"timestamp": ["2024-01-01T01:00:00Z"], "price": ["101.5"]})
+        )
+
+        assert str(self.series.data["timestamp"].dtype) == "datetime64[ns, UTC]"
+        assert self.series.data["price"].dtype == "float64"
+        assert self.series.get_timestamp_list() == [1704067200.0, 1704070800.0]
+        assert self.series.get_price_list() == [100.0, 101.5]
+
+    def test_float32_prices_and_memory_usage(self):
+        for hour in range(10):
+            self.series.add_price(datetime(2024, 1, 1, hour, tzinfo=timezone.utc), 1.0)
+        full = self.series.memory_usage()
+
+        self.series.set_price_dtype("float32")
+
+        assert self.series.data["price"].dtype == "float32"
+        assert self.series.memory_usage() == full - 10 * 4
+        with pytest.raises(ValueError, match="Unsupported price dtype"):
+            PriceTimeSeries(price_dtype="object")
+
+    def test_indicators_follow_new_prices(self):
+        for hour in range(30):
+            self.series.add_price(
+                datetime(2024, 1, 1, hour % 24, tzinfo=timezone.utc)
+                + timedelta(days=hour // 24),
+                float(hour),
+            )
+        assert self.series.get_indicators()["sma_20"] == pytest.approx(19.5)
+
+        self.series.add_price(datetime(2024, 1, 3, tzinfo=timezone.utc), 30.0)
+
+        indicators = self.series.get_indicators()
+        assert self.series.indicators.rows == 31
+        assert indicators["sma_20"] == pytest.approx(20.5)
+        assert indicators["rsi_14"] == pytest.approx(100.0)
+
+    def test_downsampled_price_list_is_cached_until_append(self):
+        self.series.append_dataframe(
+            pd.DataFrame(
+                {
+                    "timestamp": pd.date_range(
+                        "2024-01-01", periods=1000, freq="min", tz="UTC"
+                    ),
+                    "price": [float(i % 100) for i in range(1000)],
+                }
+            )
+        )
+
+        prices = self.series.get_price_array(max_points=100, method="minmax")
+
+        assert len(prices) <= 100
+        assert prices.min() == 0.0 and prices.max() == 99.0
+        assert not prices.flags.writeable
+        assert self.series.get_price_array(max_points=100, method="minmax") is prices
+        assert self.series.get_price_list(max_points=100) == pytest.approx(
+            self.series.get_price_array(max_points=100).tolist()
+        )
+        assert len(self.series.get_timestamp_list(max_points=100)) == 100
+
+        self.series.add_price(datetime(2024, 1, 2, tzinfo=timezone.utc), 500.0)
+
+        prices = self.series.get_price_array(max_points=100, method="minmax")
+        assert prices[-1] == 500.0
+        assert len(self.series.get_price_list(max_points=10_000)) == 1001
+
+
+class TestAssetPriceTable:
+    def test_assets_share_one_table(self):
+        table = AssetPriceTable("float32")
+        old = datetime.now(timezone.utc) - timedelta(days=2)
+        table.add_prices(old, {"btc": 40000.0, "eth": 2000.0})
+        table.add_prices(datetime.now(timezone.utc), {"BTC": 41000.0, "SOL": 150.0})
+
+        assert table.assets == ["BTC", "ETH", "SOL"]
+        assert (table.data[table.assets].dtypes == "float32").all()
+        assert str(table.data["timestamp"].dtype) == "datetime64[ns, UTC]"
+        assert table.get_price_list("eth") == [2000.0]
+        assert table.get_price_list("btc", days=1) == [41000.0]
+        assert table.get_data("xrp").empty
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import time
+import unittest
+
+from btcpriceticker import tracing
+from btcpriceticker.profiling import CommandProfile
+
+
+def busy(seconds):
+    started = time.process_time()
+    while time.process_time() - started < seconds:
+        pass
+
+
+class TestCommandProfile(unittest.TestCase):
+    def test_parts_add_up_to_the_wall_time(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            profile = CommandProfile(
+                os.path.join(tmpdir, "command.prof"),
+                import_started=time.perf_counter(),
+            )
+            profile.start()
+            with tracing.span("http.request"):
+                time.sleep(0.1)
+                busy(0.05)
+            busy(0.05)
+            time.sleep(0.1)
+            summary = profile.stop()
+
+        parts = profile.split()
+        self.assertAlmostEqual(
+            parts["import"] + parts["network"] + parts["cpu"] + parts["other"],
+            parts["wall"],
+        )
+        # CPU inside the request counts as network, not twice
+        self.assertGreaterEqual(parts["network"], 0.15)
+        self.assertGreaterEqual(profile.request_cpu, 0.05)
+        self.assertLess(parts["cpu"], 0.1)
+        self.assertGreaterEqual(parts["other"], 0.09)
+        self.assertIn("in 1 requests", summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from btcpriceticker.pyramid import (
+    CandlePyramid,
+    aggregate_candles,
+    timeframe_to_seconds,
+)
+
+
+def hourly_candles(start, periods, offset=0.0):
+    index = pd.date_range(start, periods=periods, freq="h", tz="UTC")
+    close = np.arange(periods, dtype="float64") + offset
+    return pd.DataFrame(
+        {
+            "Open": close - 0.5,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": 1.0,
+        },
+        index=index.as_unit("ns"),
+    )
+
+
+class TestAggregateCandles(unittest.TestCase):
+    def test_timeframe_to_seconds(self):
+        self.assertEqual(timeframe_to_seconds("4h"), 14400)
+        self.assertEqual(timeframe_to_seconds("1w"), 604800)
+        with self.assertRaises(ValueError):
+            timeframe_to_seconds("1y")
+
+    def test_aggregates_ohlcv(self):
+        candles = hourly_candles("2024-01-01", 8)
+
+        four_hours = aggregate_candles(candles, 4 * 3600)
+
+        self.assertEqual(len(four_hours), 2)
+        first = four_hours.iloc[0]
+        self.assertEqual(
+            first.tolist(), [-0.5, 4.0, -1.0, 3.0, 4.0]
+        )  # open, high, low, close, volume
+
+    def test_weeks_start_on_monday(self):
+        # 2024-01-06 is a Saturday
+        candles = hourly_candles("2024-01-06", 72)
+
+        weeks = aggregate_candles(candles, timeframe_to_seconds("1w"))
+
+        self.assertEqual(
+            list(weeks.index.strftime("%Y-%m-%d")), ["2024-01-01", "2024-01-08"]
+        )
+        self.assertEqual(weeks["Volume"].tolist(), [48.0, 24.0])
+
+
+class TestCandlePyramid(unittest.TestCase):
+    def test_cached_until_base_changes(self):
+        pyramid = CandlePyramid()
+        base = hourly_candles("2024-01-01", 48)
+
+        day = pyramid.get(base, 86400)
+        self.assertIs(pyramid.get(base, 86400), day)
+
+        update = hourly_candles("2024-01-02 20:00", 10, offset=100.0)
+        base = pd.concat([base[base.index < update.index[0]], update])
+        pyramid.mark_changed(update.index[0])
+        updated = pyramid.get(base, 86400)
+
+        self.assertIsNot(updated, day)
+        pd.testing.assert_frame_equal(updated, aggregate_candles(base, 86400))
+        self.assertEqual(updated.iloc[0].tolist(), day.iloc[0].tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import io
+import unittest
+from unittest.mock import patch
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from btcpriceticker.bit2me import Bit2Me
+from btcpriceticker.ratelimit import (
+    RateLimitedAdapter,
+    RateLimitExceeded,
+    TokenBucket,
+    get_bucket,
+    install_rate_limiter,
+    parse_retry_after,
+    reset_buckets,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_response(status=200, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response.raw = io.BytesIO(b"{}")
+    return response
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.bucket = TokenBucket(2.0, 2, clock=self.clock, sleep=self.clock.sleep)
+
+    def test_burst_then_wait(self):
+        self.assertEqual(self.bucket.acquire(), 0.0)
+        self.assertEqual(self.bucket.acquire(), 0.0)
+        self.assertAlmostEqual(self.bucket.try_acquire(), 0.5)
+        self.assertAlmostEqual(self.bucket.acquire(), 0.5)
+        self.assertAlmostEqual(self.clock.now, 100.5)
+
+    def test_block_for_and_remaining_fraction(self):
+        self.assertEqual(self.bucket.remaining_fraction(), 1.0)
+        self.bucket.block_for(3)
+        self.assertEqual(self.bucket.remaining_fraction(), 0.0)
+        self.assertAlmostEqual(self.bucket.acquire(), 3.0)
+        self.assertAlmostEqual(self.bucket.try_acquire(), 0.5)
+
+    def test_long_block_raises_instead_of_waiting(self):
+        self.bucket.block_for(3600)
+        with self.assertRaises(RateLimitExceeded):
+            self.bucket.acquire(max_wait=60)
+        self.assertEqual(self.clock.now, 100.0)
+        self.assertAlmostEqual(self.bucket.acquire(max_wait=4000), 3600.0)
+
+    def test_retry_after_header_blocks(self):
+        self.bucket.update_from_response(make_response(429, {"Retry-After": "7"}))
+        self.assertAlmostEqual(self.bucket.try_acquire(), 7.0)
+
+    def test_reported_remaining_limits_budget(self):
+        self.bucket.update_from_response(
+            make_response(
+                headers={"X-RateLimit-Remaining": "10", "X-RateLimit-Limit": "100"}
+            )
+        )
+        self.assertAlmostEqual(self.bucket.remaining_fraction(), 0.1)
+        self.bucket.update_from_response(
+            make_response(headers={"x-mbx-used-weight-1m": "3000"})
+        )
+        self.assertAlmostEqual(self.bucket.remaining_fraction(), 0.5)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("5"), 5.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+
+class TestRateLimitedAdapter(unittest.TestCase):
+    def setUp(self):
+        reset_buckets()
+        self.addCleanup(reset_buckets)
+
+    def test_install_keeps_retries_and_is_idempotent(self):
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(max_retries=3))
+        adapter = install_rate_limiter(session)
+
+        self.assertIsInstance(session.get_adapter("https://x.org"), RateLimitedAdapter)
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertIs(install_rate_limiter(session), adapter)
+
+    def test_hosts_share_one_bucket(self):
+        first = install_rate_limiter(requests.Session())
+        second = install_rate_limiter(requests.Session())
+        self.assertIs(
+            first.bucket_for("https://mempool.space/api/v1/prices"),
+            second.bucket_for("https://mempool.space/api/blocks"),
+        )
+
+    def test_retries_after_429(self):
+        session = requests.Session()
+        install_rate_limiter(session)
+        bucket = get_bucket("api.example.com")
+        replies = [make_response(429, {"Retry-After": "0"}), make_response(200)]
+        with patch.object(HTTPAdapter, "send", side_effect=replies) as send:
+            response = session.get("https://api.example.com/ticker")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(send.call_count, 2)
+        self.assertLess(bucket.tokens, bucket.capacity)
+
+    def test_long_retry_after_fails_the_request(self):
+        session = requests.Session()
+        install_rate_limiter(session)
+        reply = make_response(429, {"Retry-After": "86400"})
+        with patch.object(HTTPAdapter, "send", return_value=reply) as send:
+            with self.assertRaises(RateLimitExceeded):
+                session.get("https://api.slow.example.com/ticker")
+            # The host stays blocked, later requests fail without a round trip
+            with self.assertRaises(requests.RequestException):
+                session.get("https://api.slow.example.com/ticker")
+
+        self.assertEqual(send.call_count, 1)
+
+    def test_service_budget_follows_headers(self):
+        service = Bit2Me("EUR")
+        self.assertEqual(service.request_budget(), 1.0)
+        headers = {"X-RateLimit-Remaining": "1", "X-RateLimit-Limit": "4"}
+        with patch.object(
+            HTTPAdapter, "send", return_value=make_response(200, headers)
+        ):
+            service.session.get("https://gateway.bit2me.com/v1/time")
+
+        self.assertAlmostEqual(service.request_budget(), 0.25)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+
+import requests
+import responses
+
+from btcpriceticker.coingecko import CoinGecko
+from btcpriceticker.replay import Cassette, Fault, Recorder, Replayer, request_key
+
+PRICE_URL = "https://mempool.space/api/v1/prices"
+
+
+def interaction(url, body, status=200):
+    return {
+        "method": "GET",
+        "url": url,
+        "status": status,
+        "headers": {"Content-Type": "application/json"},
+        "body": body,
+        "encoding": "utf-8",
+        "elapsed": 0.25,
+    }
+
+
+class TestRequestKey(unittest.TestCase):
+    def test_query_is_sorted_and_volatile_params_dropped(self):
+        self.assertEqual(
+            request_key("get", "https://a.b/c?b=2&since=1700&a=1"),
+            "GET https://a.b/c?a=1&b=2",
+        )
+
+
+class TestRecordReplay(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+
+    @responses.activate
+    def test_recorded_exchanges_are_replayed(self):
+        responses.get(PRICE_URL, json={"USD": 50000})
+        responses.get(PRICE_URL, json={"USD": 51000})
+        with Recorder(self.path):
+            first = requests.get(PRICE_URL).json()
+            second = requests.get(PRICE_URL).json()
+        responses.reset()
+
+        with Replayer(self.path) as replayer:
+            self.assertEqual(requests.get(PRICE_URL).json(), first)
+            self.assertEqual(requests.get(PRICE_URL).json(), second)
+            self.assertEqual(requests.get(PRICE_URL).json(), first)
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                requests.get("https://mempool.space/api/v1/unknown")
+        self.assertEqual((replayer.requests, replayer.misses), (4, 1))
+
+    def test_harness_is_removed_on_exit(self):
+        with Replayer(Cassette()):
+            with self.assertRaises(RuntimeError):
+                Replayer(Cassette()).start()
+        with Replayer(Cassette([interaction(PRICE_URL, "{}")])):
+            self.assertEqual(requests.get(PRICE_URL).status_code, 200)
+
+
+class TestFaults(unittest.TestCase):
+    def setUp(self):
+        self.sleeps = []
+        self.cassette = Cassette([interaction(PRICE_URL, '{"USD": 1}')])
+
+    def replay(self, **kwargs):
+        outcomes = []
+        with Replayer(self.cassette, sleep=self.sleeps.append, **kwargs):
+            for _ in range(20):
+                try:
+                    outcomes.append(requests.get(PRICE_URL).status_code)
+                except requests.exceptions.ConnectionError:
+                    outcomes.append(None)
+        return outcomes
+
+    def test_injected_errors_are_deterministic(self):
+        fault = Fault(latency=0.1, jitter=0.1, error_rate=0.5)
+        outcomes = self.replay(fault=fault, seed=3)
+
+        self.assertIn(503, outcomes)
+        self.assertIn(200, outcomes)
+        self.assertEqual(self.replay(fault=fault, seed=3), outcomes)
+        self.assertTrue(all(0.1 <= delay <= 0.2 for delay in self.sleeps))
+
+    def test_host_fault_and_realtime(self):
+        fault = Fault(error_rate=1.0, error_status=None)
+        self.assertEqual(self.replay(host_faults={"mempool.space": fault}), [None] * 20)
+        self.sleeps.clear()
+
+        self.assertEqual(self.replay(realtime=True), [200] * 20)
+        self.assertEqual(self.sleeps, [0.25] * 20)
+
+    def test_service_is_served_from_cassette(self):
+        url = (
+            "https://api.coingecko.com/api/v3/simple/price"
+            "?ids=bitcoin&vs_currencies=usd"
+        )
+        cassette = Cassette([interaction(url, '{"bitcoin": {"usd": 42000}}')])
+        with Replayer(cassette):
+            service = CoinGecko("USD", enable_ohlc=False, enable_timeseries=False)
+            self.assertEqual(service.get_current_prices(["usd"]), {"USD": 42000.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
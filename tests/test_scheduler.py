@@ -0,0 +1,89 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from btcpriceticker.mempool import Mempool
+from btcpriceticker.price import Price
+from btcpriceticker.scheduler import RefreshScheduler
+
+
+class TestRefreshScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = RefreshScheduler(floor=30, ceiling=600)
+
+    def test_invalid_bounds_raise(self):
+        with self.assertRaises(ValueError):
+            RefreshScheduler(floor=100, ceiling=10)
+
+    def test_quiet_market_uses_ceiling(self):
+        prices = np.full(50, 50000.0)
+
+        self.assertEqual(self.scheduler.realised_volatility(prices), 0.0)
+        self.assertEqual(self.scheduler.plan(1000.0, prices), 1600.0)
+        self.assertEqual(self.scheduler.interval, 600)
+
+    def test_volatility_shortens_interval(self):
+        rng = np.random.default_rng(0)
+        calm = 50000 * np.exp(np.cumsum(rng.normal(0, 0.0005, 50)))
+        wild = 50000 * np.exp(np.cumsum(rng.normal(0, 0.01, 50)))
+
+        calm_interval = self.scheduler.compute_interval(
+            self.scheduler.realised_volatility(calm)
+        )
+        wild_interval = self.scheduler.compute_interval(
+            self.scheduler.realised_volatility(wild)
+        )
+
+        self.assertLess(wild_interval, calm_interval)
+        self.assertGreaterEqual(wild_interval, 30)
+
+    def test_low_budget_lengthens_interval(self):
+        full = self.scheduler.compute_interval(0.001, budget=1.0)
+        low = self.scheduler.compute_interval(0.001, budget=0.25)
+
+        self.assertAlmostEqual(low, min(full * 4, 600))
+        self.assertEqual(self.scheduler.compute_interval(0.01, budget=0.0), 600)
+
+    def test_demand_shortens_interval_and_expires(self):
+        for second in range(60):
+            self.scheduler.record_demand(now=1000.0 + second)
+
+        self.assertEqual(self.scheduler.demand(now=1060.0), 6.0)
+        self.assertLess(self.scheduler.compute_interval(0.0, demand=6.0), 600)
+        self.assertEqual(self.scheduler.demand(now=5000.0), 0.0)
+
+
+class TestPriceScheduling(unittest.TestCase):
+    @patch.object(Mempool, "get_current_price")
+    def test_price_exposes_next_refresh(self, mock_get_current_price):
+        mock_get_current_price.return_value = 50000.0
+        scheduler = RefreshScheduler(floor=10, ceiling=300)
+        price_instance = Price(fiat="eur", enable_timeseries=False, scheduler=scheduler)
+
+        self.assertTrue(price_instance.refresh())
+
+        self.assertEqual(price_instance.get_refresh_interval(), scheduler.interval)
+        self.assertEqual(
+            price_instance.next_refresh_time(),
+            price_instance.get_timestamp() + scheduler.interval,
+        )
+        calls = mock_get_current_price.call_count
+        price_instance.refresh()
+        self.assertEqual(mock_get_current_price.call_count, calls)
+
+    def test_floor_respects_min_refresh_time(self):
+        scheduler = RefreshScheduler(floor=10, ceiling=100)
+        Price(fiat="eur", min_refresh_time=120, scheduler=scheduler)
+
+        self.assertEqual((scheduler.floor, scheduler.ceiling), (120, 120))
+        self.assertEqual(scheduler.compute_interval(volatility=1.0, demand=100), 120)
+
+    def test_without_scheduler_min_refresh_time_is_used(self):
+        price_instance = Price(fiat="eur", min_refresh_time=60)
+
+        self.assertEqual(price_instance.get_refresh_interval(), 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import http.client
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from btcpriceticker.server import PriceServer
+
+
+def make_price():
+    price = MagicMock()
+    price.min_refresh_time = 120
+    price.refresh.return_value = True
+    price.get_timestamp.return_value = 1700000000.0
+    price.get_snapshot.return_value = {"fiat": "EUR", "price": 42000.0}
+    price.get_price_list.return_value = [41000.0, 42000.0]
+    price.ohlc = pd.DataFrame(
+        [[1.0, 2.0, 0.5, 1.5]],
+        columns=["Open", "High", "Low", "Close"],
+        index=pd.DatetimeIndex([datetime(2024, 1, 1, tzinfo=timezone.utc)]),
+    )
+    price.ohlcv = pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
+    price.stats.return_value = {"refresh": {"checks": 3, "cache_hits": 2}}
+    return price
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path):
+        super().__init__("localhost")
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.unix_path)
+
+
+class TestPriceServer(unittest.TestCase):
+    def test_responses_are_cached_between_refreshes(self):
+        price = make_price()
+        server = PriceServer(price)
+        server.refresh()
+        server.refresh()
+
+        self.assertEqual(price.get_snapshot.call_count, 1)
+        self.assertEqual(
+            json.loads(server.get_response("/price")), {"fiat": "EUR", "price": 42000.0}
+        )
+        self.assertEqual(json.loads(server.get_response("/ohlcv")), [])
+        self.assertIsNone(server.get_response("/unknown"))
+
+        price.get_timestamp.return_value = 1700000120.0
+        server.refresh()
+        self.assertEqual(price.get_snapshot.call_count, 2)
+
+    def test_refresh_interval_respects_min_refresh_time(self):
+        price = make_price()
+
+        self.assertEqual(PriceServer(price, refresh_interval=10).refresh_interval, 120)
+        self.assertEqual(PriceServer(price, refresh_interval=300).refresh_interval, 300)
+
+    def test_serves_over_http(self):
+        server = PriceServer(make_price())
+        httpd = server.bind(port=0)
+        port = httpd.server_address[1]
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            base = f"http://127.0.0.1:{port}"
+            with urllib.request.urlopen(f"{base}/price_list") as response:
+                self.assertEqual(json.loads(response.read()), [41000.0, 42000.0])
+            with urllib.request.urlopen(f"{base}/ohlc") as response:
+                candles = json.loads(response.read())
+            self.assertEqual(candles[0]["Close"], 1.5)
+            self.assertTrue(candles[0]["timestamp"].startswith("2024-01-01T00:00:00"))
+            with urllib.request.urlopen(f"{base}/metrics") as response:
+                self.assertTrue(response.headers["Content-Type"].startswith("text/"))
+                self.assertIn(
+                    b"btcpriceticker_refresh_cache_hits_total 2", response.read()
+                )
+            with self.assertRaises(urllib.error.HTTPError) as ctx:
+                urllib.request.urlopen(f"{base}/missing")
+            self.assertEqual(ctx.exception.code, 404)
+            ctx.exception.close()
+        finally:
+            server.stop()
+            thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "requires Unix domain sockets")
+    def test_serves_over_unix_socket(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "price.sock")
+            server = PriceServer(make_price())
+            server.bind(unix_socket=path)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                connection = UnixHTTPConnection(path)
+                connection.request("GET", "/price")
+                response = connection.getresponse()
+                self.assertEqual(response.status, 200)
+                self.assertEqual(json.loads(response.read())["price"], 42000.0)
+                connection.close()
+            finally:
+                server.stop()
+                thread.join(timeout=5)
+            self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
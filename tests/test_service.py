@@ -1,4 +1,6 @@
+import math
 import unittest
+from collections import deque
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 from unittest.mock import patch
@@ -55,6 +57,33 @@ class MockService(Service):
         )
 
 
+class BackfillService(MockService):
+    """Serves hourly candles and prices for any requested range."""
+
+    backfill_page_size = 24
+
+    def __init__(self, fiat="usd"):
+        super().__init__(fiat)
+        self.ranges = []
+
+    def interval_to_seconds(self) -> int:
+        return 3600
+
+    def fetch_range(self, dataset, currency, start, end):
+        self.ranges.append((dataset, start, end))
+        index = pd.date_range(
+            pd.Timestamp(start, unit="s", tz="UTC"),
+            pd.Timestamp(end, unit="s", tz="UTC"),
+            freq="h",
+        )
+        if dataset == "history":
+            return pd.DataFrame({"timestamp": index, "price": 1.0})
+        return pd.DataFrame(
+            {"Open": 1.0, "High": 1.0, "Low": 1.0, "Close": 1.0, "Volume": 1.0},
+            index=index,
+        )
+
+
 class TestService(unittest.TestCase):
     def setUp(self):
         self.service = MockService("eur")
@@ -103,6 +132,14 @@ class TestService(unittest.TestCase):
             self.assertEqual(self.service.price["sat_usd"], 0)
             self.assertEqual(self.service.price["sat_fiat"], 0)
 
+    def test_update_without_price_raises(self):
+        """Test update keeps the old quote when no price is returned."""
+        self.service.update()
+        with patch.object(MockService, "get_current_price", return_value=None):
+            with self.assertRaises(RuntimeError):
+                self.service.update()
+        self.assertEqual(self.service.price["usd"], 50000)
+
     def test_append_current_price(self):
         """Test append_current_price method."""
         initial_count = len(self.service.price_history.get_price_list())
@@ -205,6 +242,175 @@ class TestService(unittest.TestCase):
             self.assertTrue((self.service.ohlcv.iloc[0] == first_df.iloc[0]).all())
             self.assertTrue((self.service.ohlcv.iloc[1] == second_df.iloc[0]).all())
 
+    def test_ohlc_uses_its_own_sync_cursor(self):
+        self.service.enable_ohlc = True
+        with patch.object(MockService, "get_ohlc", wraps=self.service.get_ohlc) as mock:
+            self.service.update()
+            self.service.update()
+
+        first_kwargs = mock.call_args_list[0].kwargs
+        second_kwargs = mock.call_args_list[1].kwargs
+        self.assertEqual(first_kwargs["existing_timestamp"], [])
+        self.assertEqual(
+            second_kwargs["existing_timestamp"],
+            [self.service.ohlc.index[0].timestamp()],
+        )
+        self.assertEqual(len(self.service.ohlc), 2)
+        self.assertEqual(
+            self.service.get_sync_cursor("ohlc"),
+            self.service.ohlc.index[-1].timestamp(),
+        )
+        self.assertEqual(self.service.get_sync_cursor("ohlcv"), 0.0)
+
+    def test_history_cursor_follows_price_history(self):
+        self.service.enable_timeseries = True
+        self.service.update()
+
+        last_timestamp = self.service.price_history.get_last_timestamp()
+        self.assertEqual(self.service.get_sync_cursor("history"), last_timestamp)
+        self.assertEqual(
+            self.service._get_cursor_timestamp_list("history"), [last_timestamp]
+        )
+
+    def test_sync_cursor_never_moves_backwards(self):
+        self.service.advance_sync_cursor("ohlcv", 2000.0)
+        self.service.advance_sync_cursor("ohlcv", 1000.0)
+        self.assertEqual(self.service.get_sync_cursor("ohlcv"), 2000.0)
+
+        self.service.reset_sync_cursors()
+        self.assertEqual(self.service.get_sync_cursor("ohlcv"), 0.0)
+        with self.assertRaises(ValueError):
+            self.service.get_sync_cursor("unknown")
+
+    def test_stores_keep_typed_columns(self):
+        self.assertEqual(str(self.service.ohlcv.index.dtype), "datetime64[ns, UTC]")
+        self.assertEqual(self.service.ohlcv["Close"].dtype, "float64")
+        self.service.update_ohlcv("eur")
+        self.service.update_ohlcv("eur")
+        self.service.update_price_history("eur")
+
+        self.assertEqual(str(self.service.ohlcv.index.dtype), "datetime64[ns, UTC]")
+        self.assertTrue((self.service.ohlcv.dtypes == "float64").all())
+        self.assertEqual(
+            str(self.service.price_history.data["timestamp"].dtype),
+            "datetime64[ns, UTC]",
+        )
+
+    @patch.object(MockService, "get_slot_seconds", return_value=3600)
+    def test_ohlcv_timeframes_follow_new_candles(self, mock_slot_seconds):
+        self.service.update_ohlcv("eur")
+        self.assertIs(self.service.get_ohlcv_timeframe("1h"), self.service.ohlcv)
+        week = self.service.get_ohlcv_timeframe("1w")
+        self.assertIs(self.service.get_ohlcv_timeframe("1w"), week)
+        self.assertEqual(week["Volume"].sum(), 12345)
+
+        self.service.update_ohlcv("eur")
+
+        week = self.service.get_ohlcv_timeframe("1w")
+        self.assertEqual(week["Volume"].sum(), 2 * 12345)
+        self.assertEqual(week["Close"].dtype, "float64")
+        with self.assertRaises(ValueError):
+            self.service.get_ohlcv_timeframe("90m")
+
+    def test_ohlcv_indicators(self):
+        self.assertTrue(math.isnan(self.service.get_ohlcv_indicators()["atr_14"]))
+        self.service.update_ohlcv("eur")
+        indicators = self.service.get_ohlcv_indicators()
+        self.assertEqual(self.service.ohlcv_indicators.rows, len(self.service.ohlcv))
+        self.assertIn("atr_14", indicators)
+        self.assertTrue(math.isnan(indicators["sma_20"]))
+
+    def test_stream_ticks_do_not_touch_history(self):
+        self.service._update_history("eur")
+        cursor = self.service.get_sync_cursor("history")
+        rows = len(self.service.price_history.data)
+        self.service.ticks = deque(maxlen=3)
+
+        for price in (1.0, 2.0, 3.0, 4.0):
+            self.service.on_stream_price(price)
+        with patch.object(MockService, "update_price_history"):
+            self.service._update_history("eur")
+
+        self.assertEqual([price for _, price in self.service.get_ticks()], [2, 3, 4])
+        self.assertEqual(self.service.get_price()["fiat"], 4.0)
+        self.assertEqual(self.service.get_sync_cursor("history"), cursor)
+        self.assertEqual(len(self.service.price_history.data), rows)
+
+    def test_float32_stores(self):
+        self.service.update_ohlcv("eur")
+        before = self.service.memory_usage()
+        self.service.set_price_dtype("float32")
+        self.service.update_ohlcv("eur")
+        self.service.update_price_history("eur")
+
+        self.assertTrue((self.service.ohlcv.dtypes == "float32").all())
+        self.assertEqual(self.service.price_history.data["price"].dtype, "float32")
+        self.assertEqual(len(self.service.ohlcv), 2)
+        self.assertLess(self.service.memory_usage()["ohlcv"], 2 * before["ohlcv"])
+
+
+class TestBackfill(unittest.TestCase):
+    def setUp(self):
+        self.service = BackfillService("usd")
+        now = pd.Timestamp.now(tz="UTC").floor("h")
+        self.hours = pd.date_range(now - pd.Timedelta(hours=20), now, freq="h")
+        self.missing = self.hours[[3, 4, 10]]
+
+    def test_fills_only_missing_candles(self):
+        candles = pd.DataFrame(
+            {"Open": 2.0, "High": 2.0, "Low": 2.0, "Close": 2.0, "Volume": 2.0},
+            index=self.hours.drop(self.missing),
+        )
+        self.service._merge_candles("ohlcv", candles)
+        self.assertEqual(len(self.service.find_gaps("ohlcv")), 2)
+
+        self.assertEqual(self.service.fill_gaps("ohlcv"), 3)
+
+        # Both gaps fit one page and share a single request
+        self.assertEqual(len(self.service.ranges), 1)
+        self.assertEqual(len(self.service.ohlcv), len(self.hours))
+        self.assertEqual(self.service.ohlcv["Close"].sum(), 2.0 * 18 + 3)
+        self.assertEqual(len(self.service.find_gaps("ohlcv")), 0)
+        self.assertEqual(self.service.fill_gaps("ohlcv"), 0)
+        self.assertEqual(len(self.service.ranges), 1)
+
+    def test_fills_history_gaps_on_update(self):
+        history = pd.DataFrame(
+            {"timestamp": self.hours.drop(self.missing), "price": 2.0}
+        )
+        self.service.price_history.append_dataframe(history)
+        self.service.enable_timeseries = True
+
+        self.service.update()
+
+        data = self.service.price_history.data
+        self.assertEqual(self.service.ranges[0][0], "history")
+        self.assertEqual((data["price"] == 1.0).sum(), 3)
+        self.assertTrue(data["timestamp"].is_monotonic_increasing)
+
+    def test_gaps_without_data_are_not_requested_again(self):
+        candles = pd.DataFrame(
+            {"Open": 2.0, "High": 2.0, "Low": 2.0, "Close": 2.0},
+            index=self.hours.drop(self.missing),
+        )
+        self.service._merge_candles("ohlc", candles)
+        with patch.object(
+            BackfillService, "fetch_range", return_value=candles.iloc[:0]
+        ) as fetch_range:
+            self.assertEqual(self.service.fill_gaps("ohlc"), 0)
+            self.assertEqual(self.service.fill_gaps("ohlc"), 0)
+        self.assertEqual(fetch_range.call_count, 1)
+
+    def test_failed_requests_are_retried(self):
+        self.service.price_history.append_dataframe(
+            pd.DataFrame({"timestamp": self.hours.drop(self.missing), "price": 2.0})
+        )
+        with patch.object(
+            BackfillService, "fetch_range", side_effect=ConnectionError("down")
+        ):
+            self.assertEqual(self.service.fill_gaps("history"), 0)
+        self.assertEqual(self.service.fill_gaps("history"), 3)
+
 
 if __name__ == "__main__":
     unittest.main()
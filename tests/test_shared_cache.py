@@ -0,0 +1,177 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from btcpriceticker.kraken import Kraken
+from btcpriceticker.mempool import Mempool
+from btcpriceticker.price import Price
+from btcpriceticker.shared_cache import SharedQuoteCache
+
+
+def make_quote(timestamp):
+    return {
+        "usd": 50000.0,
+        "sat_usd": 2000.0,
+        "fiat": 40000.0,
+        "sat_fiat": 2500.0,
+        "timestamp": timestamp,
+    }
+
+
+class TestSharedQuoteCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "cache.sqlite")
+        self.cache = SharedQuoteCache(self.path, lease_time=5)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def test_put_and_get(self):
+        self.assertIsNone(self.cache.get("mempool", "eur"))
+        quote = make_quote(time.time())
+        self.cache.put("mempool", "EUR", quote)
+
+        self.assertEqual(self.cache.get("mempool", "eur"), quote)
+        self.assertEqual(self.cache.get_fresh("mempool", "eur", 120), quote)
+        self.assertIsNone(self.cache.get_fresh("kraken", "eur", 120))
+
+    def test_stale_entry_is_not_fresh(self):
+        self.cache.put("mempool", "eur", make_quote(time.time() - 300))
+
+        self.assertIsNone(self.cache.get_fresh("mempool", "eur", 120))
+
+    def test_entries_are_keyed_by_asset(self):
+        btc, eth = make_quote(time.time()), make_quote(time.time())
+        eth["fiat"] = 3000.0
+        self.cache.put("kraken", "eur", btc)
+
+        self.assertIsNone(self.cache.get("kraken", "eur", asset="ETH"))
+        self.cache.put("kraken", "eur", eth, asset="eth")
+        self.assertEqual(self.cache.get("kraken", "eur"), btc)
+        self.assertEqual(self.cache.get("kraken", "eur", asset="ETH"), eth)
+
+    def test_old_cache_file_is_rebuilt(self):
+        path = os.path.join(self.tmpdir.name, "old.sqlite")
+        connection = sqlite3.connect(path)
+        connection.execute(
+            "CREATE TABLE quotes (service TEXT, fiat TEXT, usd REAL, sat_usd REAL, "
+            "fiat_price REAL, sat_fiat REAL, timestamp REAL, "
+            "PRIMARY KEY (service, fiat))"
+        )
+        connection.commit()
+        connection.close()
+
+        cache = SharedQuoteCache(path)
+        try:
+            quote = make_quote(time.time())
+            cache.put("mempool", "eur", quote)
+            self.assertEqual(cache.get("mempool", "eur"), quote)
+        finally:
+            cache.close()
+
+    def test_only_one_process_holds_the_refresh_lease(self):
+        other = SharedQuoteCache(self.path, lease_time=5)
+        try:
+            self.assertTrue(self.cache.acquire_refresh("mempool", "eur"))
+            self.assertFalse(other.acquire_refresh("mempool", "eur"))
+            self.cache.release_refresh("mempool", "eur")
+            self.assertTrue(other.acquire_refresh("mempool", "eur"))
+        finally:
+            other.close()
+
+    def test_wait_for_fresh_returns_published_quote(self):
+        other = SharedQuoteCache(self.path, lease_time=5)
+        try:
+            other.acquire_refresh("mempool", "eur")
+            quote = make_quote(time.time())
+
+            def publish(_):
+                other.put("mempool", "eur", quote)
+
+            with patch("btcpriceticker.shared_cache.time.sleep", side_effect=publish):
+                entry = self.cache.wait_for_fresh("mempool", "eur", 120)
+            self.assertEqual(entry, quote)
+        finally:
+            other.close()
+
+    @patch.object(Mempool, "get_current_price")
+    def test_price_instances_share_one_fetch(self, mock_get_current_price):
+        mock_get_current_price.side_effect = lambda currency: {
+            "USD": 50000,
+            "EUR": 40000,
+        }[currency]
+        second_cache = SharedQuoteCache(self.path)
+        try:
+            first = Price(fiat="eur", enable_timeseries=False, shared_cache=self.cache)
+            second = Price(
+                fiat="eur", enable_timeseries=False, shared_cache=second_cache
+            )
+
+            self.assertTrue(first.refresh())
+            calls = mock_get_current_price.call_count
+            self.assertTrue(second.refresh())
+
+            self.assertEqual(mock_get_current_price.call_count, calls)
+            self.assertEqual(second.get_fiat_price(), 40000)
+            self.assertEqual(second.get_timestamp(), first.get_timestamp())
+            self.assertEqual(second.get_price_list(), [40000])
+        finally:
+            second_cache.close()
+
+    @patch.object(Mempool, "derive_prices", side_effect=lambda prices: prices)
+    @patch.object(Mempool, "get_current_price")
+    def test_failed_quote_is_not_published(self, mock_get_current_price, _derive):
+        mock_get_current_price.side_effect = lambda currency: {
+            "USD": 50000,
+            "EUR": None,
+        }[currency]
+        price_instance = Price(
+            fiat="eur", enable_timeseries=False, shared_cache=self.cache
+        )
+
+        price_instance.refresh()
+
+        self.assertEqual(price_instance.get_fiat_price(), 0.0)
+        self.assertIsNone(self.cache.get("mempool", "eur"))
+
+    @patch.object(Kraken, "has_native_fiat", return_value=True)
+    @patch.object(Kraken, "get_current_price", autospec=True)
+    def test_assets_do_not_share_quotes(self, mock_get_current_price, _native):
+        mock_get_current_price.side_effect = lambda service, currency: {
+            "BTC": 50000.0,
+            "ETH": 3000.0,
+        }[service.base_asset]
+        btc = Price(
+            service="kraken",
+            fiat="eur",
+            enable_timeseries=False,
+            shared_cache=self.cache,
+        )
+        eth = Price(
+            service="kraken",
+            fiat="eur",
+            base_asset="ETH",
+            enable_timeseries=False,
+            shared_cache=self.cache,
+        )
+
+        self.assertTrue(btc.refresh())
+        self.assertTrue(eth.refresh())
+
+        self.assertEqual(btc.get_fiat_price(), 50000.0)
+        self.assertEqual(eth.get_fiat_price(), 3000.0)
+        self.assertEqual(self.cache.get("kraken", "eur", asset="ETH")["fiat"], 3000.0)
+
+    def test_shared_cache_is_ignored_when_history_is_enabled(self):
+        price_instance = Price(fiat="eur", shared_cache=self.cache)
+
+        self.assertIsNone(price_instance._active_shared_cache())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from btcpriceticker.binance import Binance
+from btcpriceticker.bitvavo import Bitvavo
+from btcpriceticker.coinbase import Coinbase
+from btcpriceticker.kraken import Kraken
+from btcpriceticker.mempool import Mempool
+from btcpriceticker.stream import (
+    WEBSOCKETS_MODULE,
+    BinanceTickerStream,
+    BitvavoTickerStream,
+    CoinbaseTickerStream,
+    KrakenTickerStream,
+    TickerStream,
+)
+
+if WEBSOCKETS_MODULE:
+    import websockets
+
+
+class LocalTickerServer:
+    """Local WebSocket stand-in that answers a subscription with ticker updates."""
+
+    def __init__(self, prices, close_after_send=False):
+        self.prices = prices
+        self.close_after_send = close_after_send
+        self.connections = 0
+        self.subscriptions = []
+        self.port = None
+        self._loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._main, daemon=True)
+
+    async def _handler(self, ws):
+        self.connections += 1
+        self.subscriptions.append(json.loads(await ws.recv()))
+        price = self.prices[min(self.connections, len(self.prices)) - 1]
+        await ws.send(json.dumps({"channel": "heartbeat"}))
+        await ws.send(
+            json.dumps(
+                {
+                    "channel": "ticker",
+                    "type": "update",
+                    "data": [{"symbol": "BTC/EUR", "last": price}],
+                }
+            )
+        )
+        if not self.close_after_send:
+            await ws.wait_closed()
+
+    async def _serve(self):
+        self._server = await websockets.serve(self._handler, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started.set()
+        await self._server.wait_closed()
+
+    def _main(self):
+        self._loop.run_until_complete(self._serve())
+
+    def __enter__(self):
+        self._thread.start()
+        self._started.wait(5)
+        return self
+
+    def __exit__(self, *args):
+        self._loop.call_soon_threadsafe(self._server.close)
+        self._thread.join(5)
+
+    @property
+    def url(self):
+        return f"ws://127.0.0.1:{self.port}"
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@unittest.skipUnless(WEBSOCKETS_MODULE, "requires websockets")
+class TestTickerStream(unittest.TestCase):
+    @patch("btcpriceticker.kraken.ccxt.kraken")
+    def test_stream_updates_service_price_and_history(self, mock_kraken):
+        service = Kraken("EUR", enable_timeseries=False)
+
+        with LocalTickerServer([51000.5]) as server:
+            stream = service.start_stream(url=server.url)
+            try:
+                self.assertTrue(wait_for(lambda: service.price["fiat"] == 51000.5))
+            finally:
+                service.stop_stream()
+
+        self.assertEqual(
+            server.subscriptions[0],
+            {
+                "method": "subscribe",
+                "params": {"channel": "ticker", "symbol": ["BTC/EUR"]},
+            },
+        )
+        self.assertEqual(stream.messages, 1)
+        self.assertAlmostEqual(service.price["sat_fiat"], 1e8 / 51000.5)
+        self.assertEqual(service.price["usd"], 0.0)
+        self.assertGreater(service.stream_timestamp, 0)
+        self.assertEqual([price for _, price in service.get_ticks()], [51000.5])
+        self.assertTrue(service.price_history.data.empty)
+        self.assertIsNone(service.stream)
+
+    @patch("btcpriceticker.kraken.ccxt.kraken")
+    def test_stream_reconnects_after_disconnect(self, mock_kraken):
+        service = Kraken("EUR", enable_timeseries=False)
+
+        with LocalTickerServer([50000.0, 50100.0], close_after_send=True) as server:
+            stream = service.start_stream(
+                url=server.url, min_backoff=0.01, max_backoff=0.05
+            )
+            try:
+                self.assertTrue(wait_for(lambda: service.price["fiat"] == 50100.0))
+            finally:
+                service.stop_stream()
+
+        self.assertGreaterEqual(server.connections, 2)
+        self.assertGreaterEqual(stream.reconnects, 1)
+
+    def test_unsupported_service_raises(self):
+        with self.assertRaises(ValueError):
+            Mempool("EUR").start_stream()
+
+
+@unittest.skipUnless(WEBSOCKETS_MODULE, "requires websockets")
+class TestTickerMessages(unittest.TestCase):
+    @patch("btcpriceticker.binance.ccxt.binance")
+    def test_binance_messages(self, mock_binance):
+        stream = BinanceTickerStream(Binance("EUR"))
+
+        self.assertEqual(stream.subscribe_messages()[0]["params"], ["btceur@ticker"])
+        self.assertEqual(
+            stream.parse_price({"e": "24hrTicker", "s": "BTCEUR", "c": "50000.1"}),
+            50000.1,
+        )
+        self.assertIsNone(stream.parse_price({"e": "24hrTicker", "s": "ETHEUR"}))
+        self.assertIsNone(stream.parse_price({"result": None, "id": 1}))
+
+    @patch("btcpriceticker.coinbase.ccxt.coinbase")
+    def test_coinbase_messages(self, mock_coinbase):
+        stream = CoinbaseTickerStream(Coinbase("USD"))
+
+        self.assertEqual(stream.subscribe_messages()[0]["product_ids"], ["BTC-USD"])
+        self.assertEqual(
+            stream.parse_price(
+                {"type": "ticker", "product_id": "BTC-USD", "price": "50000"}
+            ),
+            50000.0,
+        )
+        self.assertIsNone(stream.parse_price({"type": "subscriptions"}))
+
+    @patch("btcpriceticker.bitvavo.ccxt.bitvavo")
+    def test_bitvavo_messages(self, mock_bitvavo):
+        stream = BitvavoTickerStream(Bitvavo("EUR"))
+
+        self.assertEqual(
+            stream.subscribe_messages()[0]["channels"][0]["markets"], ["BTC-EUR"]
+        )
+        self.assertEqual(
+            stream.parse_price(
+                {"event": "ticker", "market": "BTC-EUR", "lastPrice": "49000"}
+            ),
+            49000.0,
+        )
+        self.assertIsNone(stream.parse_price({"event": "ticker", "market": "BTC-EUR"}))
+
+    @patch("btcpriceticker.kraken.ccxt.kraken")
+    def test_base_stream_is_abstract(self, mock_kraken):
+        with self.assertRaises(TypeError):
+            TickerStream(Kraken("EUR"))
+
+    @patch("btcpriceticker.kraken.ccxt.kraken")
+    def test_handle_message_ignores_garbage(self, mock_kraken):
+        service = Kraken("EUR")
+        stream = KrakenTickerStream(service)
+
+        self.assertIsNone(stream.handle_message("not json"))
+        self.assertIsNone(stream.handle_message(json.dumps({"channel": "status"})))
+        self.assertEqual(service.price["fiat"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import requests
+import responses
+
+from btcpriceticker import tracing
+from btcpriceticker.price import Price
+from btcpriceticker.ratelimit import RateLimitedAdapter, reset_buckets
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+except ImportError:  # pragma: no cover
+    TracerProvider = None
+
+
+class SlowBodyHandler(BaseHTTPRequestHandler):
+    """Send the headers at once and the body in slow chunks."""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "3")
+        self.end_headers()
+        for chunk in (b"1", b"2", b"3"):
+            time.sleep(0.1)
+            self.wfile.write(chunk)
+            self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+class TracingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.spans = []
+        tracing.add_hook(self.spans.append)
+        self.addCleanup(tracing.remove_hook, self.spans.append)
+
+    def get_span(self, name):
+        return next(span for span in self.spans if span.name == name)
+
+
+class TestSpans(TracingTestCase):
+    def test_disabled_tracing_returns_noop_span(self):
+        tracing.remove_hook(self.spans.append)
+        self.assertFalse(tracing.enabled())
+        with tracing.span("stage", service="kraken") as span:
+            span.set_attribute("rows", 3)
+        self.assertIs(span, tracing.NOOP_SPAN)
+        self.assertIs(tracing.current_span(), tracing.NOOP_SPAN)
+
+    def test_nested_spans_inherit_service(self):
+        with tracing.span("outer", service="kraken", fiat="EUR"):
+            with self.assertRaises(ValueError):
+                with tracing.span("inner", fiat="USD"):
+                    raise ValueError("boom")
+
+        inner, outer = self.spans
+        self.assertIs(inner.parent, outer)
+        self.assertEqual(inner.attributes["service"], "kraken")
+        self.assertEqual(inner.attributes["fiat"], "USD")
+        self.assertIn("boom", inner.attributes["error"])
+        self.assertGreaterEqual(outer.duration, inner.duration)
+
+    @responses.activate
+    def test_request_span_counts_retries(self):
+        reset_buckets()
+        url = "https://example.com/ticker"
+        responses.get(url, status=429, headers={"Retry-After": "0"})
+        responses.get(url, json={})
+        session = requests.Session()
+        session.mount("https://", RateLimitedAdapter())
+
+        with tracing.span("service.quotes", service="bit2me"):
+            session.get(url)
+
+        request = self.get_span("http.request")
+        self.assertEqual(request.attributes["retries"], 1)
+        self.assertEqual(request.attributes["status"], 200)
+        self.assertEqual(request.attributes["service"], "bit2me")
+
+    def test_request_span_includes_the_body(self):
+        reset_buckets()
+        server = ThreadingHTTPServer(("127.0.0.1", 0), SlowBodyHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        session = requests.Session()
+        session.mount("http://", RateLimitedAdapter())
+
+        started = time.perf_counter()
+        response = session.get(f"http://127.0.0.1:{server.server_port}/slow")
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(response.content, b"123")
+        request = self.get_span("http.request")
+        self.assertGreaterEqual(request.duration, 0.25)
+        self.assertGreaterEqual(request.duration, elapsed - 0.05)
+
+
+class TestRefreshTrace(TracingTestCase):
+    @patch("btcpriceticker.kraken.ccxt.kraken")
+    def test_refresh_phases_are_traced(self, mock_kraken):
+        exchange = MagicMock()
+        exchange.load_markets.return_value = {"BTC/USD": {}, "BTC/EUR": {}}
+        exchange.fetch_ticker.return_value = {"last": 50000}
+        exchange.fetch_ohlcv.return_value = [[1700000000000, 1, 2, 0.5, 1.5, 7]] * 3
+        mock_kraken.return_value = exchange
+
+        price = Price(service="kraken", fiat="eur", enable_ohlcv=True)
+        self.assertTrue(price.refresh())
+
+        names = [span.name for span in self.spans]
+        self.assertEqual(
+            names,
+            [
+                "service.quotes",
+                "service.history",
+                "service.ohlcv",
+                "service.update",
+                "price.update_service",
+                "price.refresh",
+            ],
+        )
+        self.assertEqual(self.get_span("service.ohlcv").attributes["rows"], 3)
+        self.assertEqual(
+            self.get_span("service.quotes").attributes["service"], "kraken"
+        )
+        update = self.get_span("price.update_service")
+        self.assertEqual(update.attributes["outcome"], "fetched")
+        self.assertIs(self.get_span("service.update").parent, update)
+
+        self.assertTrue(price.refresh())
+        self.assertEqual(self.spans[-2].attributes["outcome"], "cache")
+
+
+@unittest.skipIf(TracerProvider is None, "requires opentelemetry-sdk")
+class TestOpenTelemetry(unittest.TestCase):
+    def test_spans_are_exported(self):
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        tracing.enable_opentelemetry(provider.get_tracer("test"))
+        self.addCleanup(tracing.disable_opentelemetry)
+
+        with tracing.span("outer", service="mempool"):
+            with tracing.span("inner") as span:
+                span.set_attribute("rows", 5)
+
+        inner, outer = exporter.get_finished_spans()
+        self.assertEqual(inner.parent.span_id, outer.context.span_id)
+        self.assertEqual(dict(inner.attributes), {"service": "mempool", "rows": 5})
+
+
+if __name__ == "__main__":
+    unittest.main()